@@ -4,22 +4,27 @@ Simplified dependency injection for FastAPI endpoints.
 from typing import Optional
 from fastapi import Depends, HTTPException, status, Request
 from jose import JWTError
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from database import get_db
+from database import get_async_db
 from core.security import decode_token
-from core.permissions import has_permission, Permission
+from core.request_context import current_request_context
+from core.principal_cache import get_cached_principal, cache_principal
+from services.token_revocation import is_token_revoked
+from core.permissions import mask_has_permission, user_permission_mask
 from models.user import User, UserRole
-from schemas.auth import TokenData
 
 
-def get_current_user(
+async def get_current_user(
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> User:
     """
     Get current authenticated user from JWT token.
     Simplified version that extracts token from Authorization header.
+    Runs on the async session so auth never occupies a threadpool worker,
+    and serves recently seen users from the principal cache.
     """
     # Get Authorization header
     auth_header = request.headers.get("Authorization")
@@ -44,36 +49,40 @@ def get_current_user(
             detail="Invalid authorization header format"
         )
     
-    # Decode token
+    # Decode token (verified payloads are cached until exp)
     try:
         payload = decode_token(token)
-        user_id: int = payload.get("sub")
-        if user_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials"
-            )
-            
-        token_data = TokenData(
-            user_id=user_id,
-            username=payload.get("username"),
-            tenant_id=payload.get("tenant_id"),
-            role=payload.get("role")
-        )
     except JWTError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials"
         )
     
-    # Get user from database
-    user = db.query(User).filter(User.id == token_data.user_id).first()
-    if user is None:
+    if is_token_revoked(payload.get("jti")):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked"
+        )
+    
+    user_id = payload.get("sub")
+    if not isinstance(user_id, int):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
+            detail="Could not validate credentials"
         )
     
+    # Get user from the principal cache, falling back to the database
+    user = get_cached_principal(user_id)
+    if user is None:
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found"
+            )
+        cache_principal(user)
+    
     # Check if user is active
     if user.status != "active":
         raise HTTPException(
@@ -81,6 +90,11 @@ def get_current_user(
             detail=f"User account is not active (status: {user.status})"
         )
     
+    # Tag the request (profiles, logs) with its principal
+    context = current_request_context()
+    if context is not None:
+        context.set_principal(user)
+    
     return user
 
 
@@ -99,17 +113,15 @@ def get_current_active_user(
 def require_permission(permission: str):
     """
     Dependency factory for permission checking.
+    Checks a single bit of the principal's compiled permission mask.
     """
     def permission_checker(current_user: User = Depends(get_current_user)):
-        user_permissions = {
-            "can_edit_data": current_user.can_edit_data,
-            "can_edit_alerts": current_user.can_edit_alerts,
-            "can_initiate_transfers": current_user.can_initiate_transfers,
-            "can_approve_transfers": current_user.can_approve_transfers,
-            "can_export_data": current_user.can_export_data,
-        }
+        # get_current_user compiles the mask once per principal
+        mask = getattr(current_user, "permission_mask", None)
+        if mask is None:
+            mask = user_permission_mask(current_user)
         
-        if not has_permission(current_user.role, permission, user_permissions):
+        if not mask_has_permission(mask, permission):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Permission denied: {permission}"
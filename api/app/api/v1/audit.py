@@ -0,0 +1,62 @@
+"""
+Audit trail search endpoints.
+"""
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from database import get_read_db
+from models.audit import AuditLog
+from models.user import User, UserRole
+from schemas.audit import AuditLogPage
+from api.deps import require_role
+from core.pagination import paginate, split_page
+
+router = APIRouter()
+
+
+@router.get("/", response_model=AuditLogPage)
+def search_audit_logs(
+    tenant_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+    action: Optional[str] = None,
+    resource_type: Optional[str] = None,
+    resource_id: Optional[int] = None,
+    start: Optional[datetime] = Query(None, description="Include entries at or after this time"),
+    end: Optional[datetime] = Query(None, description="Include entries before this time"),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(require_role([UserRole.SYSTEM_ADMIN, UserRole.ORG_ADMIN]))
+):
+    """
+    Search the audit trail, newest first, with keyset pagination.
+    Org admins only see their own tenant; system admins may filter by any tenant.
+    """
+    if current_user.role != UserRole.SYSTEM_ADMIN:
+        tenant_id = current_user.tenant_id
+    
+    query = db.query(AuditLog)
+    if tenant_id is not None:
+        query = query.filter(AuditLog.tenant_id == tenant_id)
+    if user_id is not None:
+        query = query.filter(AuditLog.user_id == user_id)
+    if action:
+        query = query.filter(AuditLog.action == action)
+    if resource_type:
+        query = query.filter(AuditLog.resource_type == resource_type)
+    if resource_id is not None:
+        query = query.filter(AuditLog.resource_id == resource_id)
+    if start:
+        query = query.filter(AuditLog.created_at >= start)
+    if end:
+        query = query.filter(AuditLog.created_at < end)
+    
+    page_query = paginate(
+        query, (AuditLog.created_at, AuditLog.id), (datetime.fromisoformat, int), cursor,
+        limit=limit, descending=True
+    )
+    rows, next_cursor = split_page(page_query.all(), limit, lambda row: (row.created_at, row.id))
+    
+    return AuditLogPage(items=rows, next_cursor=next_cursor)
@@ -2,36 +2,49 @@
 Authentication endpoints.
 """
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from jose import JWTError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from database import get_db
+from database import get_db, get_async_db
 from models.user import User
-from schemas.auth import Token, LoginRequest, RefreshTokenRequest
+from schemas.auth import Token, LoginRequest, RefreshTokenRequest, LogoutRequest
 from core.security import (
-    verify_password,
+    verify_password_async,
+    hash_password_async,
+    password_needs_rehash,
     create_access_token,
     create_refresh_token,
     decode_token
 )
+from core.permissions import user_permission_mask
 from services.audit import log_action
+from services.token_revocation import is_token_revoked, revoke_token
 
 router = APIRouter()
 
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     login_data: LoginRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     User login endpoint.
     Returns access and refresh JWT tokens.
+    bcrypt runs on the dedicated password pool; returns 503 when it is saturated.
     """
     # Find user
-    user = db.query(User).filter(User.username == login_data.username).first()
+    result = await db.execute(select(User).where(User.username == login_data.username))
+    user = result.scalar_one_or_none()
+    
+    # End the read transaction so no pooled connection is held during bcrypt
+    await db.commit()
     
-    if not user or not verify_password(login_data.password, user.hashed_password):
+    if not user or not await verify_password_async(login_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -44,24 +57,29 @@ def login(
             detail="User account is not active"
         )
     
+    # Upgrade the stored hash if BCRYPT_ROUNDS has changed since it was made
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await hash_password_async(login_data.password)
+    
     # Update last login
     user.last_login = datetime.utcnow()
-    db.commit()
+    await db.commit()
     
     # Create tokens
     token_data = {
         "sub": user.id,
         "username": user.username,
         "tenant_id": user.tenant_id,
-        "role": user.role.value
+        "role": user.role.value,
+        "perm": user_permission_mask(user)
     }
     
     access_token = create_access_token(token_data)
     refresh_token = create_refresh_token(token_data)
     
     # Log action
-    log_action(
-        db=db,
+    await db.run_sync(
+        log_action,
         user_id=user.id,
         tenant_id=user.tenant_id,
         action="auth.login",
@@ -94,6 +112,12 @@ def refresh_token(
                 detail="Invalid token type"
             )
         
+        if is_token_revoked(payload.get("jti")):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked"
+            )
+        
         user_id = payload.get("sub")
         user = db.query(User).filter(User.id == user_id).first()
         
@@ -108,7 +132,8 @@ def refresh_token(
             "sub": user.id,
             "username": user.username,
             "tenant_id": user.tenant_id,
-            "role": user.role.value
+            "role": user.role.value,
+            "perm": user_permission_mask(user)
         }
         
         access_token = create_access_token(token_data)
@@ -128,10 +153,29 @@ def refresh_token(
 
 
 @router.post("/logout")
-def logout(db: Session = Depends(get_db)):
+async def logout(
+    request: Request,
+    logout_data: Optional[LogoutRequest] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
     """
-    Logout endpoint (client should discard tokens).
+    Logout endpoint.
+    Revokes the bearer access token and, if supplied, the refresh token.
+    Invalid or expired tokens are ignored; the client should still discard them.
     """
-    # In a production system, you might want to blacklist the token
-    # For now, client-side token removal is sufficient
+    tokens = []
+    scheme, _, access_token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and access_token:
+        tokens.append(access_token)
+    if logout_data and logout_data.refresh_token:
+        tokens.append(logout_data.refresh_token)
+    
+    for token in tokens:
+        try:
+            payload = decode_token(token)
+        except JWTError:
+            continue
+        await revoke_token(db, payload, reason="logout")
+    await db.commit()
+    
     return {"message": "Successfully logged out"}
@@ -2,7 +2,7 @@
 Behavioral Health API endpoints - Facility & Bed Management.
 Handles facility management, bed availability tracking, and bed search.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, func
 from typing import List, Optional
@@ -21,6 +21,7 @@ from schemas.behavioral_health import (
 )
 from api.deps import get_current_user
 from services.audit import log_action
+from core.pagination import COUNT_MODES, count_rows, paginate, split_page
 
 router = APIRouter()
 
@@ -108,8 +109,11 @@ def update_facility(
 
 @router.get("/", response_model=List[BHFacilityResponse])
 def list_facilities(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    count: str = Query("none", pattern=COUNT_MODES),
     facility_type: Optional[str] = None,
     is_active: Optional[bool] = True,
     db: Session = Depends(get_db),
@@ -126,7 +130,15 @@ def list_facilities(
     if is_active is not None:
         query = query.filter(BHFacility.is_active == is_active)
     
-    facilities = query.offset(skip).limit(limit).all()
+    facilities, next_cursor = split_page(
+        paginate(query, (BHFacility.id,), (int,), cursor, skip, limit).all(),
+        limit, lambda f: (f.id,)
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    total = count_rows(db, query, count)
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
     return facilities
 
 
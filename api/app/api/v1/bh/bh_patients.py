@@ -2,7 +2,7 @@
 Behavioral Health API endpoints - Patient Management.
 Handles patient intake, screening, and consent workflows.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status, Request
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
@@ -19,6 +19,7 @@ from schemas.behavioral_health import (
 )
 from api.deps import get_current_user
 from services.audit import log_action
+from core.pagination import COUNT_MODES, count_rows, paginate, split_page
 
 router = APIRouter()
 
@@ -55,7 +56,8 @@ def create_patient(
         resource_type="bh_patient",
         resource_id=patient.id,
         description=f"Created BH patient: {patient.first_name} {patient.last_name}",
-        new_values=patient_data.dict()
+        new_values=patient_data.dict(),
+        synchronous=True
     )
     
     return patient
@@ -127,7 +129,8 @@ def update_patient(
         resource_id=patient.id,
         description=f"Updated BH patient: {patient.first_name} {patient.last_name}",
         old_values=old_values,
-        new_values=patient_data.dict(exclude_unset=True)
+        new_values=patient_data.dict(exclude_unset=True),
+        synchronous=True
     )
     
     return patient
@@ -135,8 +138,11 @@ def update_patient(
 
 @router.get("/", response_model=List[BHPatientResponse])
 def list_patients(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    count: str = Query("none", pattern=COUNT_MODES),
     risk_level: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -149,7 +155,15 @@ def list_patients(
     if risk_level:
         query = query.filter(BHPatient.risk_level == risk_level)
     
-    patients = query.offset(skip).limit(limit).all()
+    patients, next_cursor = split_page(
+        paginate(query, (BHPatient.id,), (int,), cursor, skip, limit).all(),
+        limit, lambda p: (p.id,)
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    total = count_rows(db, query, count)
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
     return patients
 
 
@@ -202,7 +216,8 @@ def create_screening(
         resource_type="bh_screening",
         resource_id=screening.id,
         description=f"Screening {screening.instrument_type} for patient {patient.id}",
-        new_values=screening_data.dict()
+        new_values=screening_data.dict(),
+        synchronous=True
     )
     
     return screening
@@ -285,7 +300,8 @@ def capture_consent(
             "consent_text": consent_data.consent_text[:200]  # Truncate for audit
         },
         ip_address=consent_data.ip_address,
-        user_agent=consent_data.user_agent
+        user_agent=consent_data.user_agent,
+        synchronous=True
     )
     
     return ConsentResponse(
@@ -2,7 +2,8 @@
 Behavioral Health API endpoints - Referrals & Placements.
 Handles the complete referral workflow from submission to discharge.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status, BackgroundTasks
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime, timedelta
@@ -20,6 +21,7 @@ from schemas.behavioral_health import (
 )
 from api.deps import get_current_user
 from services.audit import log_action
+from core.pagination import COUNT_MODES, count_rows, paginate, split_page
 
 router = APIRouter()
 
@@ -68,7 +70,8 @@ def create_referral(
         resource_type="bh_referral",
         resource_id=referral.id,
         description=f"Created referral for patient {patient.id}",
-        new_values=referral_data.dict()
+        new_values=referral_data.dict(),
+        synchronous=True
     )
     
     return referral
@@ -195,7 +198,8 @@ def submit_referral(
         resource_type="bh_referral",
         resource_id=referral.id,
         description=f"Submitted referral to {len(facility_ids)} facilities",
-        new_values={"facility_ids": facility_ids}
+        new_values={"facility_ids": facility_ids},
+        synchronous=True
     )
     
     return referral
@@ -203,19 +207,21 @@ def submit_referral(
 
 @router.get("/", response_model=List[BHReferralResponse])
 def list_referrals(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
+    count: str = Query("none", pattern=COUNT_MODES),
     status: Optional[str] = None,
     priority: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """List referrals with optional filtering."""
-    # Get all patients for tenant
-    patient_ids = db.query(BHPatient.id).filter(
+    """List referrals with optional filtering, newest first."""
+    # Patients for tenant, as a subquery so the count and every page reuse it
+    patient_ids = select(BHPatient.id).where(
         BHPatient.tenant_id == current_user.tenant_id
-    ).all()
-    patient_ids = [p[0] for p in patient_ids]
+    )
     
     query = db.query(BHReferral).filter(
         BHReferral.patient_id.in_(patient_ids)
@@ -227,9 +233,18 @@ def list_referrals(
     if priority:
         query = query.filter(BHReferral.priority == priority)
     
-    referrals = query.order_by(
-        BHReferral.referral_date.desc()
-    ).offset(skip).limit(limit).all()
+    referrals, next_cursor = split_page(
+        paginate(
+            query, (BHReferral.referral_date, BHReferral.id), (datetime.fromisoformat, int),
+            cursor, skip, limit, descending=True
+        ).all(),
+        limit, lambda r: (r.referral_date, r.id)
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    total = count_rows(db, query, count)
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
     
     return referrals
 
@@ -294,7 +309,8 @@ def accept_referral(
         resource_type="bh_placement",
         resource_id=placement.id,
         description=f"Accepted referral {referral.id}",
-        new_values=accept_data.dict()
+        new_values=accept_data.dict(),
+        synchronous=True
     )
     
     return placement
@@ -345,7 +361,8 @@ def decline_referral(
         resource_type="bh_referral",
         resource_id=referral.id,
         description=f"Declined referral {referral.id}: {decline_data.reason_code}",
-        new_values=decline_data.dict()
+        new_values=decline_data.dict(),
+        synchronous=True
     )
     
     return {"status": "declined", "referral_id": referral.id}
@@ -422,7 +439,8 @@ def discharge_placement(
             "discharge_date": placement.discharge_date.isoformat(),
             "outcome": placement.outcome,
             "length_of_stay": placement.length_of_stay
-        }
+        },
+        synchronous=True
     )
     
     return placement
@@ -496,7 +514,8 @@ def complete_followup(
         resource_type="bh_followup",
         resource_id=followup.id,
         description=f"Completed {followup.followup_type} follow-up",
-        new_values=followup_data.dict(exclude_unset=True)
+        new_values=followup_data.dict(exclude_unset=True),
+        synchronous=True
     )
     
     return followup
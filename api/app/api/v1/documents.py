@@ -8,7 +8,7 @@ from sqlalchemy import and_, or_, func
 from typing import List, Optional
 from datetime import datetime, date, timedelta
 
-from database import get_db
+from database import get_db, get_read_db
 from models.user import User
 from models.volunteer import Volunteer
 from models.document import (
@@ -29,11 +29,13 @@ from schemas.document import (
     VolunteerDocumentResponse,
     DocumentUploadRequest,
     DocumentUploadResponse,
+    DocumentDownloadResponse,
     ExpiringDocumentReport,
     SignatureLogResponse,
     DocumentAccessLogCreate
 )
-from services.s3_storage import s3_storage
+from services.s3_storage import get_s3_storage
+from services.document_access import COUNTED_ACTIONS, record_document_access
 
 router = APIRouter()
 
@@ -46,7 +48,7 @@ def list_policy_documents(
     requires_signature: Optional[bool] = None,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """List organizational policy documents."""
@@ -270,6 +272,12 @@ def request_document_upload(
             )
     
     # Generate S3 presigned URL
+    s3_storage = get_s3_storage()
+    if s3_storage is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Document storage is not available"
+        )
     try:
         upload_url, s3_key = s3_storage.generate_upload_url(
             file_name=upload_request.file_name,
@@ -401,10 +409,72 @@ def verify_document(
     )
 
 
+@router.get("/documents/{document_id}/download", response_model=DocumentDownloadResponse)
+def request_document_download(
+    document_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Request a presigned URL for downloading a volunteer document from S3.
+    Counts towards the document's download_count and last_accessed_at.
+    """
+    document = db.query(VolunteerDocument).filter(
+        VolunteerDocument.id == document_id,
+        VolunteerDocument.tenant_id == current_user.tenant_id
+    ).first()
+    
+    if not document:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Document not found"
+        )
+    
+    # Volunteers can only download their own documents
+    if current_user.role == 'volunteer':
+        volunteer = db.query(Volunteer).filter(Volunteer.id == document.volunteer_id).first()
+        if not volunteer or volunteer.email != current_user.email:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Cannot download documents of other volunteers"
+            )
+    
+    s3_storage = get_s3_storage()
+    if s3_storage is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Document storage is not available"
+        )
+    # file_url is stored as s3://{bucket}/{key}
+    s3_key = document.file_url.split("/", 3)[-1]
+    try:
+        download_url = s3_storage.generate_download_url(s3_key, expires_in=3600)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to generate download URL: {str(e)}"
+        )
+    
+    log_document_access(
+        db=db,
+        document_id=document.id,
+        document_type="volunteer_document",
+        action="download",
+        user_id=current_user.id,
+        volunteer_id=document.volunteer_id
+    )
+    
+    return DocumentDownloadResponse(
+        download_url=download_url,
+        document_id=document.id,
+        expires_in=3600
+    )
+
+
 @router.get("/expiring", response_model=List[ExpiringDocumentReport])
 def get_expiring_documents(
     days: int = 30,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get report of documents expiring within X days."""
@@ -451,7 +521,14 @@ def log_document_access(
     volunteer_id: Optional[int] = None,
     meta_data: Optional[dict] = None
 ):
-    """Log document access for audit trail."""
+    """
+    Log document access for audit trail.
+    Buffered by the document access aggregator (no commit on the request path);
+    written directly only when the aggregator is not running.
+    """
+    if record_document_access(document_id, document_type, action, user_id, volunteer_id, meta_data):
+        return
+    
     log_entry = DocumentAccessLog(
         document_id=document_id,
         document_type=document_type,
@@ -461,4 +538,12 @@ def log_document_access(
         meta_data=meta_data
     )
     db.add(log_entry)
+    if document_type == "volunteer_document" and action in COUNTED_ACTIONS:
+        db.query(VolunteerDocument).filter(VolunteerDocument.id == document_id).update(
+            {
+                VolunteerDocument.download_count: func.coalesce(VolunteerDocument.download_count, 0) + 1,
+                VolunteerDocument.last_accessed_at: datetime.utcnow()
+            },
+            synchronize_session=False
+        )
     db.commit()
@@ -1,11 +1,13 @@
 """Event management endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List
-from database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, inspect, select
+from typing import List, Optional
+from database import get_db, get_async_db, get_read_db
 from models.user import User
-from models.event import Event, EventAssignment, AssignmentStatus
+from models.event import Event, Shift, EventAssignment, AssignmentStatus
 from api.deps import get_current_user
 from schemas.event import (
     EventResponse, 
@@ -14,101 +16,166 @@ from schemas.event import (
     EventCreate,
     EventUpdate
 )
+from core.pagination import COUNT_MODES, count_rows, paginate, split_page
+from core.fieldsets import load_columns, parse_fields, pick
+from core.serialization import model_response
 
 router = APIRouter()
 
+# EventResponse fields read straight from Event columns
+_EVENT_COLUMNS = {attr.key for attr in inspect(Event).column_attrs} & set(EventResponse.model_fields)
+
 @router.get("/", response_model=List[EventSimpleResponse])
-def list_events(
+async def list_events(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    count: str = Query("none", pattern=COUNT_MODES),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     List events for the current tenant.
     Returns a simplified structure for frontend compatibility.
+    Registration counts and shift capacity come back as correlated
+    subqueries, so the whole page is a single round trip.
+    The next page's cursor and any requested total are returned in the
+    X-Next-Cursor and X-Total-Count headers.
     """
+    registered_count = (
+        select(func.count(EventAssignment.id))
+        .where(
+            EventAssignment.event_id == Event.id,
+            EventAssignment.status.in_([
+                AssignmentStatus.CONFIRMED.value,
+                AssignmentStatus.PENDING.value
+            ])
+        )
+        .correlate(Event)
+        .scalar_subquery()
+    )
+    max_volunteers = (
+        select(func.coalesce(func.sum(Shift.max_volunteers), 0))
+        .where(Shift.event_id == Event.id)
+        .correlate(Event)
+        .scalar_subquery()
+    )
+    
     # Query events for current tenant
-    events = db.query(Event).filter(
+    visible = (
         Event.tenant_id == current_user.tenant_id,
         Event.visible_to_volunteers == True  # Only visible events
-    ).offset(skip).limit(limit).all()
+    )
+    result = await db.execute(
+        paginate(
+            select(Event, registered_count, max_volunteers).where(*visible),
+            (Event.id,), (int,), cursor, skip, limit
+        )
+    )
+    rows, next_cursor = split_page(result.all(), limit, lambda row: (row[0].id,))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    total = await db.run_sync(count_rows, select(Event.id).where(*visible), count)
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
     
     # Transform to match frontend expectations
-    result = []
-    for event in events:
-        # Count registered volunteers for this event
-        registered_count = db.query(func.count(EventAssignment.id)).filter(
-            EventAssignment.event_id == event.id,
-            EventAssignment.status.in_([
-                AssignmentStatus.CONFIRMED,
-                AssignmentStatus.PENDING
-            ])
-        ).scalar() or 0
-        
-        # Calculate max volunteers from shifts
-        max_volunteers = 0
-        if event.shifts:
-            max_volunteers = sum(shift.max_volunteers or 0 for shift in event.shifts) if event.shifts else 0
-        
-        result.append(EventSimpleResponse(
+    return model_response(List[EventSimpleResponse], [
+        EventSimpleResponse(
             id=str(event.id),
             tenant_id=str(event.tenant_id),
             title=event.name,  # Map 'name' to 'title'
             description=event.volunteer_description or event.staff_description,
             event_date=event.start_date.isoformat() if event.start_date else "",
             location=event.location,
-            max_volunteers=max_volunteers or 50,  # Default if no shifts
-            registered_volunteers=registered_count,
+            max_volunteers=max_count or 50,  # Default if no shifts
+            registered_volunteers=registered or 0,
             created_by=str(event.created_by) if event.created_by else "1"
-        ))
-    
-    return result
+        )
+        for event, registered, max_count in rows
+    ], headers=response.headers)
 
 @router.get("/detailed", response_model=EventListResponse)
 def list_events_detailed(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    count: str = Query("exact", pattern=COUNT_MODES),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return per event"),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     List events with full details.
-    Uses proper response schema with all fields.
+    Uses proper response schema with all fields, or only the requested `fields`.
     """
+    selected = parse_fields(fields, EventResponse)
     query = db.query(Event).filter(Event.tenant_id == current_user.tenant_id)
     
-    total = query.count()
-    events = query.offset(skip).limit(limit).all()
+    def wanted(name: str) -> bool:
+        return selected is None or name in selected
+    
+    # Computed fields come back as correlated subqueries, one round trip per page.
+    # A select() always yields rows, whichever of them were added.
+    page_query = select(Event).where(Event.tenant_id == current_user.tenant_id)
+    if wanted('registered_volunteers'):
+        page_query = page_query.add_columns(
+            select(func.count(EventAssignment.id))
+            .where(
+                EventAssignment.event_id == Event.id,
+                EventAssignment.status == AssignmentStatus.CONFIRMED.value
+            )
+            .correlate(Event)
+            .scalar_subquery()
+            .label('registered_volunteers')
+        )
+    if wanted('max_volunteers'):
+        page_query = page_query.add_columns(
+            select(func.coalesce(func.sum(Shift.max_volunteers), 0))
+            .where(Shift.event_id == Event.id)
+            .correlate(Event)
+            .scalar_subquery()
+            .label('max_volunteers')
+        )
+    
+    page_query = paginate(page_query, (Event.id,), (int,), cursor, skip, limit)
+    if selected:
+        # title and event_date are derived from name and start_date
+        page_query = page_query.options(load_columns(Event, [*selected, "name", "start_date"]))
+    rows, next_cursor = split_page(db.execute(page_query).all(), limit, lambda row: (row[0].id,))
+    total = count_rows(db, query, count)
+    
+    # Only columns that were loaded, so no row triggers a lazy load
+    columns = [name for name in (selected or EventResponse.model_fields) if name in _EVENT_COLUMNS]
     
     # Convert to response schema
     event_responses = []
-    for event in events:
-        # Count volunteers
-        registered = db.query(func.count(EventAssignment.id)).filter(
-            EventAssignment.event_id == event.id,
-            EventAssignment.status == 'confirmed'  # Changed from enum
-        ).scalar() or 0
+    for row in rows:
+        event = row[0]
+        response_data = pick(event, columns)
+        response_data['title'] = event.name
+        response_data['event_date'] = event.start_date.isoformat() if event.start_date else None
         
-        # Calculate max volunteers from shifts - FIXED
-        max_volunteers = 0
-        if event.shifts:
-            max_volunteers = sum(s.max_volunteers or 0 for s in event.shifts)
-        if max_volunteers == 0:
-            max_volunteers = 50  # Default
+        if wanted('registered_volunteers'):
+            response_data['registered_volunteers'] = row.registered_volunteers or 0
         
-        # Create response with computed fields
-        response_data = {
-            **event.__dict__,
-            'title': event.name,
-            'event_date': event.start_date.isoformat() if event.start_date else None,
-            'max_volunteers': max_volunteers,
-            'registered_volunteers': registered
-        }
+        if wanted('max_volunteers'):
+            response_data['max_volunteers'] = row.max_volunteers or 50  # Default if no shifts
         
-        event_responses.append(EventResponse(**response_data))
+        event_responses.append(pick(response_data, selected) if selected else response_data)
     
-    return EventListResponse(total=total, items=event_responses)
+    if selected:
+        return ORJSONResponse({
+            "total": total,
+            "items": event_responses,
+            "next_cursor": next_cursor
+        })
+    return model_response(EventListResponse, {
+        "total": total,
+        "items": event_responses,
+        "next_cursor": next_cursor
+    })
 
 @router.get("/{event_id}", response_model=EventSimpleResponse)
 def get_event(
@@ -8,10 +8,8 @@ from sqlalchemy import func, and_, or_, text
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date, timedelta
 import io
-import pandas as pd
-from openpyxl import Workbook
 
-from database import get_db
+from database import get_db, get_read_db
 from models.user import User
 from models.volunteer import Volunteer
 from models.event import Event
@@ -19,6 +17,7 @@ from models.time_tracking import TimeEntry
 from models.training import VolunteerTraining, Certification
 from models.reporting import SavedReport, ReportExecution, ReportField, ReportWorkflow
 from api.deps import get_current_user
+from core.metrics import REPORT_EXPORTS
 from schemas.reporting import (
     SavedReportCreate,
     SavedReportUpdate,
@@ -46,7 +45,7 @@ def list_saved_reports(
     include_shared: bool = True,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """List saved reports accessible to current user."""
@@ -183,9 +182,14 @@ def execute_report(
     request: ExecuteReportRequest,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
+    read_db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Execute a report and return results."""
+    """
+    Execute a report and return results.
+    The report query runs on the read replica; execution bookkeeping is
+    written to the primary.
+    """
     report = db.query(SavedReport).filter(
         SavedReport.id == report_id,
         SavedReport.tenant_id == current_user.tenant_id
@@ -202,7 +206,7 @@ def execute_report(
     try:
         # Build query based on configuration
         results = build_and_execute_query(
-            db=db,
+            db=read_db,
             tenant_id=current_user.tenant_id,
             query_config=report.query_config
         )
@@ -267,7 +271,7 @@ def get_volunteer_hours_report(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     volunteer_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -323,7 +327,7 @@ def get_volunteer_hours_report(
 
 @router.get("/reports/compliance", response_model=List[ComplianceReport])
 def get_compliance_report(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -376,7 +380,7 @@ def get_compliance_report(
 def get_unit_metrics_report(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -470,8 +474,10 @@ def generate_export_file(
             execution.file_size_bytes = len(file_content)
             execution.status = 'completed'
             db.commit()
+        REPORT_EXPORTS.labels(format.value, "completed").inc()
             
     except Exception as e:
+        REPORT_EXPORTS.labels(format.value, "failed").inc()
         execution = db.query(ReportExecution).filter(
             ReportExecution.id == execution_id
         ).first()
@@ -483,6 +489,9 @@ def generate_export_file(
 
 def generate_excel(results: Dict[str, Any]) -> bytes:
     """Generate Excel file from results."""
+    # pandas/openpyxl are imported on first export, not at worker startup
+    import pandas as pd
+    
     df = pd.DataFrame(results['rows'])
     
     output = io.BytesIO()
@@ -494,6 +503,8 @@ def generate_excel(results: Dict[str, Any]) -> bytes:
 
 def generate_csv(results: Dict[str, Any]) -> bytes:
     """Generate CSV file from results."""
+    import pandas as pd
+    
     df = pd.DataFrame(results['rows'])
     return df.to_csv(index=False).encode('utf-8')
 
@@ -598,7 +609,7 @@ def create_workflow(
 
 @router.get("/workflows", response_model=List[WorkflowResponse])
 def list_workflows(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """List workflows."""
@@ -615,7 +626,7 @@ def list_workflows(
 @router.get("/fields")
 def get_available_fields(
     entity_type: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get available fields for report builder."""
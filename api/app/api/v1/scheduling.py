@@ -4,10 +4,11 @@ Implements section 1.2 from roadmap.
 """
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, and_, or_, select
 from typing import List
 from datetime import datetime, date, timedelta
-from database import get_db
+from database import get_db, get_async_db
 from models.user import User
 from models.volunteer import Volunteer
 from models.event import Event, Shift, EventAssignment
@@ -61,19 +62,35 @@ def create_shift_template(
 # ======================
 
 @router.get("/shifts/available", response_model=List[AvailableShiftResponse])
-def get_available_shifts(
+async def get_available_shifts(
     start_date: date = None,
     end_date: date = None,
     include_full: bool = False,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get list of available shifts for self-signup.
     Volunteers can browse and sign up for open shifts.
     """
+    # Count current volunteers per shift in the same statement
+    current_count = (
+        select(func.count(EventAssignment.id))
+        .where(
+            EventAssignment.shift_id == Shift.id,
+            EventAssignment.status.in_(['confirmed', 'pending'])
+        )
+        .correlate(Shift)
+        .scalar_subquery()
+    )
+    
     # Build query for shifts with self-signup enabled
-    query = db.query(Shift).join(Event).filter(
+    query = select(
+        Shift,
+        Event.name,
+        Event.volunteer_description,
+        current_count
+    ).join(Event, Shift.event_id == Event.id).where(
         Event.tenant_id == current_user.tenant_id,
         Shift.allow_self_signup == True,
         Shift.start_time >= datetime.now()
@@ -81,20 +98,16 @@ def get_available_shifts(
     
     # Filter by date range
     if start_date:
-        query = query.filter(Shift.start_time >= datetime.combine(start_date, datetime.min.time()))
+        query = query.where(Shift.start_time >= datetime.combine(start_date, datetime.min.time()))
     if end_date:
-        query = query.filter(Shift.start_time <= datetime.combine(end_date, datetime.max.time()))
+        query = query.where(Shift.start_time <= datetime.combine(end_date, datetime.max.time()))
     
-    shifts = query.all()
+    result = await db.execute(query)
     
     # Transform to response format
     available_shifts = []
-    for shift in shifts:
-        # Count current volunteers
-        current_count = db.query(func.count(EventAssignment.id)).filter(
-            EventAssignment.shift_id == shift.id,
-            EventAssignment.status.in_(['confirmed', 'pending'])
-        ).scalar() or 0
+    for shift, event_name, event_description, current_count in result.all():
+        current_count = current_count or 0
         
         # Count waitlist
         waitlist_count = 0  # TODO: Query actual waitlist table
@@ -120,8 +133,8 @@ def get_available_shifts(
             allow_self_signup=shift.allow_self_signup or False,
             enable_waitlist=shift.enable_waitlist or False,
             required_skills=shift.required_skills,
-            event_name=shift.event.name,
-            event_description=shift.event.volunteer_description
+            event_name=event_name,
+            event_description=event_description
         ))
     
     return available_shifts
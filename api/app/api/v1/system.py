@@ -0,0 +1,111 @@
+"""
+System administration endpoints (System Admin only).
+Operational telemetry for capacity planning and incident response.
+"""
+import os
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from config import get_settings
+from database import engine, async_engine, replica_engine, replica_health
+from models.user import User, UserRole
+from api.deps import require_role
+from core.db_pool import pool_status
+from core.principal_cache import principal_cache
+from core.profiling import profile_store
+from core.security import token_cache
+from services.audit import audit_writer
+from services.document_access import document_access
+from services.token_revocation import revocation_stats
+
+router = APIRouter()
+settings = get_settings()
+
+
+@router.get("/db-pool")
+async def get_db_pool_status(
+    current_user: User = Depends(require_role([UserRole.SYSTEM_ADMIN]))
+):
+    """
+    Connection pool occupancy and checkout wait stats.
+    Pools are per uvicorn worker, so the response is for the worker that
+    served it (see pid); sample a few times to cover every worker.
+    """
+    pools = {
+        "primary": pool_status(engine.pool),
+        "primary_async": pool_status(async_engine.sync_engine.pool),
+    }
+    if replica_engine is not None:
+        pools["replica"] = {
+            **pool_status(replica_engine.pool),
+            "health": replica_health.as_dict(),
+        }
+    
+    return {
+        "pid": os.getpid(),
+        "config": {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        },
+        "pools": pools
+    }
+
+
+@router.get("/caches")
+async def get_cache_status(
+    current_user: User = Depends(require_role([UserRole.SYSTEM_ADMIN]))
+):
+    """In-process cache sizes and hit rates for the worker that served the request."""
+    return {
+        "pid": os.getpid(),
+        "caches": {
+            "principal": principal_cache.as_dict(),
+            "token": token_cache.as_dict(),
+            "revoked_tokens": revocation_stats(),
+        }
+    }
+
+
+@router.get("/audit-writer")
+async def get_audit_writer_status(
+    current_user: User = Depends(require_role([UserRole.SYSTEM_ADMIN]))
+):
+    """Batched audit writer and document access aggregator counters for this worker."""
+    return {
+        "pid": os.getpid(),
+        **audit_writer.as_dict(),
+        "document_access": document_access.as_dict()
+    }
+
+
+@router.get("/profiles")
+def list_profiles(
+    limit: int = Query(20, ge=1, le=200),
+    route: Optional[str] = Query(None, description="Route template, e.g. /api/v1/time-tracking/entries"),
+    tenant_id: Optional[int] = None,
+    current_user: User = Depends(require_role([UserRole.SYSTEM_ADMIN]))
+):
+    """
+    Slowest captured request profiles (X-Profile: 1 or PROFILE_SAMPLE_RATE).
+    Profiles are stored per host in PROFILE_DIR, so all workers share them.
+    """
+    return {"profiles": profile_store.list(limit=limit, route=route, tenant_id=tenant_id)}
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+def get_profile(
+    profile_id: str,
+    current_user: User = Depends(require_role([UserRole.SYSTEM_ADMIN]))
+):
+    """Collapsed stacks of one profile, ready for flamegraph.pl or speedscope."""
+    collapsed = profile_store.collapsed(profile_id)
+    if collapsed is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+    return PlainTextResponse(collapsed)
@@ -1,16 +1,18 @@
 """
 Tenant management endpoints for SaaS administration.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
-from database import get_db
+from database import get_db, get_read_db
 from models.tenant import Tenant
 from models.user import User, UserRole
 from schemas.tenant import TenantCreate, TenantUpdate, TenantResponse, TenantListResponse
 from api.deps import get_current_user, require_role
 from services.audit import log_action
+from core.pagination import COUNT_MODES, count_rows, paginate, split_page
+from core.serialization import model_response
 
 router = APIRouter()
 
@@ -19,16 +21,22 @@ router = APIRouter()
 def list_tenants(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    count: str = Query("exact", pattern=COUNT_MODES),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(require_role([UserRole.SYSTEM_ADMIN]))
 ):
     """
     List all tenants (System Admin only).
     """
-    tenants = db.query(Tenant).offset(skip).limit(limit).all()
-    total = db.query(Tenant).count()
+    query = db.query(Tenant)
+    tenants, next_cursor = split_page(
+        paginate(query, (Tenant.id,), (int,), cursor, skip, limit).all(),
+        limit, lambda t: (t.id,)
+    )
+    total = count_rows(db, query, count)
     
-    return TenantListResponse(total=total, items=tenants)
+    return model_response(TenantListResponse, {"total": total, "items": tenants, "next_cursor": next_cursor})
 
 
 @router.post("/", response_model=TenantResponse, status_code=status.HTTP_201_CREATED)
@@ -2,20 +2,28 @@
 """
 Time tracking endpoints for volunteer hours.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, and_, select
 from typing import List, Optional
 from datetime import datetime, timedelta
 import hashlib
+import logging
 import secrets
 
-from database import get_db
+from database import get_db, get_async_db, get_read_db
 from models.user import User
 from models.volunteer import Volunteer
 from models.event import Event
 from models.time_tracking import TimeEntry, EventQRCode, CheckinSession
 from api.deps import get_current_user
+from core.pagination import COUNT_MODES, count_rows, paginate, split_page
+from core.fieldsets import load_columns, parse_fields, pick
+from core.serialization import model_response
+from core.metrics import VOLUNTEER_CHECKINS
 from schemas.time_tracking import (
     TimeEntryCreate,
     TimeEntryBulkCreate,
@@ -33,12 +41,14 @@ from schemas.time_tracking import (
 )
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 # =============== Time Entries ===============
 
 @router.get("/entries", response_model=List[TimeEntryResponse])
 def list_time_entries(
+    response: Response,
     volunteer_id: Optional[int] = None,
     event_id: Optional[int] = None,
     status: Optional[str] = None,
@@ -46,14 +56,16 @@ def list_time_entries(
     end_date: Optional[datetime] = None,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    count: str = Query("none", pattern=COUNT_MODES),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
-    """List time entries with filters."""
-    print(f"\n=== TIME ENTRIES API CALLED ===")
-    print(f"User: {current_user.username} (tenant {current_user.tenant_id})")
-    print(f"Filters: volunteer_id={volunteer_id}, event_id={event_id}, status={status}")
-    
+    """
+    List time entries with filters, newest check-in first.
+    The next page's cursor and any requested total are returned in the
+    X-Next-Cursor and X-Total-Count headers.
+    """
     query = db.query(TimeEntry).filter(
         TimeEntry.tenant_id == current_user.tenant_id
     )
@@ -69,64 +81,48 @@ def list_time_entries(
     if end_date:
         query = query.filter(TimeEntry.check_in_time <= end_date)
     
-    entries = query.order_by(TimeEntry.check_in_time.desc()).offset(skip).limit(limit).all()
-    
-    print(f"Found {len(entries)} entries")
+    entries, next_cursor = split_page(
+        paginate(
+            query, (TimeEntry.check_in_time, TimeEntry.id), (datetime.fromisoformat, int),
+            cursor, skip, limit, descending=True
+        ).all(),
+        limit, lambda e: (e.check_in_time, e.id)
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    total = count_rows(db, query, count)
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
+    
+    # Enhance with volunteer/event names, fetched for the whole page at once
+    volunteer_ids = {entry.volunteer_id for entry in entries}
+    event_ids = {entry.event_id for entry in entries if entry.event_id}
+    volunteer_names = {
+        v.id: f"{v.first_name} {v.last_name}"
+        for v in db.query(Volunteer.id, Volunteer.first_name, Volunteer.last_name).filter(
+            Volunteer.id.in_(volunteer_ids)
+        )
+    } if volunteer_ids else {}
+    event_names = dict(
+        db.query(Event.id, Event.name).filter(Event.id.in_(event_ids)).all()
+    ) if event_ids else {}
     
-    # Enhance with volunteer/event names
     result = []
     for entry in entries:
-        volunteer_name = "Unknown Volunteer"
-        event_name = None
-        
-        # Get volunteer info - don't fail if volunteer not found
-        try:
-            volunteer = db.query(Volunteer).filter(Volunteer.id == entry.volunteer_id).first()
-            if volunteer:
-                volunteer_name = f"{volunteer.first_name} {volunteer.last_name}"
-            else:
-                print(f"⚠️ Warning: Volunteer {entry.volunteer_id} not found for entry {entry.id}")
-        except Exception as e:
-            print(f"⚠️ Error fetching volunteer {entry.volunteer_id}: {e}")
-        
-        # Get event info - don't fail if event not found
-        try:
-            if entry.event_id:
-                event = db.query(Event).filter(Event.id == entry.event_id).first()
-                if event:
-                    event_name = event.name
-        except Exception as e:
-            print(f"⚠️ Error fetching event {entry.event_id}: {e}")
-        
-        # Build response object
-        entry_dict = {
-            'id': entry.id,
-            'tenant_id': entry.tenant_id,
-            'volunteer_id': entry.volunteer_id,
-            'event_id': entry.event_id,
-            'shift_id': entry.shift_id,
-            'check_in_time': entry.check_in_time,
-            'check_out_time': entry.check_out_time,
-            'duration_minutes': entry.duration_minutes,
-            'hours_decimal': float(entry.hours_decimal) if entry.hours_decimal else None,
-            'entry_method': entry.entry_method,
-            'status': entry.status,
-            'approved_by': entry.approved_by,
-            'approved_at': entry.approved_at,
-            'volunteer_notes': entry.volunteer_notes,
-            'coordinator_notes': entry.coordinator_notes,
-            'created_at': entry.created_at,
-            'volunteer_name': volunteer_name,
-            'event_name': event_name
-        }
-        
-        print(f"  ✓ Entry {entry.id}: {volunteer_name} - {entry.hours_decimal} hrs - {entry.status}")
-        result.append(TimeEntryResponse(**entry_dict))
-    
-    print(f"Returning {len(result)} entries")
-    print("=== END TIME ENTRIES API ===\n")
+        item = TimeEntryResponse.model_validate(entry)
+        item.volunteer_name = volunteer_names.get(entry.volunteer_id, "Unknown Volunteer")
+        item.event_name = event_names.get(entry.event_id)
+        result.append(item)
+    
+    missing = volunteer_ids - volunteer_names.keys()
+    if missing:
+        logger.warning("Volunteers %s not found for time entries", sorted(missing))
+    logger.debug(
+        "Listed %d time entries (volunteer_id=%s, event_id=%s, status=%s)",
+        len(result), volunteer_id, event_id, status
+    )
     
-    return result
+    return model_response(List[TimeEntryResponse], result, headers=response.headers)
 
 
 @router.post("/entries", response_model=TimeEntryResponse, status_code=status.HTTP_201_CREATED)
@@ -310,33 +306,61 @@ def bulk_approve_entries(
 
 @router.get("/entries/pending", response_model=PendingApprovalsReport)
 def get_pending_approvals(
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return per entry"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get all pending time entries requiring approval."""
-    entries = db.query(TimeEntry).filter(
+    selected = parse_fields(fields, TimeEntryResponse)
+    query = db.query(TimeEntry).filter(
         TimeEntry.tenant_id == current_user.tenant_id,
         TimeEntry.status == 'pending'
-    ).order_by(TimeEntry.check_in_time.desc()).all()
+    )
+    if selected:
+        # The summary totals always need hours and check-in time
+        query = query.options(load_columns(TimeEntry, [*selected, "hours_decimal", "check_in_time"]))
+        if "volunteer_name" in selected:
+            query = query.options(selectinload(TimeEntry.volunteer).load_only(
+                Volunteer.first_name, Volunteer.middle_name, Volunteer.last_name
+            ))
+        if "event_name" in selected:
+            query = query.options(selectinload(TimeEntry.event).load_only(Event.name))
+    else:
+        query = query.options(selectinload(TimeEntry.volunteer), selectinload(TimeEntry.event))
+    entries = query.order_by(TimeEntry.check_in_time.desc()).all()
     
     total_hours = sum(float(e.hours_decimal or 0) for e in entries)
     oldest_date = min((e.check_in_time for e in entries), default=None)
     
-    entry_responses = [
-        TimeEntryResponse(
-            **e.__dict__,
-            volunteer_name=e.volunteer.full_name,
-            event_name=e.event.name if e.event else None
-        )
-        for e in entries
-    ]
-    
-    return PendingApprovalsReport(
-        total_pending=len(entries),
-        total_hours_pending=total_hours,
-        oldest_entry_date=oldest_date,
-        entries=entry_responses
-    )
+    if selected:
+        items = []
+        for e in entries:
+            item = pick(e, selected)
+            if "volunteer_name" in selected:
+                item["volunteer_name"] = e.volunteer.full_name
+            if "event_name" in selected:
+                item["event_name"] = e.event.name if e.event else None
+            items.append(item)
+        return JSONResponse(jsonable_encoder({
+            "total_pending": len(entries),
+            "total_hours_pending": total_hours,
+            "oldest_entry_date": oldest_date,
+            "entries": items
+        }))
+    
+    entry_responses = []
+    for e in entries:
+        item = TimeEntryResponse.model_validate(e)
+        item.volunteer_name = e.volunteer.full_name
+        item.event_name = e.event.name if e.event else None
+        entry_responses.append(item)
+    
+    return model_response(PendingApprovalsReport, {
+        "total_pending": len(entries),
+        "total_hours_pending": total_hours,
+        "oldest_entry_date": oldest_date,
+        "entries": entry_responses
+    })
 
 
 # =============== QR Codes ===============
@@ -402,17 +426,18 @@ def get_event_qr_code(
 # =============== Check-in/Check-out ===============
 
 @router.post("/checkin", response_model=CheckinResponse)
-def volunteer_checkin(
+async def volunteer_checkin(
     checkin: CheckinRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Volunteer check-in via QR code or direct entry."""
     # Verify QR code if provided
     qr_code = None
     if checkin.qr_code_hash:
-        qr_code = db.query(EventQRCode).filter(
-            EventQRCode.qr_code_hash == checkin.qr_code_hash
-        ).first()
+        result = await db.execute(
+            select(EventQRCode).where(EventQRCode.qr_code_hash == checkin.qr_code_hash)
+        )
+        qr_code = result.scalar_one_or_none()
         
         if not qr_code or not qr_code.is_valid():
             raise HTTPException(
@@ -427,9 +452,7 @@ def volunteer_checkin(
             detail="Volunteer ID is required"
         )
     
-    volunteer = db.query(Volunteer).filter(
-        Volunteer.id == checkin.volunteer_id
-    ).first()
+    volunteer = await db.get(Volunteer, checkin.volunteer_id)
     
     if not volunteer:
         raise HTTPException(
@@ -437,13 +460,16 @@ def volunteer_checkin(
             detail="Volunteer not found"
         )
     
+    event_id = checkin.event_id or (qr_code.event_id if qr_code else None)
+    check_in_time = datetime.utcnow()
+    
     # Create check-in session
     session = CheckinSession(
         volunteer_id=checkin.volunteer_id,
-        event_id=checkin.event_id or (qr_code.event_id if qr_code else None),
+        event_id=event_id,
         qr_code_id=qr_code.id if qr_code else None,
-        check_in_time=datetime.utcnow(),
-        device_info=str(checkin.device_info) if checkin.device_info else None,
+        check_in_time=check_in_time,
+        device_info=checkin.device_info,
         status='active'
     )
     
@@ -453,8 +479,8 @@ def volunteer_checkin(
     time_entry = TimeEntry(
         tenant_id=volunteer.tenant_id,
         volunteer_id=volunteer.id,
-        event_id=checkin.event_id or (qr_code.event_id if qr_code else None),
-        check_in_time=datetime.utcnow(),
+        event_id=event_id,
+        check_in_time=check_in_time,
         entry_method='qr_code' if qr_code else 'kiosk',
         check_in_lat=checkin.latitude,
         check_in_lng=checkin.longitude,
@@ -463,13 +489,17 @@ def volunteer_checkin(
     
     db.add(time_entry)
     
-    # Update QR code use count
+    # Update QR code use count in SQL so concurrent kiosk scans don't lose increments
     if qr_code:
-        qr_code.use_count += 1
+        qr_code.use_count = EventQRCode.use_count + 1
     
-    db.commit()
-    db.refresh(session)
-    db.refresh(time_entry)
+    await db.commit()
+    VOLUNTEER_CHECKINS.labels(time_entry.entry_method).inc()
+    
+    # Relationships can't lazy-load on an async session; fetch the name directly
+    event_name = None
+    if event_id:
+        event_name = await db.scalar(select(Event.name).where(Event.id == event_id))
     
     return CheckinResponse(
         success=True,
@@ -477,39 +507,42 @@ def volunteer_checkin(
         session_id=session.id,
         time_entry_id=time_entry.id,
         volunteer_name=volunteer.full_name,
-        event_name=time_entry.event.name if time_entry.event else None,
+        event_name=event_name,
         check_in_time=time_entry.check_in_time
     )
 
 
 @router.post("/checkout")
-def volunteer_checkout(
+async def volunteer_checkout(
     checkout: CheckoutRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Volunteer check-out."""
     time_entry = None
     
     if checkout.time_entry_id:
-        time_entry = db.query(TimeEntry).filter(
-            TimeEntry.id == checkout.time_entry_id
-        ).first()
+        time_entry = await db.get(TimeEntry, checkout.time_entry_id)
     elif checkout.session_id:
-        session = db.query(CheckinSession).filter(
-            CheckinSession.id == checkout.session_id,
-            CheckinSession.status == 'active'
-        ).first()
+        result = await db.execute(
+            select(CheckinSession).where(
+                CheckinSession.id == checkout.session_id,
+                CheckinSession.status == 'active'
+            )
+        )
+        session = result.scalar_one_or_none()
         
         if session:
-            time_entry = db.query(TimeEntry).filter(
-                TimeEntry.volunteer_id == session.volunteer_id,
-                TimeEntry.event_id == session.event_id,
-                TimeEntry.check_out_time.is_(None)
-            ).order_by(TimeEntry.check_in_time.desc()).first()
+            result = await db.execute(
+                select(TimeEntry).where(
+                    TimeEntry.volunteer_id == session.volunteer_id,
+                    TimeEntry.event_id == session.event_id,
+                    TimeEntry.check_out_time.is_(None)
+                ).order_by(TimeEntry.check_in_time.desc()).limit(1)
+            )
+            time_entry = result.scalar_one_or_none()
             
-            if session:
-                session.check_out_time = datetime.utcnow()
-                session.status = 'completed'
+            session.check_out_time = datetime.utcnow()
+            session.status = 'completed'
     
     if not time_entry:
         raise HTTPException(
@@ -526,7 +559,7 @@ def volunteer_checkout(
     
     time_entry.calculate_duration()
     
-    db.commit()
+    await db.commit()
     
     return {
         "success": True,
@@ -542,7 +575,7 @@ def get_volunteer_hours_report(
     volunteer_id: int,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get hours report for a specific volunteer."""
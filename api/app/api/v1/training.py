@@ -27,6 +27,7 @@ from schemas.training import (
     TRAINSyncResponse
 )
 from services.train import train_service
+from core.metrics import TRAIN_SYNC_ERRORS, TRAIN_SYNC_RECORDS
 
 router = APIRouter()
 
@@ -473,6 +474,7 @@ async def sync_from_train(
                 ).first()
                 
                 if existing and not sync_request.force:
+                    TRAIN_SYNC_RECORDS.labels("skipped").inc()
                     continue  # Skip if already exists
                 
                 # Create or update training record
@@ -497,8 +499,10 @@ async def sync_from_train(
                     db.add(training)
                 
                 records_synced += 1
+                TRAIN_SYNC_RECORDS.labels("updated" if existing else "created").inc()
             
         except Exception as e:
+            TRAIN_SYNC_ERRORS.inc()
             errors.append(f"Error syncing {volunteer.email}: {str(e)}")
     
     db.commit()
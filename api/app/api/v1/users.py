@@ -1,10 +1,13 @@
 """User management endpoints (stub for Phase 1)."""
-from fastapi import APIRouter, Depends
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from database import get_db
+from database import get_read_db
 from models.user import User
 from api.deps import get_current_user
 from schemas.user import UserListResponse, UserResponse
+from core.pagination import COUNT_MODES, count_rows, paginate, split_page
+from core.serialization import model_response
 
 router = APIRouter()
 
@@ -21,13 +24,19 @@ def get_current_user_profile(
 def list_users(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    count: str = Query("exact", pattern=COUNT_MODES),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """List users in current tenant."""
-    users = db.query(User).filter(User.tenant_id == current_user.tenant_id).offset(skip).limit(limit).all()
-    total = db.query(User).filter(User.tenant_id == current_user.tenant_id).count()
-    return UserListResponse(total=total, items=users)
+    query = db.query(User).filter(User.tenant_id == current_user.tenant_id)
+    users, next_cursor = split_page(
+        paginate(query, (User.id,), (int,), cursor, skip, limit).all(),
+        limit, lambda u: (u.id,)
+    )
+    total = count_rows(db, query, count)
+    return model_response(UserListResponse, {"total": total, "items": users, "next_cursor": next_cursor})
 
 # TODO: Add CRUD endpoints for users
 
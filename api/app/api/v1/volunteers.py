@@ -1,36 +1,48 @@
 """Volunteer management endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from datetime import datetime
-from database import get_db
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, with_expression
+from datetime import date, datetime
+from database import get_db, get_read_db, get_async_db
 from models.user import User
-from models.volunteer import Volunteer, VolunteerStatus
+from models.volunteer import SEARCH_CONFIG, Volunteer, VolunteerStatus, search_name
 from api.deps import get_current_user
 from schemas.volunteer import (
     VolunteerListResponse, 
+    VolunteerSearchResponse,
     VolunteerStatsResponse,
     VolunteerResponse,
     PublicVolunteerRegistration,
     RegistrationSuccessResponse
 )
-from core.security import get_password_hash
+from core.security import hash_password_async
+from core.pagination import COUNT_MODES, count_rows, paginate, split_page
+from core.fieldsets import load_columns, parse_fields, pick
+from core.serialization import model_response
 
 router = APIRouter()
 
 
 @router.post("/register", response_model=RegistrationSuccessResponse, status_code=status.HTTP_201_CREATED)
-def public_volunteer_registration(
+async def public_volunteer_registration(
     registration_data: PublicVolunteerRegistration,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     PUBLIC endpoint for volunteer self-registration.
     No authentication required - this is the entry point for new volunteers.
     
     Creates a volunteer account with 'pending' status that requires coordinator approval.
+    Returns 503 when the password hashing pool is saturated (registration drives).
     """
     # Check if email already exists
-    existing = db.query(Volunteer).filter(Volunteer.email == registration_data.email).first()
+    existing = await db.scalar(
+        select(Volunteer.id).where(Volunteer.email == registration_data.email).limit(1)
+    )
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -41,15 +53,20 @@ def public_volunteer_registration(
     username = registration_data.email.lower().strip()
     
     # Check if username exists
-    existing_username = db.query(Volunteer).filter(Volunteer.username == username).first()
+    existing_username = await db.scalar(
+        select(Volunteer.id).where(Volunteer.username == username).limit(1)
+    )
     if existing_username:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="This username is already taken"
         )
     
+    # End the read transaction so no pooled connection is held during bcrypt
+    await db.commit()
+    
     # Hash password
-    hashed_password = get_password_hash(registration_data.password)
+    hashed_password = await hash_password_async(registration_data.password)
     
     # Create volunteer with PENDING status
     volunteer_data = registration_data.dict(exclude={'password'})
@@ -63,8 +80,8 @@ def public_volunteer_registration(
     )
     
     db.add(volunteer)
-    db.commit()
-    db.refresh(volunteer)
+    await db.commit()
+    await db.refresh(volunteer)
     
     # TODO: Send welcome email to volunteer
     # TODO: Send notification to unit coordinator
@@ -81,20 +98,37 @@ def public_volunteer_registration(
 def list_volunteers(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    count: str = Query("exact", pattern=COUNT_MODES),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return per volunteer"),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """List volunteers in current tenant."""
-    volunteers = db.query(Volunteer).filter(
-        Volunteer.tenant_id == current_user.tenant_id
-    ).offset(skip).limit(limit).all()
-    total = db.query(Volunteer).filter(Volunteer.tenant_id == current_user.tenant_id).count()
-    return VolunteerListResponse(total=total, items=volunteers)
+    selected = parse_fields(fields, VolunteerResponse)
+    query = db.query(Volunteer).filter(Volunteer.tenant_id == current_user.tenant_id)
+    page_query = paginate(query, (Volunteer.id,), (int,), cursor, skip, limit)
+    if selected:
+        page_query = page_query.options(load_columns(Volunteer, selected))
+    volunteers, next_cursor = split_page(page_query.all(), limit, lambda v: (v.id,))
+    total = count_rows(db, query, count)
+    
+    if selected:
+        return JSONResponse(jsonable_encoder({
+            "total": total,
+            "items": [pick(v, selected) for v in volunteers],
+            "next_cursor": next_cursor
+        }))
+    return model_response(VolunteerListResponse, {
+        "total": total,
+        "items": volunteers,
+        "next_cursor": next_cursor
+    })
 
 
 @router.get("/stats", response_model=VolunteerStatsResponse)
 def get_volunteer_stats(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get volunteer statistics for dashboard."""
@@ -115,6 +149,52 @@ def get_volunteer_stats(
     )
 
 
+@router.get("/search", response_model=VolunteerSearchResponse)
+def search_volunteers(
+    q: Optional[str] = Query(None, max_length=200, description="Names, skills, languages, occupation, license type or city"),
+    application_status: Optional[str] = Query(None, alias="status"),
+    mrc_level: Optional[str] = None,
+    license_valid_on: Optional[date] = Query(None, description="Only volunteers whose license expires on or after this date"),
+    city: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(25, ge=1, le=100),
+    count: str = Query("estimate", pattern=COUNT_MODES),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Ranked volunteer search in current tenant.
+    `q` is matched as web-search text ("spanish RN richmond", quoted phrases,
+    or, -word) against the volunteer's search vector, and fuzzily against the
+    full name so misspelt names still match. Without `q` the filtered
+    volunteers are listed by name. `total` is the planner's estimate for
+    large result sets unless count=exact is requested.
+    """
+    query = db.query(Volunteer).filter(Volunteer.tenant_id == current_user.tenant_id)
+    if application_status:
+        query = query.filter(Volunteer.application_status == application_status)
+    if mrc_level:
+        query = query.filter(Volunteer.mrc_level == mrc_level)
+    if license_valid_on:
+        query = query.filter(Volunteer.license_expiration >= license_valid_on)
+    if city:
+        query = query.filter(func.lower(Volunteer.city) == city.strip().lower())
+    
+    q = (q or "").strip()
+    if q:
+        text_query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+        # Both conditions are served by GIN indexes (search vector, name trigrams)
+        query = query.filter(or_(Volunteer.search_vector.op("@@")(text_query), search_name.op("%>")(q)))
+        rank = func.ts_rank_cd(Volunteer.search_vector, text_query) + func.word_similarity(q, search_name)
+        page_query = query.options(with_expression(Volunteer.search_rank, rank)).order_by(rank.desc(), Volunteer.id)
+    else:
+        page_query = query.order_by(Volunteer.last_name, Volunteer.first_name, Volunteer.id)
+    
+    volunteers = page_query.offset(skip).limit(limit).all()
+    total = count_rows(db, query, count)
+    return model_response(VolunteerSearchResponse, {"total": total, "items": volunteers})
+
+
 @router.get("/{volunteer_id}", response_model=VolunteerResponse)
 def get_volunteer(
     volunteer_id: int,
@@ -0,0 +1,4 @@
+"""
+Benchmark scripts for the VVHS API.
+Run from the app directory, e.g. docker exec -it vvhs-api python -m benchmarks.concurrency --help
+"""
@@ -0,0 +1,86 @@
+# api/app/benchmarks/auth_overhead.py - Per-request authentication cost
+"""
+Measure the time get_current_user takes per request, with the principal cache
+warm and with it cleared before every call (the old users-table lookup path).
+
+Needs a reachable database (DATABASE_URL) and an existing active user id.
+
+Usage:
+    python -m benchmarks.auth_overhead --user-id 1 --iterations 2000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from starlette.requests import Request
+
+from api.deps import get_current_user
+from core.principal_cache import principal_cache
+from core.security import create_access_token
+from database import AsyncSessionLocal, async_engine
+from models.user import User
+
+
+def build_request(token: str) -> Request:
+    """Minimal ASGI request carrying a bearer token."""
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+    })
+
+
+async def measure(request: Request, iterations: int, cold: bool) -> list:
+    """Per-call latencies in seconds."""
+    latencies = []
+    for _ in range(iterations):
+        if cold:
+            principal_cache.clear()
+        started = time.perf_counter()
+        async with AsyncSessionLocal() as db:
+            await get_current_user(request, db)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def report(label: str, latencies: list):
+    ordered = sorted(latencies)
+    print(
+        f"{label:<14} mean {statistics.mean(ordered) * 1e6:8.1f} us  "
+        f"p50 {ordered[len(ordered) // 2] * 1e6:8.1f} us  "
+        f"p99 {ordered[int(len(ordered) * 0.99) - 1] * 1e6:8.1f} us"
+    )
+
+
+async def run(args):
+    async with AsyncSessionLocal() as db:
+        user = await db.get(User, args.user_id)
+        if user is None:
+            raise SystemExit(f"User {args.user_id} not found")
+        token = create_access_token({
+            "sub": user.id,
+            "username": user.username,
+            "tenant_id": user.tenant_id,
+            "role": user.role.value
+        })
+    
+    request = build_request(token)
+    # Warm up the connection pool before timing
+    await measure(request, 20, cold=True)
+    
+    report("no cache", await measure(request, args.iterations, cold=True))
+    report("cache warm", await measure(request, args.iterations, cold=False))
+    await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user-id", type=int, required=True)
+    parser.add_argument("--iterations", type=int, default=2000)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
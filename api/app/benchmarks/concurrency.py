@@ -0,0 +1,100 @@
+# api/app/benchmarks/concurrency.py - Concurrent client throughput benchmark
+"""
+Drive one hot endpoint with N concurrent clients and report requests/sec.
+
+Run it once against a build on the sync session path and once against the
+async path to compare the two under kiosk check-in style bursts.
+
+Usage:
+    python -m benchmarks.concurrency --base-url http://localhost:8000 \\
+        --scenario checkin --volunteer-id 1 --event-id 1 --concurrency 500
+    python -m benchmarks.concurrency --scenario events --token <JWT>
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+SCENARIOS = {
+    "checkin": ("POST", "/api/v1/time-tracking/checkin"),
+    "checkout": ("POST", "/api/v1/time-tracking/checkout"),
+    "events": ("GET", "/api/v1/events/"),
+    "shifts": ("GET", "/api/v1/scheduling/shifts/available"),
+    "me": ("GET", "/api/v1/users/me"),
+}
+
+
+def build_payload(args) -> dict:
+    """Request body for the POST scenarios."""
+    if args.scenario == "checkin":
+        return {"volunteer_id": args.volunteer_id, "event_id": args.event_id}
+    if args.scenario == "checkout":
+        return {"session_id": args.session_id}
+    return None
+
+
+async def worker(client: httpx.AsyncClient, method: str, path: str, payload, deadline: float, latencies: list, errors: list):
+    """Issue requests back-to-back until the deadline passes."""
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, path, json=payload)
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+        latencies.append(time.perf_counter() - started)
+
+
+async def run(args):
+    method, path = SCENARIOS[args.scenario]
+    payload = build_payload(args)
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    
+    latencies = []
+    errors = []
+    async with httpx.AsyncClient(base_url=args.base_url, headers=headers, limits=limits, timeout=args.timeout) as client:
+        # Warm up connections and the server's pools before measuring
+        await asyncio.gather(*(client.request(method, path, json=payload) for _ in range(min(args.concurrency, 50))), return_exceptions=True)
+        
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(
+            worker(client, method, path, payload, deadline, latencies, errors)
+            for _ in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+    
+    latencies.sort()
+    
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 if latencies else 0.0
+    
+    print(f"\n=== {method} {path} @ {args.concurrency} clients for {args.duration}s ===")
+    print(f"Requests:     {len(latencies)}")
+    print(f"Errors:       {len(errors)}")
+    print(f"Requests/sec: {len(latencies) / elapsed:.1f}")
+    if latencies:
+        print(f"Latency ms:   mean={statistics.fmean(latencies) * 1000:.1f} p50={pct(0.50):.1f} p95={pct(0.95):.1f} p99={pct(0.99):.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="checkin")
+    parser.add_argument("--token", help="Bearer token for authenticated scenarios")
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--volunteer-id", type=int, default=1)
+    parser.add_argument("--event-id", type=int, default=1)
+    parser.add_argument("--session-id", type=int, default=1)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+# api/app/benchmarks/datagen.py - Synthetic data at production scale
+"""
+Populate an empty schema (db_init, or `alembic upgrade head`) with synthetic
+tenants, volunteers, events, shifts, assignments, time entries, saved reports
+and, when the behavioral health tables exist, facilities with bed snapshots.
+
+Rows are generated server-side with INSERT ... SELECT generate_series, so
+the default scale (50 tenants, 200k volunteers, 5M time entries, 20k BH
+facilities) loads in minutes. setseed() makes a given --seed reproducible.
+
+Every tenant gets an org admin `bench-admin-<n>` with --password, which the
+load benchmark (benchmarks.load) logs in as. Use a scratch database: the
+generator refuses to run twice against the same one.
+
+Usage:
+    createdb vvhs_bench && DATABASE_URL=.../vvhs_bench alembic upgrade head
+    python -m benchmarks.datagen --scale 0.01          # smoke-sized
+    python -m benchmarks.datagen --tenants 50 --volunteers 200000 \\
+        --time-entries 5000000 --bh-facilities 20000
+"""
+import argparse
+import json
+import time
+
+from sqlalchemy import text
+
+from core.security import get_password_hash
+from database import engine
+
+FIRST_NAMES = ["Alex", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie", "Avery", "Quinn", "Drew"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Wilson", "Moore"]
+CITIES = ["Richmond", "Norfolk", "Virginia Beach", "Roanoke", "Charlottesville", "Alexandria", "Lynchburg", "Fredericksburg"]
+# Occupations and the license each holds (None: unlicensed)
+OCCUPATIONS = ["Registered Nurse", "Physician", "Paramedic", "Pharmacist", "Social Worker", "Teacher"]
+LICENSE_TYPES = ["RN", "MD", "EMT-P", "RPh", "LCSW", None]
+LANGUAGES = ["English", "English, Spanish", "English", "English, Vietnamese", "English", "English, Korean", "English, Spanish, French"]
+SKILLS = [
+    "CPR, First Aid", "Triage, IV therapy", "Mental health first aid", "Logistics, Radio operations",
+    "Vaccination clinics, Phlebotomy", "Shelter operations", "Translation, Community outreach",
+]
+ACTIVITY_TYPES = ["training", "deployment", "exercise", "community_event", "meeting"]
+FACILITY_TYPES = ["hospital", "detox", "residential", "crisis_stabilization"]
+BED_TYPES = ["general", "adolescent", "geriatric", "SUD", "detox"]
+
+
+def _steps(args, password_hash: str) -> list:
+    """(label, SQL, params) in dependency order."""
+    tenants = "(SELECT array_agg(id ORDER BY id) FROM tenants WHERE slug LIKE 'bench-%')"
+    per_volunteer = max(1, round(args.time_entries / max(args.volunteers, 1)))
+    return [
+        ("tenants", """
+            INSERT INTO tenants (name, slug, contact_email, is_active, created_at)
+            SELECT 'Bench Unit ' || g, 'bench-' || g, 'bench' || g || '@example.org', true, now()
+            FROM generate_series(1, :tenants) g
+        """, {"tenants": args.tenants}),
+        ("admins", """
+            INSERT INTO users (tenant_id, username, email, hashed_password, first_name, last_name, role, status, created_at)
+            SELECT t.id, 'bench-admin-' || substr(t.slug, 7), 'admin+' || t.slug || '@example.org', :password_hash,
+                   'Bench', 'Admin', 'org_admin', 'active', now()
+            FROM tenants t WHERE t.slug LIKE 'bench-%'
+        """, {"password_hash": password_hash}),
+        ("volunteers", f"""
+            INSERT INTO volunteers (tenant_id, username, email, first_name, last_name, city, state,
+                                    application_status, account_status, mrc_level, occupation, license_type,
+                                    license_expiration, languages, skills, total_hours, created_at)
+            SELECT t.ids[1 + g % array_length(t.ids, 1)], 'bench-v' || g, 'bench-v' || g || '@example.org',
+                   (:first_names)[1 + g % 10], (:last_names)[1 + (g / 10) % 10] || g, (:cities)[1 + (g / 13) % 8], 'VA',
+                   CASE WHEN random() < 0.8 THEN 'approved' ELSE 'pending' END, 'active', 'level_' || (1 + g % 3),
+                   (:occupations)[1 + g % 6], (:license_types)[1 + g % 6],
+                   CASE WHEN g % 6 < 5 THEN current_date + (random() * 1460)::int - 365 END,
+                   (:languages)[1 + g % 7], (:skills)[1 + (g / 3) % 7],
+                   0, now() - random() * interval '3 years'
+            FROM generate_series(1, :volunteers) g, {tenants} AS t(ids)
+        """, {
+            "volunteers": args.volunteers, "first_names": FIRST_NAMES, "last_names": LAST_NAMES, "cities": CITIES,
+            "occupations": OCCUPATIONS, "license_types": LICENSE_TYPES, "languages": LANGUAGES, "skills": SKILLS,
+        }),
+        ("events", f"""
+            INSERT INTO events (tenant_id, name, title, start_date, end_date, event_date, activity_type, status,
+                                max_volunteers, allow_self_signup, visible_to_volunteers, created_at)
+            SELECT t.ids[1 + g % array_length(t.ids, 1)], 'Bench event ' || g, 'Bench event ' || g, d, d + interval '8 hours', d,
+                   (:activity_types)[1 + g % 5], 'published', 40, true, true, now()
+            FROM generate_series(1, :events) g, {tenants} AS t(ids),
+                 LATERAL (SELECT date_trunc('hour', now()) + (g % 240 - 120) * interval '1 day' AS d) s
+        """, {"events": args.tenants * args.events_per_tenant, "activity_types": ACTIVITY_TYPES}),
+        ("shifts", """
+            INSERT INTO shifts (event_id, name, start_time, end_time, max_volunteers, allow_self_signup, created_at)
+            SELECT e.id, 'Shift ' || s, e.start_date + (s - 1) * interval '4 hours', e.start_date + s * interval '4 hours',
+                   10, true, now()
+            FROM events e JOIN tenants t ON t.id = e.tenant_id AND t.slug LIKE 'bench-%',
+                 generate_series(1, :shifts_per_event) s
+        """, {"shifts_per_event": args.shifts_per_event}),
+        # Per-tenant numbering so later steps can pick rows of the same tenant with a join
+        ("lookup tables", """
+            CREATE TEMP TABLE bench_volunteers AS
+            SELECT v.tenant_id, row_number() OVER (PARTITION BY v.tenant_id ORDER BY v.id) - 1 AS k,
+                   count(*) OVER (PARTITION BY v.tenant_id) AS n, v.id
+            FROM volunteers v WHERE v.username LIKE 'bench-v%';
+            CREATE INDEX ON bench_volunteers (tenant_id, k);
+            CREATE TEMP TABLE bench_events AS
+            SELECT e.tenant_id, row_number() OVER (PARTITION BY e.tenant_id ORDER BY e.id) - 1 AS k,
+                   count(*) OVER (PARTITION BY e.tenant_id) AS n, e.id
+            FROM events e JOIN tenants t ON t.id = e.tenant_id AND t.slug LIKE 'bench-%';
+            CREATE INDEX ON bench_events (tenant_id, k);
+            ANALYZE bench_volunteers; ANALYZE bench_events
+        """, {}),
+        ("event assignments", """
+            INSERT INTO event_assignments (event_id, shift_id, volunteer_id, status, assigned_at)
+            SELECT sh.event_id, sh.id, v.id, CASE WHEN a % 4 = 0 THEN 'pending' ELSE 'confirmed' END, now()
+            FROM shifts sh
+            JOIN events e ON e.id = sh.event_id
+            JOIN tenants t ON t.id = e.tenant_id AND t.slug LIKE 'bench-%'
+            CROSS JOIN generate_series(1, :assignments_per_shift) a
+            JOIN bench_volunteers bv0 ON bv0.tenant_id = e.tenant_id AND bv0.k = 0
+            JOIN bench_volunteers v ON v.tenant_id = e.tenant_id AND v.k = (sh.id * 7 + a) % bv0.n
+        """, {"assignments_per_shift": args.assignments_per_shift}),
+        ("time entries", """
+            INSERT INTO time_entries (tenant_id, volunteer_id, event_id, check_in_time, check_out_time,
+                                      duration_minutes, hours_decimal, entry_method, status, created_at)
+            SELECT c.tenant_id, c.volunteer_id, e.id, c.check_in, c.check_in + c.minutes * interval '1 minute',
+                   c.minutes, round(c.minutes / 60.0, 2), CASE WHEN c.s % 3 = 0 THEN 'manual' ELSE 'qr_code' END,
+                   CASE WHEN random() < :pending_share THEN 'pending' ELSE 'approved' END, c.check_in
+            FROM (
+                SELECT v.tenant_id, v.id AS volunteer_id, s,
+                       now() - random() * interval '2 years' AS check_in, 60 + (random() * 420)::int AS minutes
+                FROM bench_volunteers v CROSS JOIN generate_series(1, :per_volunteer) s
+            ) c
+            JOIN bench_events e0 ON e0.tenant_id = c.tenant_id AND e0.k = 0
+            JOIN bench_events e ON e.tenant_id = c.tenant_id AND e.k = (c.volunteer_id + c.s) % e0.n
+        """, {"per_volunteer": per_volunteer, "pending_share": args.pending_share}),
+        ("saved reports", """
+            INSERT INTO saved_reports (tenant_id, name, report_type, query_config, is_public, is_active, created_by, created_at)
+            SELECT u.tenant_id, 'Approved volunteers', 'custom', CAST(:query_config AS jsonb), true, true, u.id, now()
+            FROM users u WHERE u.username LIKE 'bench-admin-%'
+        """, {"query_config": json.dumps({
+            "entity_type": "volunteer",
+            "fields": ["id", "first_name", "last_name", "email", "application_status", "total_hours"],
+            "filters": [{"field": "application_status", "operator": "eq", "value": "approved"}],
+        })}),
+    ]
+
+
+def _bh_steps(args) -> list:
+    """Facility and bed snapshot steps; only run when the BH schema is present."""
+    tenants = "(SELECT array_agg(id ORDER BY id) FROM tenants WHERE slug LIKE 'bench-%')"
+    return [
+        ("bh facilities", f"""
+            INSERT INTO bh_facilities (tenant_id, name, facility_type, region_id, contact_phone, is_active, created_at)
+            SELECT t.ids[1 + g % array_length(t.ids, 1)], 'Bench facility ' || g, (:facility_types)[1 + g % 4],
+                   1 + g % 12, '804-555-0100', true, now()
+            FROM generate_series(1, :facilities) g, {tenants} AS t(ids)
+        """, {"facilities": args.bh_facilities, "facility_types": FACILITY_TYPES}),
+        ("bh bed snapshots", """
+            INSERT INTO bh_bed_snapshots (facility_id, bed_type, capacity_total, capacity_available, last_reported_at)
+            SELECT f.id, (:bed_types)[1 + (f.id + b) % 5], 20, (random() * 20)::int, now() - random() * interval '12 hours'
+            FROM bh_facilities f JOIN tenants t ON t.id = f.tenant_id AND t.slug LIKE 'bench-%',
+                 generate_series(1, 2) b
+        """, {"bed_types": BED_TYPES}),
+    ]
+
+
+def scaled(args):
+    """Apply --scale to the per-tenant volumes, keeping at least one row of each."""
+    for name in ("volunteers", "time_entries", "bh_facilities", "events_per_tenant"):
+        setattr(args, name, max(1, int(getattr(args, name) * args.scale)))
+    return args
+
+
+def run(args):
+    with engine.begin() as conn:
+        existing = conn.execute(text("SELECT count(*) FROM tenants WHERE slug LIKE 'bench-%'")).scalar()
+        if existing:
+            raise SystemExit(f"{existing} bench tenants already exist; use a fresh database")
+        has_bh = conn.execute(text("SELECT to_regclass('bh_facilities') IS NOT NULL")).scalar()
+    
+    steps = _steps(args, get_password_hash(args.password))
+    if args.bh_facilities and has_bh:
+        steps += _bh_steps(args)
+    elif args.bh_facilities:
+        print("bh_facilities does not exist; skipping behavioral health data")
+    
+    started = time.perf_counter()
+    # One connection so the temp tables and setseed() carry across steps
+    with engine.connect() as conn:
+        conn.execute(text("SELECT setseed(:seed)"), {"seed": args.seed})
+        for label, sql, params in steps:
+            step_started = time.perf_counter()
+            rows = 0
+            for statement in sql.split(";"):
+                if statement.strip():
+                    rows += max(conn.execute(text(statement), params).rowcount, 0)
+            conn.commit()
+            print(f"{label:<18} {rows:>10,} rows  {time.perf_counter() - step_started:7.1f} s")
+        
+        conn.execute(text("ANALYZE"))
+        conn.commit()
+    print(f"Done in {time.perf_counter() - started:.1f} s. Log in as bench-admin-1 / {args.password}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tenants", type=int, default=50)
+    parser.add_argument("--volunteers", type=int, default=200_000)
+    parser.add_argument("--events-per-tenant", type=int, default=200)
+    parser.add_argument("--shifts-per-event", type=int, default=3)
+    parser.add_argument("--assignments-per-shift", type=int, default=4)
+    parser.add_argument("--time-entries", type=int, default=5_000_000, help="Approximate; spread evenly over volunteers")
+    parser.add_argument("--pending-share", type=float, default=0.05, help="Share of time entries awaiting approval")
+    parser.add_argument("--bh-facilities", type=int, default=20_000)
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply volumes (not tenants), e.g. 0.01 for a quick run")
+    parser.add_argument("--seed", type=float, default=0.42, help="setseed() value in [-1, 1]")
+    parser.add_argument("--password", default="bench-password")
+    run(scaled(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
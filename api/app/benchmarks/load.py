@@ -0,0 +1,259 @@
+# api/app/benchmarks/load.py - End-to-end latency and throughput suite
+"""
+Drive the hot user-facing endpoints with concurrent clients and report
+p50/p95/p99 latency and requests/sec per scenario:
+
+  checkin            POST /api/v1/time-tracking/checkin (writes rows)
+  events             GET  /api/v1/events/
+  available-shifts   GET  /api/v1/scheduling/shifts/available
+  pending-approvals  GET  /api/v1/time-tracking/entries/pending
+  report-execution   POST /api/v1/reporting/reports/{id}/execute
+  bed-search         POST /api/v1/bh/facilities/search
+  volunteer-search   GET  /api/v1/volunteers/search (full text + fuzzy name)
+
+Targets:
+  --target asgi   the app in-process through httpx's ASGI transport (runs the
+                  lifespan; needs DATABASE_URL). Isolates app cost from HTTP.
+  --target http   a running server at --base-url, e.g. uvicorn with workers.
+
+Data comes from benchmarks.datagen; the suite logs in as one of its tenant
+admins. Scenarios whose endpoint answers 404 (e.g. bed search while the
+behavioral health routers are not mounted) are reported as skipped.
+
+Each run is saved as JSON in --results-dir. --compare <file> prints the change
+against an earlier run and exits 1 when a scenario's p95 regressed by more
+than --max-regression percent.
+
+Usage:
+    python -m benchmarks.load --target asgi --concurrency 20 --duration 15
+    python -m benchmarks.load --target http --base-url http://localhost:8000 \\
+        --compare benchmark_results/20250101T120000-http.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import time
+from collections import Counter
+from datetime import datetime
+
+import httpx
+
+SCENARIOS = {
+    "checkin": ("POST", "/api/v1/time-tracking/checkin"),
+    "events": ("GET", "/api/v1/events/?limit=50"),
+    "available-shifts": ("GET", "/api/v1/scheduling/shifts/available"),
+    "pending-approvals": ("GET", "/api/v1/time-tracking/entries/pending"),
+    "report-execution": ("POST", "/api/v1/reporting/reports/{report_id}/execute"),
+    "bed-search": ("POST", "/api/v1/bh/facilities/search"),
+    "volunteer-search": ("GET", "/api/v1/volunteers/search?q={q}&status=approved"),
+}
+
+# Free-text and misspelt-name queries against benchmarks.datagen volunteers
+SEARCH_QUERIES = ["spanish nurse richmond", "RN", "paramedic triage", "vietnamese", "pharmacist norfolk", "Jordn Garsia", "Quinn Moore"]
+
+
+class Fixtures:
+    """Ids from the logged-in tenant used to build request bodies."""
+    
+    def __init__(self, volunteer_ids: list, event_ids: list, report_id):
+        self.volunteer_ids = volunteer_ids
+        self.event_ids = event_ids
+        self.report_id = report_id
+    
+    def request(self, scenario: str, rng: random.Random):
+        """(method, path, json body) for one request of `scenario`."""
+        method, path = SCENARIOS[scenario]
+        if scenario == "checkin":
+            return method, path, {"volunteer_id": rng.choice(self.volunteer_ids), "event_id": rng.choice(self.event_ids)}
+        if scenario == "report-execution":
+            return method, path.format(report_id=self.report_id), {"export_format": "json"}
+        if scenario == "bed-search":
+            return method, path, {"min_available": 1}
+        if scenario == "volunteer-search":
+            return method, path.format(q=rng.choice(SEARCH_QUERIES).replace(" ", "+")), None
+        return method, path, None
+
+
+async def load_fixtures(client: httpx.AsyncClient) -> Fixtures:
+    volunteers = (await client.get("/api/v1/volunteers/", params={"limit": 500})).json()
+    events = (await client.get("/api/v1/events/", params={"limit": 200})).json()
+    reports = (await client.get("/api/v1/reporting/reports")).json()
+    return Fixtures(
+        volunteer_ids=[int(v["id"]) for v in volunteers["items"]],
+        event_ids=[int(e["id"]) for e in events],
+        report_id=reports[0]["id"] if reports else None
+    )
+
+
+async def worker(client, fixtures: Fixtures, scenario: str, rng: random.Random, deadline: float, latencies: list, statuses: Counter):
+    """Issue requests back-to-back until the deadline passes."""
+    while time.perf_counter() < deadline:
+        method, path, body = fixtures.request(scenario, rng)
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, path, json=body)
+            statuses[response.status_code] += 1
+        except httpx.HTTPError as e:
+            statuses[type(e).__name__] += 1
+        latencies.append(time.perf_counter() - started)
+
+
+def percentile(ordered: list, p: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))] * 1000 if ordered else 0.0
+
+
+async def run_scenario(client, fixtures: Fixtures, scenario: str, args) -> dict:
+    method, path, body = fixtures.request(scenario, random.Random(args.seed))
+    if scenario == "report-execution" and fixtures.report_id is None:
+        return {"skipped": "tenant has no saved reports"}
+    probe = await client.request(method, path, json=body)
+    if probe.status_code == 404:
+        return {"skipped": f"{method} {path} returned 404"}
+    
+    # Warm up connections, pools and caches before measuring
+    warmup_deadline = time.perf_counter() + args.warmup
+    await asyncio.gather(*(
+        worker(client, fixtures, scenario, random.Random(args.seed + i), warmup_deadline, [], Counter())
+        for i in range(args.concurrency)
+    ))
+    
+    latencies = []
+    statuses = Counter()
+    started = time.perf_counter()
+    deadline = started + args.duration
+    await asyncio.gather(*(
+        worker(client, fixtures, scenario, random.Random(args.seed + i), deadline, latencies, statuses)
+        for i in range(args.concurrency)
+    ))
+    elapsed = time.perf_counter() - started
+    
+    latencies.sort()
+    errors = sum(n for code, n in statuses.items() if not isinstance(code, int) or code >= 400)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50), 2),
+        "p95_ms": round(percentile(latencies, 0.95), 2),
+        "p99_ms": round(percentile(latencies, 0.99), 2),
+        "statuses": {str(code): n for code, n in sorted(statuses.items(), key=str)},
+    }
+
+
+async def run_suite(client, args) -> dict:
+    response = await client.post("/api/v1/auth/login", json={"username": args.username, "password": args.password})
+    if response.status_code != 200:
+        raise SystemExit(f"login as {args.username} failed ({response.status_code}): {response.text[:200]}")
+    client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+    fixtures = await load_fixtures(client)
+    
+    results = {}
+    for scenario in args.scenarios:
+        results[scenario] = await run_scenario(client, fixtures, scenario, args)
+        print_result(scenario, results[scenario])
+    return results
+
+
+async def run(args) -> dict:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    if args.target == "http":
+        async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+            return await run_suite(client, args)
+    
+    import main  # Imported here so --target http needs no app environment
+    
+    async with main.app.router.lifespan_context(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", limits=limits, timeout=args.timeout) as client:
+            return await run_suite(client, args)
+
+
+def print_result(scenario: str, result: dict):
+    if "skipped" in result:
+        print(f"{scenario:<18} skipped: {result['skipped']}")
+        return
+    print(
+        f"{scenario:<18} {result['rps']:8.1f} req/s  p50 {result['p50_ms']:8.1f}  p95 {result['p95_ms']:8.1f}  "
+        f"p99 {result['p99_ms']:8.1f} ms  {result['requests']:6d} reqs  {result['errors']} errors"
+    )
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(current: dict, baseline_path: str, max_regression: float) -> list:
+    """Print p95/throughput changes against a saved run; return regressed scenarios."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"\nAgainst {baseline_path} ({baseline.get('git_commit')}, {baseline.get('created_at')}):")
+    regressed = []
+    for scenario, result in current["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(scenario)
+        if "skipped" in result or not before or "skipped" in before or not before["p95_ms"]:
+            continue
+        p95_change = (result["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100
+        rps_change = (result["rps"] - before["rps"]) / before["rps"] * 100 if before["rps"] else 0.0
+        flag = ""
+        if p95_change > max_regression:
+            regressed.append(scenario)
+            flag = "  REGRESSION"
+        print(f"  {scenario:<18} p95 {before['p95_ms']:8.1f} -> {result['p95_ms']:8.1f} ms ({p95_change:+6.1f}%)  req/s {rps_change:+6.1f}%{flag}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", choices=("asgi", "http"), default="asgi")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--username", default="bench-admin-1")
+    parser.add_argument("--password", default="bench-password")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Comma-separated subset of scenarios")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=15.0, help="Measured seconds per scenario")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Unmeasured seconds per scenario")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--results-dir", default="benchmark_results")
+    parser.add_argument("--compare", help="Earlier results file to compare against")
+    parser.add_argument("--max-regression", type=float, default=20.0, help="Allowed p95 increase in percent")
+    args = parser.parse_args()
+    
+    args.scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    
+    print(f"{args.target} target, {args.concurrency} clients, {args.duration:g}s per scenario")
+    scenarios = asyncio.run(run(args))
+    
+    created_at = datetime.utcnow()
+    results = {
+        "created_at": created_at.isoformat(),
+        "git_commit": git_commit(),
+        "target": args.target,
+        "base_url": args.base_url if args.target == "http" else None,
+        "concurrency": args.concurrency,
+        "duration_seconds": args.duration,
+        "scenarios": scenarios,
+    }
+    os.makedirs(args.results_dir, exist_ok=True)
+    path = os.path.join(args.results_dir, f"{created_at:%Y%m%dT%H%M%S}-{args.target}.json")
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nSaved {path}")
+    
+    if args.compare and compare(results, args.compare, args.max_regression):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# api/app/benchmarks/serialization.py - List response serialization cost
+"""
+Time turning 1,000 ORM rows into a JSON response body, comparing:
+
+  legacy    Schema(**row.__dict__) per row, then FastAPI's response_model
+            pass (dump, validate again, jsonable) rendered by JSONResponse
+  orjson    the same, rendered by ORJSONResponse (the new default class)
+  direct    core.serialization.model_response: one from_attributes
+            validation and a pydantic-core dump_json
+
+Rows are model instances with every column populated, as if loaded from the
+database, so no database is needed.
+
+Usage:
+    python -m benchmarks.serialization --rows 1000 --iterations 50
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import List
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from sqlalchemy import inspect
+
+from core.serialization import model_response
+from models.time_tracking import TimeEntry
+from models.volunteer import Volunteer
+from schemas.time_tracking import TimeEntryResponse
+from schemas.volunteer import VolunteerListResponse
+
+
+def loaded(model, **values):
+    """Instance with unspecified columns set to None, like a fully loaded row."""
+    columns = {attr.key: None for attr in inspect(model).column_attrs}
+    return model(**{**columns, **values})
+
+
+def build_time_entries(rows: int) -> list:
+    now = datetime.utcnow()
+    return [
+        loaded(
+            TimeEntry, id=i, tenant_id=1, volunteer_id=i % 250, event_id=i % 40, shift_id=None,
+            check_in_time=now - timedelta(hours=i), check_out_time=now - timedelta(hours=i - 3),
+            duration_minutes=180, hours_decimal=Decimal("3.00"), entry_method="qr_code",
+            status="pending", volunteer_notes="Shift at POD site", created_at=now
+        )
+        for i in range(rows)
+    ]
+
+
+def build_volunteers(rows: int) -> list:
+    now = datetime.utcnow()
+    return [
+        loaded(
+            Volunteer, id=i, tenant_id=1, username=f"volunteer{i}", email=f"volunteer{i}@example.org",
+            first_name="Pat", last_name=f"Volunteer{i}", phone_primary="804-555-0100",
+            city="Richmond", state="VA", zip_code="23219", application_status="approved",
+            account_status="active", mrc_level="level_1", occupation="Nurse",
+            total_hours=Decimal("42.50"), alert_response_rate=Decimal("0.75"), created_at=now
+        )
+        for i in range(rows)
+    ]
+
+
+async def legacy(field, content, response_class):
+    body = await serialize_response(field=field, response_content=content)
+    return response_class(body).body
+
+
+def time_legacy_entries(entries, response_class) -> bytes:
+    field = create_response_field(name="response", type_=List[TimeEntryResponse])
+    content = [
+        TimeEntryResponse(**{**entry.__dict__, "hours_decimal": float(entry.hours_decimal)}, volunteer_name="Pat Volunteer")
+        for entry in entries
+    ]
+    return asyncio.run(legacy(field, content, response_class))
+
+
+def time_direct_entries(entries) -> bytes:
+    items = []
+    for entry in entries:
+        item = TimeEntryResponse.model_validate(entry)
+        item.volunteer_name = "Pat Volunteer"
+        items.append(item)
+    return model_response(List[TimeEntryResponse], items).body
+
+
+def time_legacy_volunteers(volunteers, response_class) -> bytes:
+    field = create_response_field(name="response", type_=VolunteerListResponse)
+    content = VolunteerListResponse(total=len(volunteers), items=volunteers)
+    return asyncio.run(legacy(field, content, response_class))
+
+
+def time_direct_volunteers(volunteers) -> bytes:
+    return model_response(VolunteerListResponse, {"total": len(volunteers), "items": volunteers}).body
+
+
+def measure(fn, iterations: int) -> list:
+    fn()  # Warm up adapters and validators
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def report(label: str, latencies: list, size: int):
+    ordered = sorted(latencies)
+    print(
+        f"{label:<22} mean {statistics.mean(ordered) * 1e3:7.2f} ms  "
+        f"p50 {ordered[len(ordered) // 2] * 1e3:7.2f} ms  "
+        f"body {size / 1024:7.1f} KiB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    entries = build_time_entries(args.rows)
+    volunteers = build_volunteers(args.rows)
+    cases = [
+        ("time entries legacy", lambda: time_legacy_entries(entries, JSONResponse)),
+        ("time entries orjson", lambda: time_legacy_entries(entries, ORJSONResponse)),
+        ("time entries direct", lambda: time_direct_entries(entries)),
+        ("volunteers legacy", lambda: time_legacy_volunteers(volunteers, JSONResponse)),
+        ("volunteers orjson", lambda: time_legacy_volunteers(volunteers, ORJSONResponse)),
+        ("volunteers direct", lambda: time_direct_volunteers(volunteers)),
+    ]
+    print(f"{args.rows} rows, {args.iterations} iterations")
+    for label, fn in cases:
+        report(label, measure(fn, args.iterations), len(fn()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# api/app/benchmarks/startup.py - API worker import time
+"""
+Measure how long `import main` takes in a fresh interpreter, using
+`python -X importtime`, and fail when a heavy module that should only be
+imported on first use (pandas, openpyxl, boto3, ...) is loaded at startup
+or the median import time exceeds a budget. Meant to run in CI.
+
+Needs the same environment as the API (DATABASE_URL etc.); no database
+connection is made.
+
+Usage:
+    python -m benchmarks.startup --runs 5 --budget-ms 3000
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_FORBIDDEN = "pandas,openpyxl,boto3,botocore"
+
+
+def import_profile() -> list:
+    """(self_us, cumulative_us, module) for every module `import main` loads."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=APP_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"import main failed:\n{result.stderr[-2000:]}")
+    
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="Slowest top-level imports to list")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail if the median exceeds this")
+    parser.add_argument("--forbid", default=DEFAULT_FORBIDDEN, help="Comma-separated modules that must not load")
+    args = parser.parse_args()
+    
+    totals = []
+    profile = []
+    for _ in range(args.runs):
+        profile = import_profile()
+        totals.append(next(cumulative for _, cumulative, name in profile if name.strip() == "main"))
+    
+    median_ms = statistics.median(totals) / 1000
+    print(f"import main: median {median_ms:.0f} ms, min {min(totals) / 1000:.0f} ms over {args.runs} runs")
+    print("\nSlowest imports (cumulative, last run):")
+    # Direct children of main are indented by three spaces
+    children = [(cumulative, name.strip()) for _, cumulative, name in profile if name.startswith("   ") and not name.startswith("    ")]
+    for cumulative, name in sorted(children, reverse=True)[:args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+    
+    failures = []
+    forbidden = {name.strip() for name in args.forbid.split(",") if name.strip()}
+    loaded = sorted({name.strip() for _, _, name in profile} & forbidden)
+    if loaded:
+        failures.append(f"heavy modules imported at startup: {', '.join(loaded)}")
+    if args.budget_ms is not None and median_ms > args.budget_ms:
+        failures.append(f"median import time {median_ms:.0f} ms exceeds budget {args.budget_ms:.0f} ms")
+    
+    for failure in failures:
+        print(f"\nFAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
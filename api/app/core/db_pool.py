@@ -0,0 +1,104 @@
+"""
+Connection pool instrumentation.
+Wraps SQLAlchemy's queue pools to record how long requests wait for a
+connection, so pool sizing can be based on numbers instead of guesses.
+"""
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Checkouts that wait longer than this count as "slow" in the stats
+SLOW_WAIT_SECONDS = 0.1
+
+
+class PoolStats:
+    """Cumulative checkout wait counters for a single pool."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.slow_waits = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        # Optional callable(waited, timed_out), set by core.metrics.instrument_pool
+        self.observer = None
+    
+    def record(self, waited: float, timed_out: bool = False):
+        """Record one checkout attempt and how long it waited."""
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            if waited >= SLOW_WAIT_SECONDS:
+                self.slow_waits += 1
+            self.wait_total += waited
+            if waited > self.wait_max:
+                self.wait_max = waited
+        if self.observer is not None:
+            self.observer(waited, timed_out)
+    
+    def as_dict(self) -> dict:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts_total": self.checkouts,
+                "timeouts_total": self.timeouts,
+                "slow_waits_total": self.slow_waits,
+                "wait_time_total_ms": round(self.wait_total * 1000, 2),
+                "wait_time_avg_ms": round(self.wait_total * 1000 / attempts, 3) if attempts else 0.0,
+                "wait_time_max_ms": round(self.wait_max * 1000, 2),
+            }
+
+
+class _InstrumentedPoolMixin:
+    """Times every connection checkout, including ones that time out."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+    
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.stats.record(time.perf_counter() - started)
+        return connection
+    
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep the counters running
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool for the sync engine with checkout wait stats."""
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """Async-adapted QueuePool for the asyncpg engine with checkout wait stats."""
+
+
+def pool_status(pool) -> dict:
+    """Point-in-time occupancy plus cumulative wait stats for a pool."""
+    status = {
+        "pool_class": type(pool).__name__,
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        # QueuePool reports negative overflow until the base pool is filled
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+        "timeout_seconds": pool.timeout(),
+    }
+    stats = getattr(pool, "stats", None)
+    if stats is not None:
+        status.update(stats.as_dict())
+    return status
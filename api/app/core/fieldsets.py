@@ -0,0 +1,44 @@
+"""
+Sparse fieldsets for large list endpoints.
+`?fields=id,first_name,last_name` limits each item to those fields of the
+endpoint's response schema, and the SQL query loads only the matching columns.
+"""
+from typing import Iterable, Optional, Type
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only
+
+
+class InvalidFields(ValueError):
+    """Raised when `fields` names something the response schema does not have."""
+
+
+def parse_fields(fields: Optional[str], schema: Type[BaseModel], always: Iterable[str] = ("id",)) -> Optional[list]:
+    """
+    Requested field names, validated against `schema`, with `always` first.
+    None means the full representation was requested.
+    """
+    if not fields:
+        return None
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in schema.model_fields]
+    if unknown:
+        raise InvalidFields(f"Unknown fields: {', '.join(unknown)}")
+    return list(dict.fromkeys([*always, *names]))
+
+
+def load_columns(entity, names: Iterable[str]):
+    """
+    load_only() option for the requested names that are mapped columns of
+    `entity`; the rest (computed fields) are left to the caller.
+    """
+    columns = inspect(entity).column_attrs
+    return load_only(*[getattr(entity, name) for name in names if name in columns])
+
+
+def pick(source, names: Iterable[str]) -> dict:
+    """The requested fields of an ORM object or dict."""
+    if isinstance(source, dict):
+        return {name: source.get(name) for name in names}
+    return {name: getattr(source, name, None) for name in names}
@@ -0,0 +1,145 @@
+"""
+Prometheus metrics, exposed at /metrics.
+Request latency histograms and status counters per route template, in-flight
+requests, connection pool usage and a few business counters (check-ins,
+report exports, TRAIN sync records).
+
+Each worker aggregates in process; recording a sample is a dict lookup and a
+locked add. With several uvicorn workers set PROMETHEUS_MULTIPROC_DIR to an
+empty directory (wiped before the server starts): every worker then keeps its
+values in mmap'd files there and a scrape of any worker sums all of them.
+Without it, /metrics reports only the worker that served the scrape.
+"""
+import os
+import time
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+from sqlalchemy import event
+
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+# Label for requests that matched no route, so unknown paths can't create new series
+UNMATCHED_ROUTE = "<unmatched>"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+HTTP_REQUESTS = Counter(
+    "http_requests", "HTTP requests by route template and status code",
+    ["method", "route", "status"]
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template",
+    ["method", "route"], buckets=LATENCY_BUCKETS
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "HTTP requests currently being handled",
+    ["method"], multiprocess_mode="livesum"
+)
+
+DB_POOL_SIZE = Gauge(
+    "db_pool_size", "Configured connection pool size (excluding overflow)",
+    ["engine"], multiprocess_mode="livesum"
+)
+DB_POOL_CONNECTIONS_IN_USE = Gauge(
+    "db_pool_connections_in_use", "Connections currently checked out of the pool",
+    ["engine"], multiprocess_mode="livesum"
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection",
+    ["engine"], buckets=POOL_WAIT_BUCKETS
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts", "Checkouts that gave up after pool_timeout",
+    ["engine"]
+)
+
+VOLUNTEER_CHECKINS = Counter(
+    "volunteer_checkins", "Volunteer check-ins by entry method",
+    ["entry_method"]
+)
+REPORT_EXPORTS = Counter(
+    "report_exports", "Report export files generated, by format and outcome",
+    ["format", "status"]
+)
+TRAIN_SYNC_RECORDS = Counter(
+    "train_sync_records", "Training records received from TRAIN: created, updated or skipped",
+    ["outcome"]
+)
+TRAIN_SYNC_ERRORS = Counter(
+    "train_sync_errors", "Volunteers whose TRAIN sync failed"
+)
+
+
+def render_metrics() -> bytes:
+    """Text exposition of every metric, summed across workers in multiprocess mode."""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+
+def mark_worker_dead():
+    """Drop this worker's live gauges (in-flight requests, pool usage) on shutdown."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def instrument_pool(engine, name: str):
+    """Report size, connections in use and checkout waits of `engine`'s pool."""
+    pool = engine.pool
+    DB_POOL_SIZE.labels(name).set(pool.size())
+    
+    in_use = DB_POOL_CONNECTIONS_IN_USE.labels(name)
+    event.listen(engine, "checkout", lambda *args: in_use.inc())
+    event.listen(engine, "checkin", lambda *args: in_use.dec())
+    
+    stats = getattr(pool, "stats", None)
+    if stats is not None:
+        wait = DB_POOL_CHECKOUT_WAIT.labels(name)
+        timeouts = DB_POOL_CHECKOUT_TIMEOUTS.labels(name)
+        
+        def observe(waited: float, timed_out: bool):
+            wait.observe(waited)
+            if timed_out:
+                timeouts.inc()
+        
+        stats.observer = observe
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency, status and in-flight count for every
+    HTTP request. Routes are labelled by their template (/api/v1/volunteers/{volunteer_id}),
+    read from the scope after routing, never by the raw path.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        method = scope["method"]
+        status_code = 500
+        
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_progress.dec()
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            HTTP_REQUEST_DURATION.labels(method, route).observe(elapsed)
+            HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
@@ -2,7 +2,8 @@
 Permission checking utilities for role-based access control.
 Implements the permission model from requirements.
 """
-from typing import List
+from functools import lru_cache
+from typing import List, Optional
 from models.user import UserRole
 
 
@@ -126,7 +127,72 @@ ROLE_PERMISSIONS: dict[UserRole, List[str]] = {
 }
 
 
-def has_permission(user_role: UserRole, permission: str, user_permissions: dict = None) -> bool:
+# =============== Compiled permission masks ===============
+# Each permission gets one bit, in declaration order above. Masks are embedded
+# in JWTs, so only ever append new permissions to the end of Permission.
+PERMISSION_BITS: dict[str, int] = {
+    value: 1 << index
+    for index, value in enumerate(
+        value for name, value in vars(Permission).items() if not name.startswith("_")
+    )
+}
+
+ROLE_MASKS: dict[UserRole, int] = {
+    role: sum(PERMISSION_BITS[permission] for permission in set(permissions))
+    for role, permissions in ROLE_PERMISSIONS.items()
+}
+
+# Sub-unit staff flags on User that grant an extra permission
+SUB_UNIT_FLAG_PERMISSIONS: dict[str, str] = {
+    "can_edit_data": Permission.EDIT_VOLUNTEERS,
+    "can_edit_alerts": Permission.SEND_ALERTS,
+    "can_initiate_transfers": Permission.INITIATE_TRANSFERS,
+    "can_approve_transfers": Permission.APPROVE_TRANSFERS,
+    "can_export_data": Permission.EXPORT_DATA,
+}
+
+
+def compute_permission_mask(user_role: UserRole, user_permissions: dict = None) -> int:
+    """
+    Effective permission mask for a role plus sub-unit staff flags.
+    
+    Args:
+        user_role: User's role
+        user_permissions: Optional dict of user-specific can_* flags (for sub-unit staff)
+        
+    Returns:
+        Integer bitmask of granted permissions
+    """
+    mask = ROLE_MASKS.get(user_role, 0)
+    
+    if user_role == UserRole.SUB_UNIT_STAFF and user_permissions:
+        for flag, permission in SUB_UNIT_FLAG_PERMISSIONS.items():
+            if user_permissions.get(flag):
+                mask |= PERMISSION_BITS[permission]
+    
+    return mask
+
+
+def user_permission_mask(user) -> int:
+    """Effective permission mask for a User (or any object with role and can_* attributes)."""
+    return compute_permission_mask(
+        user.role,
+        {flag: getattr(user, flag, False) for flag in SUB_UNIT_FLAG_PERMISSIONS}
+    )
+
+
+def mask_has_permission(mask: int, permission: str) -> bool:
+    """O(1) check of a single permission against a compiled mask."""
+    return bool(mask & PERMISSION_BITS.get(permission, 0))
+
+
+@lru_cache(maxsize=256)
+def mask_permissions(mask: int) -> tuple:
+    """Permission names set in a mask, in declaration order."""
+    return tuple(permission for permission, bit in PERMISSION_BITS.items() if mask & bit)
+
+
+def has_permission(user_role: UserRole, permission: str, user_permissions: dict = None, mask: Optional[int] = None) -> bool:
     """
     Check if a user role has a specific permission.
     
@@ -134,54 +200,28 @@ def has_permission(user_role: UserRole, permission: str, user_permissions: dict
         user_role: User's role
         permission: Permission to check
         user_permissions: Optional dict of user-specific permissions (for sub-unit staff)
+        mask: Optional precompiled mask; when given, role and flags are not consulted
         
     Returns:
         True if user has permission, False otherwise
     """
-    # Get base permissions for role
-    base_permissions = ROLE_PERMISSIONS.get(user_role, [])
-    
-    if permission in base_permissions:
-        return True
-    
-    # Check user-specific permissions for sub-unit staff
-    if user_role == UserRole.SUB_UNIT_STAFF and user_permissions:
-        permission_map = {
-            Permission.EDIT_VOLUNTEERS: user_permissions.get("can_edit_data", False),
-            Permission.SEND_ALERTS: user_permissions.get("can_edit_alerts", False),
-            Permission.INITIATE_TRANSFERS: user_permissions.get("can_initiate_transfers", False),
-            Permission.APPROVE_TRANSFERS: user_permissions.get("can_approve_transfers", False),
-            Permission.EXPORT_DATA: user_permissions.get("can_export_data", False),
-        }
-        return permission_map.get(permission, False)
-    
-    return False
+    if mask is None:
+        mask = compute_permission_mask(user_role, user_permissions)
+    return mask_has_permission(mask, permission)
 
 
-def get_user_permissions(user_role: UserRole, user_permissions: dict = None) -> List[str]:
+def get_user_permissions(user_role: UserRole, user_permissions: dict = None, mask: Optional[int] = None) -> List[str]:
     """
     Get all permissions for a user.
     
     Args:
         user_role: User's role
         user_permissions: Optional dict of user-specific permissions
+        mask: Optional precompiled mask; when given, role and flags are not consulted
         
     Returns:
         List of permission strings
     """
-    permissions = ROLE_PERMISSIONS.get(user_role, []).copy()
-    
-    # Add user-specific permissions for sub-unit staff
-    if user_role == UserRole.SUB_UNIT_STAFF and user_permissions:
-        if user_permissions.get("can_edit_data"):
-            permissions.append(Permission.EDIT_VOLUNTEERS)
-        if user_permissions.get("can_edit_alerts"):
-            permissions.append(Permission.SEND_ALERTS)
-        if user_permissions.get("can_initiate_transfers"):
-            permissions.append(Permission.INITIATE_TRANSFERS)
-        if user_permissions.get("can_approve_transfers"):
-            permissions.append(Permission.APPROVE_TRANSFERS)
-        if user_permissions.get("can_export_data"):
-            permissions.append(Permission.EXPORT_DATA)
-    
-    return permissions
+    if mask is None:
+        mask = compute_permission_mask(user_role, user_permissions)
+    return list(mask_permissions(mask))
@@ -0,0 +1,66 @@
+"""
+Authenticated-principal cache.
+Keeps a column snapshot of recently seen users so get_current_user can skip
+the users-table lookup. Entries are evicted whenever a User row is updated or
+deleted through the ORM, and can be dropped explicitly with
+invalidate_principal() after raw SQL changes. The TTL bounds staleness across
+worker processes, which do not share the cache.
+"""
+from typing import Optional
+
+from sqlalchemy import event, inspect
+
+from config import get_settings
+from core.cache import TTLCache
+from core.permissions import user_permission_mask
+from models.user import User
+
+settings = get_settings()
+
+# Secrets are never held in the cache
+_EXCLUDED_COLUMNS = {"hashed_password", "mfa_secret"}
+_CACHED_COLUMNS = tuple(
+    attr.key for attr in inspect(User).column_attrs if attr.key not in _EXCLUDED_COLUMNS
+)
+
+principal_cache = TTLCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+
+def get_cached_principal(user_id: int) -> Optional[User]:
+    """
+    Return a detached User built from the cached snapshot, or None on a miss.
+    The instance is never attached to a session, so relationships are not loaded.
+    """
+    entry = principal_cache.get(user_id)
+    if entry is None:
+        return None
+    snapshot, permission_mask = entry
+    user = User(**snapshot)
+    user.permission_mask = permission_mask
+    return user
+
+
+def cache_principal(user: User):
+    """
+    Compile the user's permission mask onto it (user.permission_mask) and
+    snapshot its columns into the cache.
+    """
+    user.permission_mask = user_permission_mask(user)
+    principal_cache.set(
+        user.id,
+        ({key: getattr(user, key) for key in _CACHED_COLUMNS}, user.permission_mask)
+    )
+
+
+def invalidate_principal(user_id: int):
+    """Drop a user from the cache, e.g. after changing status or permissions."""
+    principal_cache.invalidate(user_id)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _evict_changed_user(mapper, connection, target):
+    invalidate_principal(target.id)
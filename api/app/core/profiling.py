@@ -0,0 +1,339 @@
+"""
+Sampling request profiler.
+A request is profiled when a system admin sends `X-Profile: 1`, or at random
+for PROFILE_SAMPLE_RATE of traffic. While a profiled request is in flight a
+background thread samples Python stacks every PROFILE_INTERVAL_MS and charges
+each sample to the request that owns it:
+
+- the event loop thread, while the request's task is the one running;
+- threadpool workers running the request's sync endpoint or dependencies,
+  recognised by the contextvars Context anyio runs them in;
+- otherwise the request's suspended coroutine chain, ending in [await], so
+  time spent waiting on asyncpg or the network shows up as well.
+
+Profiles are written to PROFILE_DIR as collapsed stacks (`a;b;c 12` lines, the
+input format of flamegraph.pl and speedscope) next to a JSON file tagged with
+route template, tenant, status and duration.
+"""
+import asyncio
+import json
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextvars import Context, ContextVar
+from datetime import datetime
+from typing import Optional
+
+from jose import JWTError
+from starlette.datastructures import Headers, MutableHeaders
+
+from config import get_settings
+from core.request_context import current_request_context
+from core.security import decode_token
+from models.user import UserRole
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-ID"
+
+_PROFILE_ID = re.compile(r"^\d{8}T\d{6}-[0-9a-f]{8}$")
+
+_profile_session: ContextVar[Optional["ProfileSession"]] = ContextVar("profile_session", default=None)
+
+
+def _frame_name(frame) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_qualname}"
+
+
+def _thread_stack(frame) -> list:
+    """Frame names from the outermost call down to `frame`."""
+    names = []
+    while frame is not None:
+        names.append(_frame_name(frame))
+        frame = frame.f_back
+    names.reverse()
+    return names
+
+
+def _worker_stack(frame):
+    """
+    (stack, Context) for an anyio threadpool worker, or (None, None) for any
+    other thread. The stack starts at the function the worker was given.
+    """
+    names = []
+    while frame is not None:
+        if frame.f_code.co_name == "run" and frame.f_globals.get("__name__", "").startswith("anyio."):
+            context = frame.f_locals.get("context")
+            if isinstance(context, Context):
+                names.reverse()
+                return names, context
+            return None, None
+        names.append(_frame_name(frame))
+        frame = frame.f_back
+    return None, None
+
+
+def _await_stack(task) -> list:
+    """Suspended coroutine chain of `task`, outermost first."""
+    names = []
+    coro = task.get_coro()
+    while coro is not None:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None) or getattr(coro, "ag_frame", None)
+        if frame is None:
+            break
+        names.append(_frame_name(frame))
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None) or getattr(coro, "ag_await", None)
+    names.append("[await]")
+    return names
+
+
+class ProfileSession:
+    """Stack samples collected for one request."""
+    
+    __slots__ = ("profile_id", "trigger", "task", "loop", "thread_id", "samples")
+    
+    def __init__(self, trigger: str):
+        self.profile_id = f"{datetime.utcnow():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+        self.trigger = trigger
+        self.task = asyncio.current_task()
+        self.loop = asyncio.get_running_loop()
+        self.thread_id = threading.get_ident()
+        self.samples = Counter()
+    
+    def add(self, stack: list):
+        self.samples[";".join(stack)] += 1
+
+
+class StackSampler:
+    """
+    Process-wide sampling thread. It only runs while at least one session is
+    active, so unprofiled traffic pays nothing.
+    """
+    
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self._sessions: set = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self, session: ProfileSession):
+        with self._lock:
+            self._sessions.add(session)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+    
+    def stop(self, session: ProfileSession):
+        with self._lock:
+            self._sessions.discard(session)
+    
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._sessions:
+                    self._thread = None
+                    return
+                sessions = list(self._sessions)
+            self._sample(sessions)
+            time.sleep(self.interval_seconds)
+    
+    def _sample(self, sessions: list):
+        frames = sys._current_frames()
+        loop_threads = {session.thread_id for session in sessions}
+        charged = set()
+        
+        for session in sessions:
+            frame = frames.get(session.thread_id)
+            if frame is not None and asyncio.current_task(session.loop) is session.task:
+                session.add(_thread_stack(frame))
+                charged.add(session)
+        
+        own_thread = threading.get_ident()
+        for thread_id, frame in frames.items():
+            if thread_id == own_thread or thread_id in loop_threads:
+                continue
+            stack, context = _worker_stack(frame)
+            if context is None:
+                continue
+            session = context.get(_profile_session)
+            if session is not None and session in sessions:
+                session.add(stack)
+                charged.add(session)
+        
+        for session in sessions:
+            if session not in charged and not session.task.done():
+                session.add(_await_stack(session.task))
+
+
+class ProfileStore:
+    """Collapsed-stack files plus JSON tags in one directory, newest max_files kept."""
+    
+    def __init__(self, directory: str, max_files: int):
+        self.directory = directory
+        self.max_files = max_files
+    
+    def save(self, tags: dict, samples: Counter):
+        os.makedirs(self.directory, exist_ok=True)
+        base = os.path.join(self.directory, tags["profile_id"])
+        with open(base + ".collapsed", "w") as f:
+            for stack, count in samples.most_common():
+                f.write(f"{stack} {count}\n")
+        with open(base + ".json", "w") as f:
+            json.dump(tags, f)
+        self._prune()
+    
+    def _prune(self):
+        names = sorted(name[:-5] for name in os.listdir(self.directory) if name.endswith(".json"))
+        for profile_id in names[:max(len(names) - self.max_files, 0)]:
+            for suffix in (".json", ".collapsed"):
+                try:
+                    os.remove(os.path.join(self.directory, profile_id + suffix))
+                except FileNotFoundError:
+                    pass
+    
+    def list(self, limit: int = 20, route: Optional[str] = None, tenant_id: Optional[int] = None) -> list:
+        """Tags of stored profiles, slowest first."""
+        if not os.path.isdir(self.directory):
+            return []
+        profiles = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.directory, name)) as f:
+                    tags = json.load(f)
+            except (OSError, ValueError):
+                continue  # Pruned or half-written
+            if route is not None and tags.get("route") != route:
+                continue
+            if tenant_id is not None and tags.get("tenant_id") != tenant_id:
+                continue
+            profiles.append(tags)
+        profiles.sort(key=lambda tags: tags["duration_ms"], reverse=True)
+        return profiles[:limit]
+    
+    def collapsed(self, profile_id: str) -> Optional[str]:
+        """Collapsed stacks of a stored profile, or None if unknown."""
+        if not _PROFILE_ID.match(profile_id):
+            return None
+        try:
+            with open(os.path.join(self.directory, profile_id + ".collapsed")) as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+
+profile_store = ProfileStore(settings.PROFILE_DIR, settings.PROFILE_MAX_FILES)
+
+
+def _claims_system_admin(headers: Headers) -> bool:
+    """
+    Cheap pre-check before sampling starts: the bearer token is a valid access
+    token for a system admin. The principal recorded for the request is still
+    checked before a profile is kept.
+    """
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    try:
+        payload = decode_token(token.strip())
+    except JWTError:
+        return False
+    return payload.get("type") == "access" and payload.get("role") == UserRole.SYSTEM_ADMIN.value
+
+
+def _log_save_failure(future):
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Saving profile failed: %s", future.exception())
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware that samples requests sent with X-Profile: 1 or picked at
+    sample_rate, and stores the result in profile_store. Must run inside
+    RequestContextMiddleware: the principal recorded there decides whether a
+    header-triggered profile is kept (system admins only). The header is
+    ignored unless the request carries a system admin's token, and at most
+    max_header_sessions header-triggered requests are sampled at once.
+    """
+    
+    def __init__(self, app, interval_ms: float = 5.0, sample_rate: float = 0.0, max_header_sessions: int = 2):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.max_header_sessions = max_header_sessions
+        self.header_sessions = 0
+        self.sampler = StackSampler(interval_ms / 1000)
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        headers = Headers(scope=scope)
+        requested = (
+            headers.get(PROFILE_HEADER, "").lower() in ("1", "true")
+            and self.header_sessions < self.max_header_sessions
+            and _claims_system_admin(headers)
+        )
+        if not requested and not (self.sample_rate > 0 and random.random() < self.sample_rate):
+            await self.app(scope, receive, send)
+            return
+        
+        session = ProfileSession("header" if requested else "sampled")
+        token = _profile_session.set(session)
+        status_code = 500
+        
+        def allowed() -> bool:
+            if not requested:
+                return True
+            context = current_request_context()
+            return context is not None and context.user_role == UserRole.SYSTEM_ADMIN.value
+        
+        async def send_with_profile_id(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if allowed():
+                    MutableHeaders(scope=message).append(PROFILE_ID_HEADER, session.profile_id)
+            await send(message)
+        
+        if requested:
+            self.header_sessions += 1
+        started = time.perf_counter()
+        self.sampler.start(session)
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            self.sampler.stop(session)
+            if requested:
+                self.header_sessions -= 1
+            duration = time.perf_counter() - started
+            _profile_session.reset(token)
+            if allowed() and session.samples:
+                context = current_request_context()
+                tags = {
+                    "profile_id": session.profile_id,
+                    "trigger": session.trigger,
+                    "method": scope["method"],
+                    "route": getattr(scope.get("route"), "path", None),
+                    "path": scope["path"],
+                    "status": status_code,
+                    "duration_ms": round(duration * 1000, 2),
+                    "samples": sum(session.samples.values()),
+                    "interval_ms": self.sampler.interval_seconds * 1000,
+                    "request_id": context.request_id if context else None,
+                    "tenant_id": context.tenant_id if context else None,
+                    "user_id": context.user_id if context else None,
+                    "captured_at": datetime.utcnow().isoformat(),
+                }
+                # File writes go to the default executor, off the event loop
+                saved = session.loop.run_in_executor(None, profile_store.save, tags, session.samples)
+                saved.add_done_callback(_log_save_failure)
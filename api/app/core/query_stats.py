@@ -0,0 +1,109 @@
+"""
+Per-request database query accounting.
+Counts statements and DB time for each request through SQLAlchemy cursor
+events, and flags statements repeated within one request (N+1 patterns).
+"""
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = "X-DB-Queries"
+QUERY_TIME_HEADER = "X-DB-Time-ms"
+
+
+class QueryStats:
+    """Statement count, DB time and per-statement repeats for one request."""
+    
+    __slots__ = ("count", "duration", "statements")
+    
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+    
+    def repeated(self, threshold: int) -> list:
+        """Statements executed at least `threshold` times, most frequent first."""
+        return [(sql, n) for sql, n in self.statements.most_common() if n >= threshold]
+
+
+_request_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Stats for the request being handled, or None outside a request."""
+    return _request_stats.get()
+
+
+# Registered on the Engine class so the sync, async and replica engines are all covered
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _request_stats.get() is not None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _request_stats.get()
+    started = conn.info.get("query_started_at")
+    if stats is None or not started:
+        return
+    stats.count += 1
+    stats.duration += time.perf_counter() - started.pop()
+    stats.statements[statement] += 1
+
+
+class QueryStatsMiddleware:
+    """
+    ASGI middleware that collects QueryStats for every HTTP request.
+    Optionally adds X-DB-Queries / X-DB-Time-ms response headers and logs a
+    warning when one statement runs n_plus_one_threshold or more times.
+    """
+    
+    def __init__(self, app, emit_headers: bool = False, n_plus_one_threshold: int = 5):
+        self.app = app
+        self.emit_headers = emit_headers
+        self.n_plus_one_threshold = n_plus_one_threshold
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        stats = QueryStats()
+        token = _request_stats.set(stats)
+        
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append(QUERY_COUNT_HEADER, str(stats.count))
+                headers.append(QUERY_TIME_HEADER, f"{stats.duration * 1000:.2f}")
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_headers if self.emit_headers else send)
+        finally:
+            _request_stats.reset(token)
+            if self.n_plus_one_threshold and stats.count >= self.n_plus_one_threshold:
+                self._warn_repeated(scope, stats)
+    
+    def _warn_repeated(self, scope, stats: QueryStats):
+        route = scope.get("route")
+        path = getattr(route, "path", scope.get("path"))
+        for statement, times in stats.repeated(self.n_plus_one_threshold):
+            logger.warning(
+                "Possible N+1: statement ran %d times in %s %s (%d queries, %.1f ms total): %s",
+                times,
+                scope.get("method"),
+                path,
+                stats.count,
+                stats.duration * 1000,
+                " ".join(statement.split())[:300]
+            )
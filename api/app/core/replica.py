@@ -0,0 +1,74 @@
+"""
+Read replica health tracking.
+Decides whether read-only sessions may use the replica, based on a cached
+reachability and replication lag check.
+"""
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import text
+
+# Replay lag in seconds. A standby that has replayed everything it received
+# reports 0 even if the primary has been idle, and a non-standby reports 0.
+REPLICATION_LAG_SQL = text("""
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+class ReplicaHealth:
+    """
+    Cached view of whether the replica is usable.
+    The check runs at most once per interval; concurrent callers reuse the
+    last result instead of queueing behind a slow or unreachable replica.
+    """
+    
+    def __init__(self, engine, max_lag_seconds: float, check_interval_seconds: float):
+        self.engine = engine
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.lag_seconds: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._usable = False
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+    
+    def is_usable(self) -> bool:
+        """True when the replica answered recently and lag is within tolerance."""
+        if time.monotonic() >= self._next_check and self._lock.acquire(blocking=False):
+            try:
+                self._check()
+            finally:
+                self._lock.release()
+        return self._usable
+    
+    def mark_failed(self, error: Exception):
+        """Route reads to the primary until the next successful check."""
+        self._usable = False
+        self.last_error = str(error)
+        self._next_check = time.monotonic() + self.check_interval_seconds
+    
+    def _check(self):
+        try:
+            with self.engine.connect() as conn:
+                lag = float(conn.execute(REPLICATION_LAG_SQL).scalar() or 0)
+        except Exception as e:
+            self.lag_seconds = None
+            self.mark_failed(e)
+            return
+        
+        self.lag_seconds = lag
+        self.last_error = None
+        self._usable = lag <= self.max_lag_seconds
+        self._next_check = time.monotonic() + self.check_interval_seconds
+    
+    def as_dict(self) -> dict:
+        return {
+            "usable": self._usable,
+            "lag_seconds": self.lag_seconds,
+            "max_lag_seconds": self.max_lag_seconds,
+            "last_error": self.last_error,
+        }
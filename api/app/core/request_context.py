@@ -0,0 +1,132 @@
+"""
+Per-request context (endpoint, method, client IP, user agent, request id, and
+the authenticated principal once get_current_user has run).
+Captured once by RequestContextMiddleware and read anywhere in the request,
+including threadpool endpoints, through current_request_context().
+"""
+import ipaddress
+import logging
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Iterable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+access_logger = logging.getLogger("api.access")
+
+
+class RequestContext:
+    """Request attributes recorded alongside audit entries and logs."""
+    
+    __slots__ = ("request_id", "endpoint", "http_method", "ip_address", "user_agent", "user_id", "tenant_id", "user_role")
+    
+    def __init__(self, request_id: str, endpoint: str, http_method: str, ip_address: Optional[str], user_agent: Optional[str]):
+        self.request_id = request_id
+        self.endpoint = endpoint
+        self.http_method = http_method
+        self.ip_address = ip_address
+        self.user_agent = user_agent
+        self.user_id: Optional[int] = None
+        self.tenant_id: Optional[int] = None
+        self.user_role: Optional[str] = None
+    
+    def set_principal(self, user):
+        """Record the authenticated user; set by get_current_user."""
+        self.user_id = user.id
+        self.tenant_id = user.tenant_id
+        self.user_role = getattr(user.role, "value", user.role)
+
+
+_request_context: ContextVar[Optional[RequestContext]] = ContextVar("request_context", default=None)
+
+
+def current_request_context() -> Optional[RequestContext]:
+    """Context of the request being handled, or None outside a request."""
+    return _request_context.get()
+
+
+def _is_trusted(address: str, trusted_proxies: tuple) -> bool:
+    try:
+        ip = ipaddress.ip_address(address.strip())
+    except ValueError:
+        return False
+    return any(ip in network for network in trusted_proxies)
+
+
+def _client_ip(scope, headers: Headers, trusted_proxies: tuple = ()) -> Optional[str]:
+    """
+    Client address for audit rows. X-Forwarded-For is only honoured when the
+    peer is a trusted proxy, and then read right to left: each proxy appends
+    the address it saw, so the rightmost hop that is not a trusted proxy is the
+    first one a client could not have forged.
+    """
+    client = scope.get("client")
+    peer = client[0] if client else None
+    forwarded = headers.get("x-forwarded-for")
+    if not forwarded or peer is None or not _is_trusted(peer, trusted_proxies):
+        return peer
+    hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted(hop, trusted_proxies):
+            return hop[:45]
+    # Every hop is a trusted proxy; the leftmost is the closest to the client
+    return hops[0][:45] if hops else peer
+
+
+class RequestContextMiddleware:
+    """
+    ASGI middleware that stores a RequestContext for every HTTP request and
+    echoes the request id back in X-Request-ID. With access_log it also logs
+    one "request completed" record per request with status and latency.
+    trusted_proxies lists the addresses or CIDR ranges (e.g. Caddy's network)
+    whose X-Forwarded-For header is believed.
+    """
+    
+    def __init__(self, app, access_log: bool = False, trusted_proxies: Iterable[str] = ()):
+        self.app = app
+        self.access_log = access_log
+        self.trusted_proxies = tuple(ipaddress.ip_network(proxy, strict=False) for proxy in trusted_proxies)
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        headers = Headers(scope=scope)
+        user_agent = headers.get("user-agent")
+        context = RequestContext(
+            request_id=(headers.get(REQUEST_ID_HEADER) or uuid.uuid4().hex)[:64],
+            endpoint=scope["path"][:255],
+            http_method=scope["method"],
+            ip_address=_client_ip(scope, headers, self.trusted_proxies),
+            user_agent=user_agent[:255] if user_agent else None
+        )
+        token = _request_context.set(context)
+        status_code = 500
+        
+        async def send_with_request_id(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append(REQUEST_ID_HEADER, context.request_id)
+            await send(message)
+        
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            if self.access_log:
+                access_logger.info(
+                    "request completed",
+                    extra={
+                        "method": context.http_method,
+                        "route": getattr(scope.get("route"), "path", None),
+                        "path": context.endpoint,
+                        "status": status_code,
+                        "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                    }
+                )
+            _request_context.reset(token)
@@ -3,11 +3,19 @@ Security utilities for authentication and authorization.
 Implements JWT tokens and password hashing (bcrypt) and token handling (JWT).
 FIXED: Ensures 'sub' claim is always a string for JWT compliance.
 """
+import asyncio
+import hashlib
+import multiprocessing
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from jose import JWTError, jwt
 import bcrypt
 from config import get_settings
+from core.cache import TTLCache
 
 settings = get_settings()
 
@@ -15,12 +23,12 @@ settings = get_settings()
 # Password Hashing
 # ------------------------
 
-def get_password_hash(password: str) -> str:
+def get_password_hash(password: str, rounds: Optional[int] = None) -> str:
     """
     Hash a password using bcrypt.
-    Output format: $2b$12$<salt+hash>
+    Output format: $2b$<rounds>$<salt+hash>
     """
-    hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=12))
+    hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=rounds or settings.BCRYPT_ROUNDS))
     return hashed.decode("utf-8")
 
 
@@ -31,6 +39,68 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    True when a stored hash was made with a different cost than BCRYPT_ROUNDS.
+    """
+    try:
+        return int(hashed_password.split("$")[2]) != settings.BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
+class PasswordHashingBusy(Exception):
+    """Raised when the bcrypt pool already has BCRYPT_MAX_PENDING calls in flight."""
+
+
+# Spawned (not forked) workers, since the API process is multi-threaded
+_hash_pool: Optional[ProcessPoolExecutor] = None
+_hash_pool_lock = threading.Lock()
+_hash_slots = threading.BoundedSemaphore(settings.BCRYPT_MAX_PENDING)
+
+
+def _get_hash_pool() -> ProcessPoolExecutor:
+    global _hash_pool
+    if _hash_pool is None:
+        with _hash_pool_lock:
+            if _hash_pool is None:
+                _hash_pool = ProcessPoolExecutor(
+                    max_workers=settings.BCRYPT_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+    return _hash_pool
+
+
+async def _run_in_hash_pool(fn, *args):
+    """Run a bcrypt call in the process pool, shedding load when the queue is full."""
+    if not _hash_slots.acquire(blocking=False):
+        raise PasswordHashingBusy()
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_hash_pool(), fn, *args)
+    finally:
+        _hash_slots.release()
+
+
+async def hash_password_async(password: str) -> str:
+    """get_password_hash on the bcrypt process pool."""
+    return await _run_in_hash_pool(get_password_hash, password, settings.BCRYPT_ROUNDS)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on the bcrypt process pool."""
+    return await _run_in_hash_pool(verify_password, plain_password, hashed_password)
+
+
+def shutdown_password_pool():
+    """Stop the bcrypt workers (application shutdown)."""
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is not None:
+            _hash_pool.shutdown(wait=False, cancel_futures=True)
+            _hash_pool = None
+
+
 # ------------------------
 # JWT Tokens
 # ------------------------
@@ -50,6 +120,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expires_delta if expires_delta else timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     )
     to_encode.update({"exp": expire, "type": "access"})
+    to_encode.setdefault("jti", uuid.uuid4().hex)  # Token id for revocation
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
@@ -66,21 +137,39 @@ def create_refresh_token(data: dict) -> str:
     
     expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     to_encode.update({"exp": expire, "type": "refresh"})
+    to_encode.setdefault("jti", uuid.uuid4().hex)  # Token id for revocation
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
+# Validated payloads keyed by token digest, each kept until the token's own exp
+# (the cache TTL is only an upper bound: the longest-lived token type)
+token_cache = TTLCache(
+    max_size=settings.TOKEN_CACHE_MAX_SIZE,
+    ttl_seconds=timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS).total_seconds()
+)
+
+
 def decode_token(token: str) -> dict:
     """
     Decode and validate JWT token.
     FIXED: Converts 'sub' back to integer after decoding.
+    Repeat tokens are served from token_cache without re-verifying the signature.
     """
+    digest = hashlib.sha256(token.encode("utf-8")).digest()
+    cached = token_cache.get(digest)
+    if cached is not None:
+        return dict(cached)
+    
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         
         # Convert 'sub' back to integer if it's the user ID
         if 'sub' in payload and payload['sub'].isdigit():
             payload['sub'] = int(payload['sub'])
-            
-        return payload
     except JWTError as e:
-        raise e
\ No newline at end of file
+        raise e
+    
+    remaining = payload.get("exp", 0) - time.time()
+    if remaining > 0:
+        token_cache.set(digest, payload, ttl_seconds=min(remaining, token_cache.ttl_seconds))
+    return dict(payload)
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""
+Response serialization without double validation.
+Returning a model from a route makes FastAPI dump it back to a dict, validate
+that again against response_model and then encode it. model_response()
+validates ORM objects once (from_attributes) and encodes straight to JSON
+bytes in pydantic-core; response_model still documents the route in OpenAPI.
+"""
+from functools import lru_cache
+from typing import Any, Mapping, Optional
+
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def _adapter(schema) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+def model_response(schema, data: Any, status_code: int = 200, headers: Optional[Mapping[str, str]] = None) -> Response:
+    """
+    Validate `data` (ORM objects, dicts or schema instances) as `schema`,
+    e.g. List[TimeEntryResponse], and return it as a JSON response.
+    Schema instances are not re-validated.
+    """
+    adapter = _adapter(schema)
+    body = adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+    return Response(content=body, status_code=status_code, headers=headers, media_type="application/json")
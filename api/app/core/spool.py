@@ -0,0 +1,121 @@
+"""
+NDJSON spool files for rows that could not be written to the database.
+Each process appends to its own {prefix}-{pid}.ndjson; on startup a worker
+replays the files of processes that are no longer running. Lines that cannot
+be parsed (e.g. a truncated final line after a crash mid-append) are moved to
+a .corrupt file next to the spool instead of blocking the replay.
+"""
+import glob
+import json
+import logging
+import os
+import re
+import threading
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        # Our own file can only be left over from an earlier process with a recycled pid
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class NdjsonSpool:
+    """
+    Append-only per-process spool. decode turns one parsed line back into a row
+    for replay; a line whose json or decode fails counts as corrupt.
+    """
+
+    def __init__(self, spool_dir: str, prefix: str, decode: Optional[Callable[[dict], dict]] = None):
+        self.spool_dir = spool_dir
+        self.prefix = prefix
+        self.decode = decode
+        self._lock = threading.Lock()
+        self._pattern = re.compile(rf"^{re.escape(prefix)}-(\d+)\.ndjson(?:\.replaying-(\d+))?$")
+        self.corrupt = 0
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.spool_dir, f"{self.prefix}-{os.getpid()}.ndjson")
+
+    def append(self, rows: list):
+        """Append rows and fsync before returning."""
+        os.makedirs(self.spool_dir, exist_ok=True)
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _orphans(self) -> list:
+        """Spool files, or interrupted replays, whose owning process has exited."""
+        orphans = []
+        for path in glob.glob(os.path.join(self.spool_dir, f"{self.prefix}-*.ndjson*")):
+            match = self._pattern.match(os.path.basename(path))
+            if not match:
+                continue
+            owner = int(match.group(2) or match.group(1))
+            if not _pid_alive(owner):
+                orphans.append((path, match.group(0).split(".replaying-")[0]))
+        return orphans
+
+    def _read(self, path: str):
+        rows, corrupt = [], []
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                    if self.decode is not None:
+                        row = self.decode(row)
+                except (ValueError, TypeError, KeyError) as e:
+                    logger.warning("Skipping corrupt %s spool line in %s: %s", self.prefix, path, e)
+                    corrupt.append(line if line.endswith("\n") else line + "\n")
+                    continue
+                rows.append(row)
+        return rows, corrupt
+
+    def replay(self, write: Callable[[list], None]) -> int:
+        """
+        Pass the rows of every orphaned spool file to write. Files whose write
+        raises are put back for the next start. Returns the rows replayed.
+        """
+        replayed = 0
+        for path, name in self._orphans():
+            original = os.path.join(self.spool_dir, name)
+            # Claim the file atomically so concurrent workers do not replay it twice
+            claimed = f"{original}.replaying-{os.getpid()}"
+            try:
+                with self._lock:
+                    os.rename(path, claimed)
+            except OSError:
+                continue
+
+            rows, corrupt = self._read(claimed)
+            try:
+                if rows:
+                    write(rows)
+            except Exception as e:
+                logger.error("Replay of %s failed, will retry on next start: %s", claimed, e)
+                if not os.path.exists(original):
+                    os.rename(claimed, original)
+                continue
+
+            if corrupt:
+                with open(f"{original}.corrupt", "a", encoding="utf-8") as f:
+                    f.writelines(corrupt)
+                self.corrupt += len(corrupt)
+                logger.error("Moved %d corrupt %s spool lines to %s.corrupt", len(corrupt), self.prefix, original)
+            os.remove(claimed)
+            replayed += len(rows)
+        return replayed
@@ -0,0 +1,156 @@
+"""
+Structured, non-blocking logging.
+Request threads only put records on a queue (QueueHandler); a QueueListener
+thread formats them and writes to stdout, so slow terminals or log shippers
+never stall a request. Each record is stamped with the request id, tenant and
+user from the request context at the moment it is logged, and rendered as one
+JSON object per line (LOG_FORMAT=text gives readable lines for development).
+
+High-volume DEBUG lines can be sampled per logger through LOG_SAMPLING, e.g.
+{"api.v1.time_tracking": 0.01} keeps about 1% of that module's debug records.
+"""
+import atexit
+import logging
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+import orjson
+
+from core.request_context import current_request_context
+
+# LogRecord attributes that are not user-supplied `extra` fields
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id", "tenant_id", "user_id"}
+
+_listener: Optional[QueueListener] = None
+_log_queue: Optional[queue.SimpleQueue] = None
+
+
+class RequestContextFilter(logging.Filter):
+    """Copy request id, tenant and user onto the record before it leaves the request."""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = current_request_context()
+        record.request_id = context.request_id if context else None
+        record.tenant_id = context.tenant_id if context else None
+        record.user_id = context.user_id if context else None
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keep a configured share of DEBUG records per logger name (and its children)."""
+    
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = rates
+        self._resolved: Dict[str, float] = {}
+    
+    def _rate(self, name: str) -> float:
+        rate = self._resolved.get(name)
+        if rate is None:
+            # Longest configured prefix wins: "api.v1" covers "api.v1.time_tracking"
+            matches = [prefix for prefix in self.rates if name == prefix or name.startswith(prefix + ".")]
+            rate = self.rates[max(matches, key=len)] if matches else 1.0
+            self._resolved[name] = rate
+        return rate
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        rate = self._rate(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+class _QueueHandler(QueueHandler):
+    """
+    Renders only the message and traceback text on the calling thread (args
+    and exc_info may not be safe to use later), leaving the structured fields
+    for the listener's formatter.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, with extra= fields at the top level."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key in ("request_id", "tenant_id", "user_id"):
+            value = getattr(record, key, None)
+            if value is not None:
+                entry[key] = value
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return orjson.dumps(entry, default=str).decode()
+
+
+class TextFormatter(logging.Formatter):
+    """Readable single-line records for local development."""
+    
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s [%(request_id)s] %(message)s")
+    
+    def format(self, record: logging.LogRecord) -> str:
+        if getattr(record, "request_id", None) is None:
+            record.request_id = "-"
+        line = super().format(record)
+        extra = " ".join(f"{key}={value}" for key, value in record.__dict__.items() if key not in _RECORD_ATTRS)
+        return f"{line} {extra}" if extra else line
+
+
+def configure_logging(level: str = "INFO", log_format: str = "json", sampling: Optional[Dict[str, float]] = None):
+    """
+    Route the root logger through a queue to a stdout writer thread.
+    Safe to call more than once; later calls replace the earlier setup.
+    """
+    global _listener, _log_queue
+    if _listener is not None:
+        _listener.stop()
+    
+    log_queue = _log_queue = queue.SimpleQueue()
+    queue_handler = _QueueHandler(log_queue)
+    if sampling:
+        queue_handler.addFilter(SamplingFilter(sampling))
+    queue_handler.addFilter(RequestContextFilter())
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter() if log_format == "json" else TextFormatter())
+    
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(level.upper())
+    
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def log_queue_depth() -> int:
+    """Records waiting for the writer thread (0 before configure_logging)."""
+    return _log_queue.qsize() if _log_queue is not None else 0
+
+
+def _flush_on_exit():
+    if _listener is not None:
+        _listener.stop()
+
+
+atexit.register(_flush_on_exit)
@@ -3,22 +3,82 @@ Database configuration and session management.
 Uses SQLAlchemy 2.0 async patterns.
 """
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import sessionmaker
 from config import get_settings
+from core.db_pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool
+from core.replica import ReplicaHealth
 
 settings = get_settings()
 
+# Pool sizing shared by both engines, see DB_POOL_* settings
+POOL_OPTIONS = {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
+}
+
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    echo=settings.DEBUG
+    poolclass=InstrumentedQueuePool,
+    echo=settings.DEBUG,
+    **POOL_OPTIONS
 )
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Optional read replica for heavy read-only traffic (reports, list endpoints)
+replica_engine = None
+ReplicaSessionLocal = None
+replica_health = None
+if settings.REPLICA_DATABASE_URL:
+    replica_engine = create_engine(
+        settings.REPLICA_DATABASE_URL,
+        poolclass=InstrumentedQueuePool,
+        echo=settings.DEBUG,
+        # Fail fast so an unreachable replica doesn't stall the health check
+        connect_args={"connect_timeout": 3},
+        **POOL_OPTIONS
+    )
+    ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+    replica_health = ReplicaHealth(
+        replica_engine,
+        max_lag_seconds=settings.REPLICA_MAX_LAG_SECONDS,
+        check_interval_seconds=settings.REPLICA_CHECK_INTERVAL_SECONDS
+    )
+
+
+def _async_database_url(url: str) -> str:
+    """Point a plain/psycopg2 Postgres URL at the asyncpg driver."""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+# Async engine for hot endpoints (check-in/out, event and shift listings, auth).
+# Runs on the event loop instead of tying up a threadpool worker per request.
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL or _async_database_url(settings.DATABASE_URL),
+    poolclass=InstrumentedAsyncQueuePool,
+    echo=settings.DEBUG,
+    **POOL_OPTIONS
+)
+
+# Objects stay usable after commit so responses can be built without a reload
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 # Base class for models
 Base = declarative_base()
 
@@ -30,3 +90,29 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_read_db():
+    """
+    Dependency for read-only sessions.
+    Uses the replica when one is configured, reachable and within
+    REPLICA_MAX_LAG_SECONDS of the primary; otherwise falls back to the primary.
+    Never write through this session.
+    """
+    use_replica = replica_health is not None and replica_health.is_usable()
+    db = ReplicaSessionLocal() if use_replica else SessionLocal()
+    try:
+        yield db
+    except OperationalError as e:
+        # Replica went away mid-request; send the next requests to the primary
+        if use_replica:
+            replica_health.mark_failed(e)
+        raise
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    """Dependency for getting async database sessions."""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -2,29 +2,65 @@
 FastAPI application entry point.
 Main application configuration and router setup.
 """
-from fastapi import FastAPI
+import asyncio
+import logging
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from contextlib import asynccontextmanager
+from prometheus_client import CONTENT_TYPE_LATEST
 
 from config import get_settings
-from database import engine, Base
-from api.v1 import auth, tenants, users, volunteers, events, reports, integrations, scheduling, training, time_tracking, documents, reporting
+from database import engine, async_engine, replica_engine
+from core.query_stats import QueryStatsMiddleware
+from core.request_context import RequestContextMiddleware
+from core.structured_logging import configure_logging
+from core.pagination import InvalidCursor
+from core.fieldsets import InvalidFields
+from core.compression import CompressionMiddleware
+from core.profiling import ProfilingMiddleware
+from core.metrics import MetricsMiddleware, instrument_pool, mark_worker_dead, render_metrics
+from core.security import PasswordHashingBusy, shutdown_password_pool
+from services.audit import audit_writer
+from services.document_access import document_access
+from services.health import loop_lag, readiness
+from services.token_revocation import refresh_revoked_tokens, purge_expired_revocations, revocation_refresh_loop
+from api.v1 import auth, tenants, users, volunteers, events, reports, integrations, scheduling, training, time_tracking, documents, reporting, system, audit
 import os
 
 settings = get_settings()
 
+configure_logging(settings.LOG_LEVEL, settings.LOG_FORMAT, settings.LOG_SAMPLING)
+logger = logging.getLogger(__name__)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
-    # Startup: Create database tables
-    Base.metadata.create_all(bind=engine)
-    print("✓ Database tables created")
+    # Startup: the schema and audit partitions are managed by the migrate step
+    # (alembic upgrade head + services.audit_archive ensure), never by workers.
+    
+    # Load the token revocation list and keep it in sync
+    await purge_expired_revocations()
+    await refresh_revoked_tokens()
+    revocation_task = asyncio.create_task(revocation_refresh_loop())
+    
+    # Batched audit writer (replays any spooled entries first)
+    if settings.AUDIT_WRITE_MODE != "sync":
+        audit_writer.start()
+    document_access.start()
+    loop_lag.start()
     
     yield
     
     # Shutdown: Cleanup
-    print("✓ Application shutdown")
+    revocation_task.cancel()
+    loop_lag.stop()
+    document_access.stop()
+    audit_writer.stop()
+    shutdown_password_pool()
+    mark_worker_dead()
+    logger.info("Application shutdown")
 
 
 # Create FastAPI application
@@ -35,6 +71,7 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -69,9 +106,57 @@ app.add_middleware(
     allow_origins=origins,                 
     allow_credentials=True,               
     allow_methods=["GET","POST","PUT","PATCH","DELETE","OPTIONS"],
-    allow_headers=["Authorization","Content-Type"]
+    allow_headers=["Authorization","Content-Type"],
+    expose_headers=["X-Next-Cursor","X-Total-Count"]
+)
+
+app.add_middleware(
+    QueryStatsMiddleware,
+    emit_headers=settings.DEBUG,
+    n_plus_one_threshold=settings.DB_N_PLUS_ONE_THRESHOLD
+)
+
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY
+)
+
+# Inside RequestContextMiddleware, which records who may keep a profile
+app.add_middleware(
+    ProfilingMiddleware,
+    interval_ms=settings.PROFILE_INTERVAL_MS,
+    sample_rate=settings.PROFILE_SAMPLE_RATE,
+    max_header_sessions=settings.PROFILE_MAX_HEADER_SESSIONS
 )
 
+app.add_middleware(RequestContextMiddleware, access_log=settings.LOG_ACCESS, trusted_proxies=settings.TRUSTED_PROXIES)
+
+# Outermost, so latency covers compression and every other middleware
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    instrument_pool(engine, "primary")
+    instrument_pool(async_engine.sync_engine, "primary_async")
+    if replica_engine is not None:
+        instrument_pool(replica_engine, "replica")
+
+
+@app.exception_handler(PasswordHashingBusy)
+async def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusy):
+    """Shed login/registration load instead of queueing behind bcrypt."""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server busy, please retry shortly"},
+        headers={"Retry-After": "1"}
+    )
+
+
+@app.exception_handler(InvalidCursor)
+@app.exception_handler(InvalidFields)
+async def invalid_query_handler(request: Request, exc: ValueError):
+    """A malformed pagination cursor or unknown sparse field is a client error."""
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
 
 
 # Health check endpoint
@@ -85,6 +170,24 @@ async def health_check():
     }
 
 
+@app.get("/health/ready")
+async def readiness_check():
+    """
+    Readiness probe: database round-trip, pool saturation, event-loop lag, S3
+    and background queues. 503 when a critical check fails; cached briefly.
+    """
+    result = await readiness.result()
+    return ORJSONResponse(status_code=503 if result["status"] == "not_ready" else 200, content=result)
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus scrape endpoint (restrict to the internal network at the proxy)."""
+    if not settings.METRICS_ENABLED:
+        return JSONResponse(status_code=404, content={"detail": "Not Found"})
+    return Response(render_metrics(), headers={"Content-Type": CONTENT_TYPE_LATEST})
+
+
 # Include routers
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"])
 app.include_router(tenants.router, prefix="/api/v1/tenants", tags=["Tenants"])
@@ -98,6 +201,8 @@ app.include_router(training.router, prefix="/api/v1/training", tags=["Training"]
 app.include_router(time_tracking.router, prefix="/api/v1/time-tracking", tags=["Time Tracking"])
 app.include_router(documents.router, prefix="/api/v1/documents", tags=["Documents"])
 app.include_router(reporting.router, prefix="/api/v1/reporting", tags=["Reporting"])
+app.include_router(system.router, prefix="/api/v1/system", tags=["System"])
+app.include_router(audit.router, prefix="/api/v1/audit", tags=["Audit"])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,766 @@
+"""Baseline schema
+
+Captures the schema that db_init/*.sql plus Base.metadata.create_all used to
+produce at API startup, including the tables that only exist in the SQL
+scripts (shift_templates, shift_waitlists, volunteer_availability,
+shift_swap_requests, training_records) and model indexes create_all never
+added to tables the scripts had already created.
+
+Idempotent, so it applies to an empty database and to any existing one:
+tables that already exist are left alone and indexes use IF NOT EXISTS.
+Monthly audit partitions are created by `python -m services.audit_archive
+ensure`, which runs after `alembic upgrade head`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_table(name, *columns, **kw):
+    """op.create_table, skipped when the table already exists."""
+    if not sa.inspect(op.get_bind()).has_table(name):
+        op.create_table(name, *columns, **kw)
+
+
+def upgrade() -> None:
+    _create_table('report_fields',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('entity_type', sa.VARCHAR(length=100), nullable=False),
+    sa.Column('field_name', sa.VARCHAR(length=100), nullable=False),
+    sa.Column('field_label', sa.VARCHAR(length=255), nullable=False),
+    sa.Column('field_type', sa.VARCHAR(length=50), nullable=False),
+    sa.Column('is_filterable', sa.BOOLEAN(), server_default=sa.text('true'), nullable=True),
+    sa.Column('is_groupable', sa.BOOLEAN(), server_default=sa.text('true'), nullable=True),
+    sa.Column('is_aggregatable', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True),
+    sa.Column('aggregation_functions', sa.TEXT(), nullable=True),
+    sa.PrimaryKeyConstraint('id', name='report_fields_pkey'),
+    sa.UniqueConstraint('entity_type', 'field_name', name='report_fields_entity_type_field_name_key'),
+    comment='Available fields for report builder'
+    )
+    _create_table('tenants',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.VARCHAR(length=255), nullable=False),
+    sa.Column('slug', sa.VARCHAR(length=100), nullable=False),
+    sa.Column('contact_email', sa.VARCHAR(length=255), nullable=False),
+    sa.Column('contact_phone', sa.VARCHAR(length=20), nullable=True),
+    sa.Column('address_line1', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('address_line2', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('city', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('state', sa.VARCHAR(length=2), server_default=sa.text("'VA'::character varying"), nullable=True),
+    sa.Column('zip_code', sa.VARCHAR(length=10), nullable=True),
+    sa.Column('is_active', sa.BOOLEAN(), server_default=sa.text('true'), nullable=False),
+    sa.Column('settings', sa.TEXT(), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('updated_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.PrimaryKeyConstraint('id', name='tenants_pkey'),
+    sa.UniqueConstraint('name', name='tenants_name_key'),
+    sa.UniqueConstraint('slug', name='tenants_slug_key')
+    )
+    _create_table('training_courses',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('tenant_id', sa.INTEGER(), nullable=False),
+    sa.Column('train_course_id', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('name', sa.VARCHAR(length=255), nullable=False),
+    sa.Column('description', sa.TEXT(), nullable=True),
+    sa.Column('course_code', sa.VARCHAR(length=50), nullable=True),
+    sa.Column('provider', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('category', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('is_required', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True),
+    sa.Column('validity_period_days', sa.INTEGER(), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.Column('updated_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], name='training_courses_tenant_id_fkey', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name='training_courses_pkey'),
+    sa.UniqueConstraint('train_course_id', name='training_courses_train_course_id_key'),
+    comment='Catalog of training courses including TRAIN courses'
+    )
+    op.create_index('idx_training_courses_tenant', 'training_courses', ['tenant_id'], unique=False, if_not_exists=True)
+    op.create_index('idx_training_courses_train_id', 'training_courses', ['train_course_id'], unique=False, if_not_exists=True)
+    _create_table('users',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('tenant_id', sa.INTEGER(), nullable=False),
+    sa.Column('username', sa.VARCHAR(length=100), nullable=False),
+    sa.Column('email', sa.VARCHAR(length=255), nullable=False),
+    sa.Column('hashed_password', sa.VARCHAR(length=255), nullable=False),
+    sa.Column('first_name', sa.VARCHAR(length=100), nullable=False),
+    sa.Column('last_name', sa.VARCHAR(length=100), nullable=False),
+    sa.Column('phone', sa.VARCHAR(length=20), nullable=True),
+    sa.Column('role', sa.VARCHAR(length=50), server_default=sa.text("'sub_unit_staff'::character varying"), nullable=False),
+    sa.Column('status', sa.VARCHAR(length=20), server_default=sa.text("'pending'::character varying"), nullable=False),
+    sa.Column('can_view_data', sa.BOOLEAN(), server_default=sa.text('true'), nullable=True),
+    sa.Column('can_edit_data', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True),
+    sa.Column('can_send_password_reminder', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True),
+    sa.Column('can_initiate_transfers', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True),
+    sa.Column('can_approve_transfers', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True),
+    sa.Column('can_view_alerts', sa.BOOLEAN(), server_default=sa.text('true'), nullable=True),
+    sa.Column('can_edit_alerts', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True),
+    sa.Column('can_export_data', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True),
+    sa.Column('mfa_enabled', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True),
+    sa.Column('mfa_secret', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('last_login', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('updated_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], name='users_tenant_id_fkey'),
+    sa.PrimaryKeyConstraint('id', name='users_pkey'),
+    sa.UniqueConstraint('email', name='users_email_key'),
+    sa.UniqueConstraint('username', name='users_username_key')
+    )
+    op.create_index('idx_users_email', 'users', ['email'], unique=False, if_not_exists=True)
+    op.create_index('idx_users_tenant_id', 'users', ['tenant_id'], unique=False, if_not_exists=True)
+    op.create_index('idx_users_tenant_id_id', 'users', ['tenant_id', 'id'], unique=False, if_not_exists=True)
+    op.create_index('idx_users_username', 'users', ['username'], unique=False, if_not_exists=True)
+    _create_table('audit_logs',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.INTEGER(), nullable=False),
+    sa.Column('tenant_id', sa.INTEGER(), nullable=False),
+    sa.Column('action', sa.VARCHAR(length=100), nullable=False),
+    sa.Column('resource_type', sa.VARCHAR(length=50), nullable=False),
+    sa.Column('resource_id', sa.INTEGER(), nullable=True),
+    sa.Column('ip_address', sa.VARCHAR(length=45), nullable=True),
+    sa.Column('user_agent', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('endpoint', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('http_method', sa.VARCHAR(length=10), nullable=True),
+    sa.Column('old_values', postgresql.JSON(astext_type=sa.Text()), nullable=True),
+    sa.Column('new_values', postgresql.JSON(astext_type=sa.Text()), nullable=True),
+    sa.Column('description', sa.TEXT(), nullable=True),
+    sa.Column('status', sa.VARCHAR(length=20), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], name='audit_logs_user_id_fkey1'),
+    sa.PrimaryKeyConstraint('id', 'created_at', name='audit_logs_pkey'),
+    comment='Audit trail, range-partitioned by month on created_at',
+    postgresql_partition_by='RANGE (created_at)'
+    )
+    op.create_index('idx_audit_logs_created', 'audit_logs', [sa.text('created_at DESC'), sa.text('id DESC')], unique=False, if_not_exists=True)
+    op.create_index('idx_audit_logs_tenant_action_created', 'audit_logs', ['tenant_id', 'action', sa.text('created_at DESC'), sa.text('id DESC')], unique=False, if_not_exists=True)
+    op.create_index('idx_audit_logs_tenant_created', 'audit_logs', ['tenant_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False, if_not_exists=True)
+    op.create_index('idx_audit_logs_tenant_resource_created', 'audit_logs', ['tenant_id', 'resource_type', 'resource_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False, if_not_exists=True)
+    op.create_index('idx_audit_logs_tenant_user_created', 'audit_logs', ['tenant_id', 'user_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False, if_not_exists=True)
+    op.create_index('idx_audit_logs_user_id', 'audit_logs', ['user_id'], unique=False, if_not_exists=True)
+    op.create_index('ix_audit_logs_action', 'audit_logs', ['action'], unique=False, if_not_exists=True)
+    _create_table('events',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('tenant_id', sa.INTEGER(), nullable=False),
+    sa.Column('name', sa.VARCHAR(length=255), nullable=False),
+    sa.Column('title', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('staff_description', sa.TEXT(), nullable=True),
+    sa.Column('volunteer_description', sa.TEXT(), nullable=True),
+    sa.Column('location', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('locality', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('event_date', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('start_date', postgresql.TIMESTAMP(), nullable=False),
+    sa.Column('end_date', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('activity_type', sa.VARCHAR(length=50), nullable=False),
+    sa.Column('response_name', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('mission_types', sa.TEXT(), nullable=True),
+    sa.Column('requestor_type', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('max_volunteers', sa.INTEGER(), server_default=sa.text('100'), nullable=True),
+    sa.Column('min_volunteers', sa.INTEGER(), server_default=sa.text('1'), nullable=True),
+    sa.Column('registered_volunteers', sa.INTEGER(), server_default=sa.text('0'), nullable=True),
+    sa.Column('visible_to_volunteers', sa.BOOLEAN(), server_default=sa.text('true'), nullable=True),
+    sa.Column('allow_self_signup', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True),
+    sa.Column('enable_waitlist', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True),
+    sa.Column('districts', sa.TEXT(), nullable=True),
+    sa.Column('status', sa.VARCHAR(length=20), server_default=sa.text("'draft'::character varying"), nullable=False),
+    sa.Column('impact_data', sa.TEXT(), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('updated_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.Column('created_by', sa.INTEGER(), nullable=True),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], name='events_created_by_fkey'),
+    sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], name='events_tenant_id_fkey'),
+    sa.PrimaryKeyConstraint('id', name='events_pkey')
+    )
+    op.create_index('idx_events_start_date', 'events', ['start_date'], unique=False, if_not_exists=True)
+    op.create_index('idx_events_tenant_id', 'events', ['tenant_id'], unique=False, if_not_exists=True)
+    op.create_index('idx_events_tenant_id_id', 'events', ['tenant_id', 'id'], unique=False, if_not_exists=True)
+    _create_table('policy_documents',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('tenant_id', sa.INTEGER(), nullable=False),
+    sa.Column('title', sa.VARCHAR(length=255), nullable=False),
+    sa.Column('description', sa.TEXT(), nullable=True),
+    sa.Column('document_type', sa.VARCHAR(length=100), nullable=False),
+    sa.Column('version', sa.VARCHAR(length=50), nullable=False),
+    sa.Column('file_url', sa.VARCHAR(length=500), nullable=False),
+    sa.Column('file_size_bytes', sa.INTEGER(), nullable=True),
+    sa.Column('file_hash', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('is_active', sa.BOOLEAN(), nullable=True),
+    sa.Column('requires_signature', sa.BOOLEAN(), nullable=True),
+    sa.Column('created_by', sa.INTEGER(), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('updated_at', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('effective_date', sa.DATE(), nullable=True),
+    sa.Column('expiration_date', sa.DATE(), nullable=True),
+    sa.Column('supersedes_document_id', sa.INTEGER(), nullable=True),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], name='policy_documents_created_by_fkey'),
+    sa.ForeignKeyConstraint(['supersedes_document_id'], ['policy_documents.id'], name='policy_documents_supersedes_document_id_fkey'),
+    sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], name='policy_documents_tenant_id_fkey'),
+    sa.PrimaryKeyConstraint('id', name='policy_documents_pkey')
+    )
+    op.create_index('ix_policy_documents_id', 'policy_documents', ['id'], unique=False, if_not_exists=True)
+    _create_table('revoked_tokens',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('jti', sa.VARCHAR(length=64), nullable=False),
+    sa.Column('user_id', sa.INTEGER(), nullable=True),
+    sa.Column('token_type', sa.VARCHAR(length=20), nullable=True),
+    sa.Column('reason', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('expires_at', postgresql.TIMESTAMP(), nullable=False),
+    sa.Column('revoked_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], name='revoked_tokens_user_id_fkey', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name='revoked_tokens_pkey'),
+    sa.UniqueConstraint('jti', name='revoked_tokens_jti_key'),
+    comment='JWT ids (jti) revoked before expiry'
+    )
+    op.create_index('idx_revoked_tokens_expires', 'revoked_tokens', ['expires_at'], unique=False, if_not_exists=True)
+    op.create_index('idx_revoked_tokens_revoked_at', 'revoked_tokens', ['revoked_at'], unique=False, if_not_exists=True)
+    op.create_index('idx_revoked_tokens_user', 'revoked_tokens', ['user_id'], unique=False, if_not_exists=True)
+    _create_table('saved_reports',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('tenant_id', sa.INTEGER(), nullable=False),
+    sa.Column('name', sa.VARCHAR(length=255), nullable=False),
+    sa.Column('description', sa.TEXT(), nullable=True),
+    sa.Column('report_type', sa.VARCHAR(length=100), nullable=False),
+    sa.Column('query_config', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('visualization_config', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('schedule_config', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('last_generated_at', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('next_scheduled_at', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('is_public', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True),
+    sa.Column('shared_with_roles', sa.TEXT(), nullable=True),
+    sa.Column('shared_with_users', sa.TEXT(), nullable=True),
+    sa.Column('created_by', sa.INTEGER(), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.Column('updated_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.Column('is_active', sa.BOOLEAN(), server_default=sa.text('true'), nullable=True),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], name='saved_reports_created_by_fkey'),
+    sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], name='saved_reports_tenant_id_fkey', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name='saved_reports_pkey'),
+    comment='User-defined and system reports'
+    )
+    op.create_index('idx_saved_reports_tenant', 'saved_reports', ['tenant_id', 'is_active'], unique=False, if_not_exists=True)
+    op.create_index('idx_saved_reports_type', 'saved_reports', ['report_type'], unique=False, if_not_exists=True)
+    _create_table('shift_templates',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('tenant_id', sa.INTEGER(), nullable=False),
+    sa.Column('name', sa.VARCHAR(length=255), nullable=False),
+    sa.Column('description', sa.TEXT(), nullable=True),
+    sa.Column('recurrence_pattern', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('duration_minutes', sa.INTEGER(), nullable=False),
+    sa.Column('max_volunteers', sa.INTEGER(), nullable=True),
+    sa.Column('min_volunteers', sa.INTEGER(), server_default=sa.text('1'), nullable=True),
+    sa.Column('required_skills', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('required_training', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('is_active', sa.BOOLEAN(), server_default=sa.text('true'), nullable=True),
+    sa.Column('allow_self_signup', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True),
+    sa.Column('enable_waitlist', sa.BOOLEAN(), server_default=sa.text('true'), nullable=True),
+    sa.Column('created_by', sa.INTEGER(), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.Column('updated_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], name='shift_templates_created_by_fkey'),
+    sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], name='shift_templates_tenant_id_fkey', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name='shift_templates_pkey'),
+    comment='Templates for creating recurring shifts'
+    )
+    op.create_index('idx_shift_templates_tenant', 'shift_templates', ['tenant_id'], unique=False, if_not_exists=True)
+    _create_table('training_requirements',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('tenant_id', sa.INTEGER(), nullable=False),
+    sa.Column('name', sa.VARCHAR(length=255), nullable=False),
+    sa.Column('description', sa.TEXT(), nullable=True),
+    sa.Column('course_id', sa.INTEGER(), nullable=True),
+    sa.Column('required_for_roles', sa.TEXT(), nullable=True),
+    sa.Column('required_for_event_types', sa.TEXT(), nullable=True),
+    sa.Column('grace_period_days', sa.INTEGER(), server_default=sa.text('0'), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.Column('updated_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.ForeignKeyConstraint(['course_id'], ['training_courses.id'], name='training_requirements_course_id_fkey'),
+    sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], name='training_requirements_tenant_id_fkey', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name='training_requirements_pkey'),
+    comment='Training requirements for specific roles/events'
+    )
+    _create_table('volunteers',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('tenant_id', sa.INTEGER(), nullable=False),
+    sa.Column('username', sa.VARCHAR(length=100), nullable=False),
+    sa.Column('email', sa.VARCHAR(length=255), nullable=False),
+    sa.Column('hashed_password', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('first_name', sa.VARCHAR(length=100), nullable=False),
+    sa.Column('middle_name', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('last_name', sa.VARCHAR(length=100), nullable=False),
+    sa.Column('date_of_birth', sa.DATE(), nullable=True),
+    sa.Column('phone_primary', sa.VARCHAR(length=20), nullable=True),
+    sa.Column('phone_secondary', sa.VARCHAR(length=20), nullable=True),
+    sa.Column('address_line1', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('address_line2', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('city', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('state', sa.VARCHAR(length=2), server_default=sa.text("'VA'::character varying"), nullable=True),
+    sa.Column('zip_code', sa.VARCHAR(length=10), nullable=True),
+    sa.Column('emergency_contact_name', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('emergency_contact_phone', sa.VARCHAR(length=20), nullable=True),
+    sa.Column('emergency_contact_relationship', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('application_status', sa.VARCHAR(length=20), server_default=sa.text("'pending'::character varying"), nullable=True),
+    sa.Column('account_status', sa.VARCHAR(length=20), server_default=sa.text("'active'::character varying"), nullable=True),
+    sa.Column('mrc_level', sa.VARCHAR(length=20), nullable=True),
+    sa.Column('occupation', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('employer', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('professional_skills', sa.TEXT(), nullable=True),
+    sa.Column('license_number', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('license_type', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('license_state', sa.VARCHAR(length=2), nullable=True),
+    sa.Column('license_expiration', sa.DATE(), nullable=True),
+    sa.Column('skills', sa.TEXT(), nullable=True),
+    sa.Column('languages', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('certifications', sa.TEXT(), nullable=True),
+    sa.Column('certification_info', sa.TEXT(), nullable=True),
+    sa.Column('train_id', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('train_data', sa.TEXT(), nullable=True),
+    sa.Column('availability', sa.TEXT(), nullable=True),
+    sa.Column('availability_info', sa.TEXT(), nullable=True),
+    sa.Column('travel_distance', sa.INTEGER(), server_default=sa.text('25'), nullable=True),
+    sa.Column('preferred_roles', sa.TEXT(), nullable=True),
+    sa.Column('assigned_groups', sa.TEXT(), nullable=True),
+    sa.Column('assigned_roles', sa.TEXT(), nullable=True),
+    sa.Column('total_hours', sa.NUMERIC(precision=10, scale=2), server_default=sa.text('0'), nullable=True),
+    sa.Column('alert_response_rate', sa.NUMERIC(precision=5, scale=2), server_default=sa.text('0'), nullable=True),
+    sa.Column('badges_earned', sa.TEXT(), nullable=True),
+    sa.Column('background_check_date', sa.DATE(), nullable=True),
+    sa.Column('background_check_status', sa.VARCHAR(length=20), nullable=True),
+    sa.Column('application_date', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.Column('approval_date', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('last_activity_date', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('updated_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.Column('last_activity', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('approved_at', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('approved_by', sa.INTEGER(), nullable=True),
+    sa.ForeignKeyConstraint(['approved_by'], ['users.id'], name='volunteers_approved_by_fkey'),
+    sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], name='volunteers_tenant_id_fkey'),
+    sa.PrimaryKeyConstraint('id', name='volunteers_pkey'),
+    sa.UniqueConstraint('username', name='volunteers_username_key')
+    )
+    op.create_index('idx_volunteers_application_status', 'volunteers', ['application_status'], unique=False, if_not_exists=True)
+    op.create_index('idx_volunteers_email', 'volunteers', ['email'], unique=False, if_not_exists=True)
+    op.create_index('idx_volunteers_tenant_id', 'volunteers', ['tenant_id'], unique=False, if_not_exists=True)
+    op.create_index('idx_volunteers_tenant_id_id', 'volunteers', ['tenant_id', 'id'], unique=False, if_not_exists=True)
+    _create_table('certifications',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('volunteer_id', sa.INTEGER(), nullable=False),
+    sa.Column('certification_type', sa.VARCHAR(length=100), nullable=False),
+    sa.Column('license_number', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('issuing_authority', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('issue_date', sa.DATE(), nullable=True),
+    sa.Column('expiration_date', sa.DATE(), nullable=True),
+    sa.Column('verification_status', sa.VARCHAR(length=50), server_default=sa.text("'pending'::character varying"), nullable=True),
+    sa.Column('verification_date', sa.DATE(), nullable=True),
+    sa.Column('verification_method', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('verified_by', sa.INTEGER(), nullable=True),
+    sa.Column('document_url', sa.VARCHAR(length=500), nullable=True),
+    sa.Column('document_type', sa.VARCHAR(length=50), nullable=True),
+    sa.Column('notes', sa.TEXT(), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.Column('updated_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.ForeignKeyConstraint(['verified_by'], ['users.id'], name='certifications_verified_by_fkey'),
+    sa.ForeignKeyConstraint(['volunteer_id'], ['volunteers.id'], name='certifications_volunteer_id_fkey', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name='certifications_pkey'),
+    comment='Professional licenses and certifications'
+    )
+    op.create_index('idx_certifications_expiration', 'certifications', ['expiration_date'], unique=False, if_not_exists=True)
+    op.create_index('idx_certifications_volunteer', 'certifications', ['volunteer_id'], unique=False, if_not_exists=True)
+    _create_table('document_access_log',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('document_id', sa.INTEGER(), nullable=True),
+    sa.Column('document_type', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('user_id', sa.INTEGER(), nullable=True),
+    sa.Column('volunteer_id', sa.INTEGER(), nullable=True),
+    sa.Column('action', sa.VARCHAR(length=50), nullable=False),
+    sa.Column('ip_address', sa.VARCHAR(length=45), nullable=True),
+    sa.Column('user_agent', sa.TEXT(), nullable=True),
+    sa.Column('accessed_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('metadata', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], name='document_access_log_user_id_fkey1'),
+    sa.ForeignKeyConstraint(['volunteer_id'], ['volunteers.id'], name='document_access_log_volunteer_id_fkey1'),
+    sa.PrimaryKeyConstraint('id', 'accessed_at', name='document_access_log_pkey'),
+    comment='Document access audit trail, range-partitioned by month on accessed_at',
+    postgresql_partition_by='RANGE (accessed_at)'
+    )
+    op.create_index('idx_doc_access_log', 'document_access_log', ['document_type', 'document_id', 'accessed_at'], unique=False, if_not_exists=True)
+    op.create_index('ix_document_access_log_accessed_at', 'document_access_log', ['accessed_at'], unique=False, if_not_exists=True)
+    _create_table('report_executions',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('report_id', sa.INTEGER(), nullable=True),
+    sa.Column('executed_by', sa.INTEGER(), nullable=True),
+    sa.Column('executed_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.Column('execution_time_ms', sa.INTEGER(), nullable=True),
+    sa.Column('row_count', sa.INTEGER(), nullable=True),
+    sa.Column('file_url', sa.VARCHAR(length=500), nullable=True),
+    sa.Column('file_format', sa.VARCHAR(length=20), nullable=True),
+    sa.Column('file_size_bytes', sa.INTEGER(), nullable=True),
+    sa.Column('status', sa.VARCHAR(length=50), server_default=sa.text("'pending'::character varying"), nullable=True),
+    sa.Column('error_message', sa.TEXT(), nullable=True),
+    sa.ForeignKeyConstraint(['executed_by'], ['users.id'], name='report_executions_executed_by_fkey'),
+    sa.ForeignKeyConstraint(['report_id'], ['saved_reports.id'], name='report_executions_report_id_fkey', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name='report_executions_pkey'),
+    comment='History of report generations'
+    )
+    op.create_index('idx_report_executions_report', 'report_executions', ['report_id', 'executed_at'], unique=False, if_not_exists=True)
+    _create_table('report_workflows',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('tenant_id', sa.INTEGER(), nullable=False),
+    sa.Column('name', sa.VARCHAR(length=255), nullable=False),
+    sa.Column('description', sa.TEXT(), nullable=True),
+    sa.Column('trigger_report_id', sa.INTEGER(), nullable=True),
+    sa.Column('trigger_conditions', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('actions', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('is_active', sa.BOOLEAN(), server_default=sa.text('true'), nullable=True),
+    sa.Column('last_executed_at', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('execution_count', sa.INTEGER(), server_default=sa.text('0'), nullable=True),
+    sa.Column('created_by', sa.INTEGER(), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.Column('updated_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], name='report_workflows_created_by_fkey'),
+    sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], name='report_workflows_tenant_id_fkey', ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['trigger_report_id'], ['saved_reports.id'], name='report_workflows_trigger_report_id_fkey'),
+    sa.PrimaryKeyConstraint('id', name='report_workflows_pkey'),
+    comment='Automated workflows triggered by report results'
+    )
+    op.create_index('idx_report_workflows_tenant', 'report_workflows', ['tenant_id', 'is_active'], unique=False, if_not_exists=True)
+    _create_table('shifts',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('event_id', sa.INTEGER(), nullable=False),
+    sa.Column('name', sa.VARCHAR(length=255), nullable=False),
+    sa.Column('start_time', postgresql.TIMESTAMP(), nullable=False),
+    sa.Column('end_time', postgresql.TIMESTAMP(), nullable=False),
+    sa.Column('max_volunteers', sa.INTEGER(), nullable=True),
+    sa.Column('min_volunteers', sa.INTEGER(), server_default=sa.text('1'), nullable=True),
+    sa.Column('required_skills', sa.TEXT(), nullable=True, comment='JSON array of required skills'),
+    sa.Column('description', sa.TEXT(), nullable=True),
+    sa.Column('location', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('updated_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.Column('template_id', sa.INTEGER(), nullable=True),
+    sa.Column('allow_self_signup', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True, comment='Whether volunteers can self-signup for this shift'),
+    sa.Column('enable_waitlist', sa.BOOLEAN(), server_default=sa.text('true'), nullable=True, comment='Whether to enable waitlist when shift is full'),
+    sa.Column('waitlist_capacity', sa.INTEGER(), server_default=sa.text('10'), nullable=True, comment='Maximum number of volunteers on waitlist'),
+    sa.Column('conflict_detection', sa.BOOLEAN(), server_default=sa.text('true'), nullable=True, comment='Whether to prevent double-booking'),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], name='shifts_event_id_fkey', ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['template_id'], ['shift_templates.id'], name='shifts_template_id_fkey'),
+    sa.PrimaryKeyConstraint('id', name='shifts_pkey')
+    )
+    op.create_index('idx_shifts_self_signup', 'shifts', ['allow_self_signup'], unique=False, postgresql_where='(allow_self_signup = true)', if_not_exists=True)
+    op.create_index('idx_shifts_template', 'shifts', ['template_id'], unique=False, if_not_exists=True)
+    op.create_index('ix_shifts_event_id', 'shifts', ['event_id'], unique=False, if_not_exists=True)
+    _create_table('training_records',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('volunteer_id', sa.INTEGER(), nullable=False),
+    sa.Column('course_name', sa.VARCHAR(length=255), nullable=False),
+    sa.Column('course_type', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('provider', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('completion_date', sa.DATE(), nullable=False),
+    sa.Column('expiration_date', sa.DATE(), nullable=True),
+    sa.Column('certificate_number', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('credits_earned', sa.NUMERIC(precision=5, scale=2), nullable=True),
+    sa.Column('notes', sa.TEXT(), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('updated_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.ForeignKeyConstraint(['volunteer_id'], ['volunteers.id'], name='training_records_volunteer_id_fkey'),
+    sa.PrimaryKeyConstraint('id', name='training_records_pkey')
+    )
+    op.create_index('idx_training_records_volunteer_id', 'training_records', ['volunteer_id'], unique=False, if_not_exists=True)
+    _create_table('volunteer_availability',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('volunteer_id', sa.INTEGER(), nullable=False),
+    sa.Column('start_date', sa.DATE(), nullable=False),
+    sa.Column('end_date', sa.DATE(), nullable=False),
+    sa.Column('start_time', postgresql.TIME(), nullable=True),
+    sa.Column('end_time', postgresql.TIME(), nullable=True),
+    sa.Column('recurrence_pattern', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('availability_type', sa.VARCHAR(length=50), server_default=sa.text("'general'::character varying"), nullable=True),
+    sa.Column('event_id', sa.INTEGER(), nullable=True),
+    sa.Column('is_active', sa.BOOLEAN(), server_default=sa.text('true'), nullable=True),
+    sa.Column('notes', sa.TEXT(), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.Column('updated_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.CheckConstraint('start_date <= end_date', name='volunteer_availability_check'),
+    sa.CheckConstraint('start_time IS NULL OR end_time IS NULL OR start_time < end_time', name='volunteer_availability_check1'),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], name='volunteer_availability_event_id_fkey', ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['volunteer_id'], ['volunteers.id'], name='volunteer_availability_volunteer_id_fkey', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name='volunteer_availability_pkey'),
+    comment='Volunteer availability calendar and preferences'
+    )
+    op.create_index('idx_volunteer_availability_dates', 'volunteer_availability', ['volunteer_id', 'start_date', 'end_date'], unique=False, if_not_exists=True)
+    _create_table('volunteer_documents',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('volunteer_id', sa.INTEGER(), nullable=False),
+    sa.Column('tenant_id', sa.INTEGER(), nullable=False),
+    sa.Column('document_type', sa.VARCHAR(length=100), nullable=False),
+    sa.Column('document_category', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('title', sa.VARCHAR(length=255), nullable=False),
+    sa.Column('description', sa.TEXT(), nullable=True),
+    sa.Column('file_url', sa.VARCHAR(length=500), nullable=False),
+    sa.Column('file_name', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('file_size_bytes', sa.INTEGER(), nullable=True),
+    sa.Column('file_type', sa.VARCHAR(length=50), nullable=True),
+    sa.Column('file_hash', sa.VARCHAR(length=255), nullable=True),
+    sa.Column('issue_date', sa.DATE(), nullable=True),
+    sa.Column('expiration_date', sa.DATE(), nullable=True),
+    sa.Column('expires', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True),
+    sa.Column('verification_status', sa.VARCHAR(length=50), server_default=sa.text("'pending'::character varying"), nullable=True),
+    sa.Column('verified_by', sa.INTEGER(), nullable=True),
+    sa.Column('verified_at', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('rejection_reason', sa.TEXT(), nullable=True),
+    sa.Column('visibility', sa.VARCHAR(length=50), server_default=sa.text("'private'::character varying"), nullable=True),
+    sa.Column('expiration_notified', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True),
+    sa.Column('last_notification_date', sa.DATE(), nullable=True),
+    sa.Column('uploaded_by', sa.INTEGER(), nullable=True),
+    sa.Column('uploaded_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.Column('updated_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.Column('download_count', sa.INTEGER(), server_default=sa.text('0'), nullable=True),
+    sa.Column('last_accessed_at', postgresql.TIMESTAMP(), nullable=True),
+    sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], name='volunteer_documents_tenant_id_fkey'),
+    sa.ForeignKeyConstraint(['uploaded_by'], ['users.id'], name='volunteer_documents_uploaded_by_fkey'),
+    sa.ForeignKeyConstraint(['verified_by'], ['users.id'], name='volunteer_documents_verified_by_fkey'),
+    sa.ForeignKeyConstraint(['volunteer_id'], ['volunteers.id'], name='volunteer_documents_volunteer_id_fkey', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name='volunteer_documents_pkey')
+    )
+    op.create_index('idx_volunteer_docs_expiration', 'volunteer_documents', ['expiration_date'], unique=False, postgresql_where='(expires = true)', if_not_exists=True)
+    op.create_index('idx_volunteer_docs_status', 'volunteer_documents', ['verification_status'], unique=False, if_not_exists=True)
+    op.create_index('idx_volunteer_docs_volunteer', 'volunteer_documents', ['volunteer_id'], unique=False, if_not_exists=True)
+    _create_table('volunteer_training',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('volunteer_id', sa.INTEGER(), nullable=False),
+    sa.Column('course_id', sa.INTEGER(), nullable=False),
+    sa.Column('completion_date', sa.DATE(), nullable=False),
+    sa.Column('expiration_date', sa.DATE(), nullable=True),
+    sa.Column('score', sa.NUMERIC(precision=5, scale=2), nullable=True),
+    sa.Column('certificate_number', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('certificate_url', sa.VARCHAR(length=500), nullable=True),
+    sa.Column('train_completion_id', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('synced_from_train', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True),
+    sa.Column('last_sync_date', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('status', sa.VARCHAR(length=50), server_default=sa.text("'active'::character varying"), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.Column('updated_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.ForeignKeyConstraint(['course_id'], ['training_courses.id'], name='volunteer_training_course_id_fkey'),
+    sa.ForeignKeyConstraint(['volunteer_id'], ['volunteers.id'], name='volunteer_training_volunteer_id_fkey', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name='volunteer_training_pkey'),
+    sa.UniqueConstraint('train_completion_id', name='volunteer_training_train_completion_id_key'),
+    sa.UniqueConstraint('volunteer_id', 'course_id', 'completion_date', name='volunteer_training_volunteer_id_course_id_completion_date_key'),
+    comment='Training completion records for volunteers'
+    )
+    op.create_index('idx_volunteer_training_course', 'volunteer_training', ['course_id'], unique=False, if_not_exists=True)
+    op.create_index('idx_volunteer_training_expiration', 'volunteer_training', ['expiration_date'], unique=False, if_not_exists=True)
+    op.create_index('idx_volunteer_training_volunteer', 'volunteer_training', ['volunteer_id'], unique=False, if_not_exists=True)
+    _create_table('electronic_signatures',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('volunteer_id', sa.INTEGER(), nullable=True),
+    sa.Column('user_id', sa.INTEGER(), nullable=True),
+    sa.Column('policy_document_id', sa.INTEGER(), nullable=True),
+    sa.Column('custom_document_id', sa.INTEGER(), nullable=True),
+    sa.Column('signature_data', sa.TEXT(), nullable=True),
+    sa.Column('signature_method', sa.VARCHAR(length=50), nullable=False),
+    sa.Column('ip_address', sa.VARCHAR(length=45), nullable=False),
+    sa.Column('user_agent', sa.TEXT(), nullable=True),
+    sa.Column('geolocation', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('timestamp', postgresql.TIMESTAMP(), nullable=False),
+    sa.Column('consent_text', sa.TEXT(), nullable=False),
+    sa.Column('acknowledged_terms', sa.BOOLEAN(), nullable=True),
+    sa.Column('verified', sa.BOOLEAN(), nullable=True),
+    sa.Column('verification_method', sa.VARCHAR(length=100), nullable=True),
+    sa.Column('verified_at', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('verified_by', sa.INTEGER(), nullable=True),
+    sa.ForeignKeyConstraint(['custom_document_id'], ['volunteer_documents.id'], name='electronic_signatures_custom_document_id_fkey'),
+    sa.ForeignKeyConstraint(['policy_document_id'], ['policy_documents.id'], name='electronic_signatures_policy_document_id_fkey'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], name='electronic_signatures_user_id_fkey'),
+    sa.ForeignKeyConstraint(['verified_by'], ['users.id'], name='electronic_signatures_verified_by_fkey'),
+    sa.ForeignKeyConstraint(['volunteer_id'], ['volunteers.id'], name='electronic_signatures_volunteer_id_fkey'),
+    sa.PrimaryKeyConstraint('id', name='electronic_signatures_pkey')
+    )
+    op.create_index('ix_electronic_signatures_id', 'electronic_signatures', ['id'], unique=False, if_not_exists=True)
+    _create_table('event_assignments',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('event_id', sa.INTEGER(), nullable=False),
+    sa.Column('volunteer_id', sa.INTEGER(), nullable=False),
+    sa.Column('shift_id', sa.INTEGER(), nullable=True),
+    sa.Column('status', sa.VARCHAR(length=20), server_default=sa.text("'pending'::character varying"), nullable=False),
+    sa.Column('hours_completed', sa.NUMERIC(precision=5, scale=2), nullable=True),
+    sa.Column('hours_served', sa.NUMERIC(precision=5, scale=2), nullable=True),
+    sa.Column('check_in_time', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('check_out_time', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('notes', sa.TEXT(), nullable=True),
+    sa.Column('coordinator_notes', sa.TEXT(), nullable=True),
+    sa.Column('volunteer_notes', sa.TEXT(), nullable=True),
+    sa.Column('assigned_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('assigned_by', sa.INTEGER(), nullable=True),
+    sa.Column('confirmed_at', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('completed_at', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('updated_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.ForeignKeyConstraint(['assigned_by'], ['users.id'], name='event_assignments_assigned_by_fkey'),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], name='event_assignments_event_id_fkey', ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['shift_id'], ['shifts.id'], name='event_assignments_shift_id_fkey'),
+    sa.ForeignKeyConstraint(['volunteer_id'], ['volunteers.id'], name='event_assignments_volunteer_id_fkey'),
+    sa.PrimaryKeyConstraint('id', name='event_assignments_pkey'),
+    sa.UniqueConstraint('event_id', 'volunteer_id', 'shift_id', name='event_assignments_event_id_volunteer_id_shift_id_key')
+    )
+    op.create_index('idx_event_assignments_event_id', 'event_assignments', ['event_id'], unique=False, if_not_exists=True)
+    op.create_index('idx_event_assignments_volunteer_id', 'event_assignments', ['volunteer_id'], unique=False, if_not_exists=True)
+    op.create_index('ix_event_assignments_shift_id', 'event_assignments', ['shift_id'], unique=False, if_not_exists=True)
+    _create_table('event_qr_codes',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('event_id', sa.INTEGER(), nullable=True),
+    sa.Column('shift_id', sa.INTEGER(), nullable=True),
+    sa.Column('qr_code_hash', sa.VARCHAR(length=255), nullable=False),
+    sa.Column('qr_code_url', sa.VARCHAR(length=500), nullable=True),
+    sa.Column('valid_from', postgresql.TIMESTAMP(), nullable=False),
+    sa.Column('valid_until', postgresql.TIMESTAMP(), nullable=False),
+    sa.Column('is_active', sa.BOOLEAN(), server_default=sa.text('true'), nullable=True),
+    sa.Column('max_uses', sa.INTEGER(), nullable=True),
+    sa.Column('use_count', sa.INTEGER(), server_default=sa.text('0'), nullable=True),
+    sa.Column('require_photo', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True),
+    sa.Column('require_signature', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True),
+    sa.Column('allow_early_checkin_minutes', sa.INTEGER(), server_default=sa.text('15'), nullable=True),
+    sa.Column('allow_late_checkout_minutes', sa.INTEGER(), server_default=sa.text('30'), nullable=True),
+    sa.Column('created_by', sa.INTEGER(), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], name='event_qr_codes_created_by_fkey'),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], name='event_qr_codes_event_id_fkey', ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['shift_id'], ['shifts.id'], name='event_qr_codes_shift_id_fkey', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name='event_qr_codes_pkey'),
+    sa.UniqueConstraint('qr_code_hash', name='event_qr_codes_qr_code_hash_key'),
+    comment='QR codes for event/shift check-in'
+    )
+    op.create_index('idx_event_qr_codes_hash', 'event_qr_codes', ['qr_code_hash'], unique=False, if_not_exists=True)
+    _create_table('shift_waitlists',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('shift_id', sa.INTEGER(), nullable=False),
+    sa.Column('volunteer_id', sa.INTEGER(), nullable=False),
+    sa.Column('position', sa.INTEGER(), nullable=False),
+    sa.Column('priority_score', sa.INTEGER(), server_default=sa.text('0'), nullable=True),
+    sa.Column('status', sa.VARCHAR(length=50), server_default=sa.text("'waiting'::character varying"), nullable=False),
+    sa.Column('joined_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('promoted_at', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('notified_at', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('notes', sa.TEXT(), nullable=True),
+    sa.Column('auto_accept', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True),
+    sa.CheckConstraint('"position" > 0', name='shift_waitlists_position_check'),
+    sa.ForeignKeyConstraint(['shift_id'], ['shifts.id'], name='shift_waitlists_shift_id_fkey', ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['volunteer_id'], ['volunteers.id'], name='shift_waitlists_volunteer_id_fkey', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name='shift_waitlists_pkey'),
+    sa.UniqueConstraint('shift_id', 'volunteer_id', name='shift_waitlists_shift_id_volunteer_id_key'),
+    comment='Waitlist queue for fully-booked shifts'
+    )
+    op.create_index('idx_shift_waitlists_shift', 'shift_waitlists', ['shift_id', 'position'], unique=False, if_not_exists=True)
+    op.create_index('idx_shift_waitlists_volunteer', 'shift_waitlists', ['volunteer_id'], unique=False, if_not_exists=True)
+    _create_table('time_entries',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('tenant_id', sa.INTEGER(), nullable=False),
+    sa.Column('volunteer_id', sa.INTEGER(), nullable=False),
+    sa.Column('event_id', sa.INTEGER(), nullable=True),
+    sa.Column('shift_id', sa.INTEGER(), nullable=True),
+    sa.Column('check_in_time', postgresql.TIMESTAMP(), nullable=False),
+    sa.Column('check_out_time', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('duration_minutes', sa.INTEGER(), nullable=True),
+    sa.Column('hours_decimal', sa.NUMERIC(precision=5, scale=2), nullable=True),
+    sa.Column('entry_method', sa.VARCHAR(length=50), server_default=sa.text("'manual'::character varying"), nullable=False),
+    sa.Column('check_in_lat', sa.NUMERIC(precision=10, scale=8), nullable=True),
+    sa.Column('check_in_lng', sa.NUMERIC(precision=11, scale=8), nullable=True),
+    sa.Column('check_out_lat', sa.NUMERIC(precision=10, scale=8), nullable=True),
+    sa.Column('check_out_lng', sa.NUMERIC(precision=11, scale=8), nullable=True),
+    sa.Column('location_verified', sa.BOOLEAN(), server_default=sa.text('false'), nullable=True),
+    sa.Column('status', sa.VARCHAR(length=50), server_default=sa.text("'pending'::character varying"), nullable=False),
+    sa.Column('submitted_by', sa.INTEGER(), nullable=True),
+    sa.Column('approved_by', sa.INTEGER(), nullable=True),
+    sa.Column('approved_at', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('rejection_reason', sa.TEXT(), nullable=True),
+    sa.Column('volunteer_notes', sa.TEXT(), nullable=True),
+    sa.Column('coordinator_notes', sa.TEXT(), nullable=True),
+    sa.Column('dispute_notes', sa.TEXT(), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.Column('updated_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.CheckConstraint('check_out_time IS NULL OR check_out_time > check_in_time', name='time_entries_check'),
+    sa.CheckConstraint('hours_decimal >= 0::numeric', name='time_entries_hours_decimal_check'),
+    sa.ForeignKeyConstraint(['approved_by'], ['users.id'], name='time_entries_approved_by_fkey'),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], name='time_entries_event_id_fkey', ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['shift_id'], ['shifts.id'], name='time_entries_shift_id_fkey', ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['submitted_by'], ['users.id'], name='time_entries_submitted_by_fkey'),
+    sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], name='time_entries_tenant_id_fkey', ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['volunteer_id'], ['volunteers.id'], name='time_entries_volunteer_id_fkey', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name='time_entries_pkey'),
+    comment='Volunteer time tracking and hour entries'
+    )
+    op.create_index('idx_time_entries_event', 'time_entries', ['event_id'], unique=False, if_not_exists=True)
+    op.create_index('idx_time_entries_pending', 'time_entries', ['status', 'tenant_id'], unique=False, postgresql_where="((status)::text = 'pending'::text)", if_not_exists=True)
+    op.create_index('idx_time_entries_status', 'time_entries', ['status'], unique=False, if_not_exists=True)
+    op.create_index('idx_time_entries_tenant_checkin', 'time_entries', ['tenant_id', sa.text('check_in_time DESC'), sa.text('id DESC')], unique=False, if_not_exists=True)
+    op.create_index('idx_time_entries_volunteer', 'time_entries', ['volunteer_id', 'check_in_time'], unique=False, if_not_exists=True)
+    _create_table('workflow_executions',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('workflow_id', sa.INTEGER(), nullable=True),
+    sa.Column('executed_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.Column('records_processed', sa.INTEGER(), nullable=True),
+    sa.Column('records_affected', sa.INTEGER(), nullable=True),
+    sa.Column('status', sa.VARCHAR(length=50), server_default=sa.text("'pending'::character varying"), nullable=True),
+    sa.Column('error_message', sa.TEXT(), nullable=True),
+    sa.Column('execution_log', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.ForeignKeyConstraint(['workflow_id'], ['report_workflows.id'], name='workflow_executions_workflow_id_fkey', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name='workflow_executions_pkey')
+    )
+    op.create_index('idx_workflow_executions_workflow', 'workflow_executions', ['workflow_id', 'executed_at'], unique=False, if_not_exists=True)
+    _create_table('checkin_sessions',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('volunteer_id', sa.INTEGER(), nullable=False),
+    sa.Column('event_id', sa.INTEGER(), nullable=True),
+    sa.Column('qr_code_id', sa.INTEGER(), nullable=True),
+    sa.Column('check_in_time', postgresql.TIMESTAMP(), nullable=False),
+    sa.Column('check_out_time', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('device_info', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('ip_address', sa.VARCHAR(length=45), nullable=True),
+    sa.Column('status', sa.VARCHAR(length=50), server_default=sa.text("'active'::character varying"), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], name='checkin_sessions_event_id_fkey'),
+    sa.ForeignKeyConstraint(['qr_code_id'], ['event_qr_codes.id'], name='checkin_sessions_qr_code_id_fkey'),
+    sa.ForeignKeyConstraint(['volunteer_id'], ['volunteers.id'], name='checkin_sessions_volunteer_id_fkey'),
+    sa.PrimaryKeyConstraint('id', name='checkin_sessions_pkey'),
+    comment='Active check-in sessions for mobile/kiosk'
+    )
+    op.create_index('idx_checkin_sessions_volunteer', 'checkin_sessions', ['volunteer_id'], unique=False, if_not_exists=True)
+    _create_table('shift_swap_requests',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('original_assignment_id', sa.INTEGER(), nullable=False),
+    sa.Column('requesting_volunteer_id', sa.INTEGER(), nullable=False),
+    sa.Column('target_volunteer_id', sa.INTEGER(), nullable=True),
+    sa.Column('status', sa.VARCHAR(length=50), server_default=sa.text("'pending'::character varying"), nullable=False),
+    sa.Column('approved_by', sa.INTEGER(), nullable=True),
+    sa.Column('approved_at', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('rejection_reason', sa.TEXT(), nullable=True),
+    sa.Column('reason', sa.TEXT(), nullable=True),
+    sa.Column('created_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.Column('updated_at', postgresql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.ForeignKeyConstraint(['approved_by'], ['users.id'], name='shift_swap_requests_approved_by_fkey'),
+    sa.ForeignKeyConstraint(['original_assignment_id'], ['event_assignments.id'], name='shift_swap_requests_original_assignment_id_fkey'),
+    sa.ForeignKeyConstraint(['requesting_volunteer_id'], ['volunteers.id'], name='shift_swap_requests_requesting_volunteer_id_fkey'),
+    sa.ForeignKeyConstraint(['target_volunteer_id'], ['volunteers.id'], name='shift_swap_requests_target_volunteer_id_fkey'),
+    sa.PrimaryKeyConstraint('id', name='shift_swap_requests_pkey'),
+    comment='Volunteer-initiated shift swap requests'
+    )
+    op.create_index('idx_shift_swap_status', 'shift_swap_requests', ['status', 'created_at'], unique=False, if_not_exists=True)
+    
+    # Rows outside every monthly partition land here
+    op.execute("CREATE TABLE IF NOT EXISTS audit_logs_default PARTITION OF audit_logs DEFAULT")
+    op.execute("CREATE TABLE IF NOT EXISTS document_access_log_default PARTITION OF document_access_log DEFAULT")
+
+
+def downgrade() -> None:
+    # The baseline may have adopted tables created before migrations existed,
+    # so it is never dropped automatically.
+    pass
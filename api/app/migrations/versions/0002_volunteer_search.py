@@ -0,0 +1,58 @@
+"""Volunteer search vector and trigram name index
+
+Adds volunteers.search_vector, a stored generated tsvector over name,
+occupation, license type, languages, skills and city, with a GIN index, plus
+a pg_trgm GIN index on "first_name last_name" for fuzzy name matching. Both
+back GET /api/v1/volunteers/search.
+
+Adding a stored generated column rewrites the volunteers table under an
+exclusive lock (seconds for a few hundred thousand rows); the indexes are
+then built CONCURRENTLY so writes are not blocked while they build. Needs the
+pg_trgm extension (part of postgresql-contrib, included in the postgres
+images and on RDS/Cloud SQL).
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 18:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same expression as models.volunteer.SEARCH_VECTOR_SQL at this revision
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(first_name, '') || ' ' || coalesce(last_name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(occupation, '') || ' ' || coalesce(license_type, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(languages, '') || ' ' || coalesce(skills, '') || ' ' || coalesce(professional_skills, '')), 'C') || "
+    "setweight(to_tsvector('english', coalesce(city, '')), 'D')"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "ALTER TABLE volunteers ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_volunteers_search_vector "
+            "ON volunteers USING gin (search_vector)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_volunteers_search_name_trgm "
+            "ON volunteers USING gin ((first_name || ' ' || last_name) gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_volunteers_search_name_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_volunteers_search_vector")
+    op.execute("ALTER TABLE volunteers DROP COLUMN IF EXISTS search_vector")
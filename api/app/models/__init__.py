@@ -14,6 +14,7 @@ from models.training import (
     TrainingRequirement
 )
 from models.audit import AuditLog
+from models.revoked_token import RevokedToken
 from models.time_tracking import TimeEntry, EventQRCode, CheckinSession
 from models.document import (
     PolicyDocument,
@@ -42,6 +43,7 @@ __all__ = [
     "Certification",
     "TrainingRequirement",
     "AuditLog",
+    "RevokedToken",
     "TimeEntry",
     "EventQRCode",
     "CheckinSession",
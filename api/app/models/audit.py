@@ -2,7 +2,7 @@
 Audit logging model for compliance and security.
 Tracks all significant user actions in the system.
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
@@ -14,12 +14,14 @@ class AuditLog(Base):
     Required for compliance (HIPAA, security standards).
     """
     __tablename__ = "audit_logs"
+    # Monthly partitions, see db_init/09_partition_audit_logs.sql and services/audit_archive.py
+    __table_args__ = {"postgresql_partition_by": "RANGE (created_at)"}
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     
     # User and Tenant
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    tenant_id = Column(Integer, ForeignKey("tenants.id"), nullable=False, index=True)
+    tenant_id = Column(Integer, ForeignKey("tenants.id"), nullable=False)
     
     # Action Details
     action = Column(String(100), nullable=False, index=True)  # e.g., "user.created", "volunteer.updated"
@@ -41,10 +43,21 @@ class AuditLog(Base):
     status = Column(String(20))  # success, failure, error
     
     # Timestamp
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, primary_key=True)  # Partition key
     
     # Relationships
     user = relationship("User", back_populates="audit_logs")
     
     def __repr__(self):
         return f"<AuditLog(id={self.id}, action='{self.action}', user_id={self.user_id})>"
+
+
+# Audit search (/api/v1/audit): each filter plus the (created_at DESC, id DESC) keyset order
+Index("idx_audit_logs_tenant_created", AuditLog.tenant_id, AuditLog.created_at.desc(), AuditLog.id.desc())
+Index("idx_audit_logs_tenant_user_created", AuditLog.tenant_id, AuditLog.user_id, AuditLog.created_at.desc(), AuditLog.id.desc())
+Index("idx_audit_logs_tenant_action_created", AuditLog.tenant_id, AuditLog.action, AuditLog.created_at.desc(), AuditLog.id.desc())
+Index(
+    "idx_audit_logs_tenant_resource_created",
+    AuditLog.tenant_id, AuditLog.resource_type, AuditLog.resource_id, AuditLog.created_at.desc(), AuditLog.id.desc()
+)
+Index("idx_audit_logs_created", AuditLog.created_at.desc(), AuditLog.id.desc())
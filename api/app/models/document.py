@@ -178,8 +178,10 @@ class DocumentAccessLog(Base):
     Audit trail for document access (required for HIPAA compliance).
     """
     __tablename__ = "document_access_log"
+    # Monthly partitions, see db_init/09_partition_audit_logs.sql and services/audit_archive.py
+    __table_args__ = {"postgresql_partition_by": "RANGE (accessed_at)"}
     
-    id = Column(BigInteger, primary_key=True, index=True)
+    id = Column(BigInteger, primary_key=True, autoincrement=True, index=True)
     
     # What
     document_id = Column(Integer)
@@ -195,7 +197,7 @@ class DocumentAccessLog(Base):
     user_agent = Column(Text)
     
     # When
-    accessed_at = Column(DateTime, default=datetime.utcnow, index=True)
+    accessed_at = Column(DateTime, default=datetime.utcnow, nullable=False, primary_key=True, index=True)  # Partition key
     
     # Context
     meta_data = Column("metadata", JSONB)
@@ -2,7 +2,7 @@
 Event and shift management models.
 Supports both emergency and non-emergency activities.
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Date, Time, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Date, Time, Enum as SQLEnum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -89,6 +89,10 @@ class Event(Base):
         return f"<Event(id={self.id}, name='{self.name}', type='{self.activity_type}')>"
 
 
+# Keyset pagination on the list endpoint: tenant filter plus the sort key
+Index("idx_events_tenant_id_id", Event.tenant_id, Event.id)
+
+
 class Shift(Base):
     """
     Shift model for scheduled volunteer time blocks.
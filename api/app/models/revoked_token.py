@@ -0,0 +1,27 @@
+"""
+Revoked JWT model.
+Lets logout (and administrators) invalidate tokens before they expire.
+"""
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from datetime import datetime
+from database import Base
+
+
+class RevokedToken(Base):
+    """
+    A token id (jti claim) that must no longer be accepted.
+    Rows can be purged once expires_at has passed.
+    """
+    __tablename__ = "revoked_tokens"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    jti = Column(String(64), nullable=False, unique=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    token_type = Column(String(20))  # access, refresh
+    reason = Column(String(100))  # logout, admin, password_change
+    
+    expires_at = Column(DateTime, nullable=False, index=True)
+    revoked_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    
+    def __repr__(self):
+        return f"<RevokedToken(jti='{self.jti}', user_id={self.user_id})>"
@@ -2,7 +2,8 @@
 """
 Time tracking models for volunteer hours.
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, DECIMAL
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, DECIMAL, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
@@ -67,6 +68,10 @@ class TimeEntry(Base):
         return f"<TimeEntry(id={self.id}, volunteer={self.volunteer_id}, hours={self.hours_decimal})>"
 
 
+# Keyset pagination on the list endpoint: tenant filter plus (check_in_time DESC, id DESC)
+Index("idx_time_entries_tenant_checkin", TimeEntry.tenant_id, TimeEntry.check_in_time.desc(), TimeEntry.id.desc())
+
+
 class EventQRCode(Base):
     """
     QR codes for event/shift check-in.
@@ -130,7 +135,7 @@ class CheckinSession(Base):
     # Session data
     check_in_time = Column(DateTime, nullable=False)
     check_out_time = Column(DateTime)
-    device_info = Column(Text)  # JSON string
+    device_info = Column(JSONB)  # Device type, browser, etc.
     ip_address = Column(String(45))
     
     # Status
@@ -2,7 +2,7 @@
 User model for staff and administrators.
 Implements role-based access control (RBAC).
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum as SQLEnum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -96,3 +96,7 @@ class User(Base):
     @property
     def is_superuser(self):
         return self.role == "system_admin"
+
+
+# Keyset pagination on the list endpoint: tenant filter plus the sort key
+Index("idx_users_tenant_id_id", User.tenant_id, User.id)
@@ -2,13 +2,27 @@
 Volunteer model with comprehensive profile management.
 Enhanced to match the new database schema with all fields.
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Date, Enum as SQLEnum, DECIMAL
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Date, Enum as SQLEnum, DECIMAL, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, query_expression, relationship
 from datetime import datetime, date
 import enum
 from database import Base
 
 
+# Text search configuration of search_vector; queries must parse with the same one
+SEARCH_CONFIG = "english"
+
+# Weighted document for /volunteers/search: name (A), occupation and license (B),
+# languages and skills (C), city (D). Kept in sync with migration 0002.
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(first_name, '') || ' ' || coalesce(last_name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(occupation, '') || ' ' || coalesce(license_type, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(languages, '') || ' ' || coalesce(skills, '') || ' ' || coalesce(professional_skills, '')), 'C') || "
+    "setweight(to_tsvector('english', coalesce(city, '')), 'D')"
+)
+
+
 class VolunteerStatus(str, enum.Enum):
     """Volunteer application status."""
     APPROVED = "approved"
@@ -86,6 +100,10 @@ class Volunteer(Base):
     skills = Column(Text)
     languages = Column(String(255))
     
+    # Generated by Postgres; deferred so ordinary loads don't fetch it
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True)))
+    search_rank = query_expression()  # Populated by /volunteers/search only
+    
     # Training and Credentials
     certifications = Column(Text)
     certification_info = Column(Text)
@@ -149,4 +167,17 @@ class Volunteer(Base):
     @property
     def hours_completed(self):
         """Alias for total_hours for compatibility."""
-        return self.total_hours or 0
\ No newline at end of file
+        return self.total_hours or 0
+
+
+# Keyset pagination on the list endpoint: tenant filter plus the sort key
+Index("idx_volunteers_tenant_id_id", Volunteer.tenant_id, Volunteer.id)
+
+# Search: full text over search_vector, pg_trgm fuzzy matching on "first last".
+# Queries must use search_name verbatim for the trigram index to apply.
+search_name = (Volunteer.first_name + " " + Volunteer.last_name).label("search_name")
+Index("idx_volunteers_search_vector", Volunteer.search_vector, postgresql_using="gin")
+Index(
+    "idx_volunteers_search_name_trgm", search_name,
+    postgresql_using="gin", postgresql_ops={"search_name": "gin_trgm_ops"}
+)
@@ -0,0 +1,34 @@
+"""
+Audit log schemas for the audit trail search API.
+"""
+from pydantic import BaseModel
+from typing import Optional, List, Any
+from datetime import datetime
+
+
+class AuditLogResponse(BaseModel):
+    """Single audit log entry."""
+    id: int
+    user_id: int
+    tenant_id: int
+    action: str
+    resource_type: str
+    resource_id: Optional[int] = None
+    ip_address: Optional[str] = None
+    user_agent: Optional[str] = None
+    endpoint: Optional[str] = None
+    http_method: Optional[str] = None
+    old_values: Optional[Any] = None
+    new_values: Optional[Any] = None
+    description: Optional[str] = None
+    status: Optional[str] = None
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
+class AuditLogPage(BaseModel):
+    """One page of audit entries, newest first."""
+    items: List[AuditLogResponse]
+    next_cursor: Optional[str] = None  # Pass as ?cursor= to fetch the next page
@@ -18,6 +18,7 @@ class TokenData(BaseModel):
     username: Optional[str] = None
     tenant_id: Optional[int] = None
     role: Optional[str] = None
+    perm: Optional[int] = None  # Compiled permission mask (core.permissions)
 
 
 class LoginRequest(BaseModel):
@@ -31,6 +32,11 @@ class RefreshTokenRequest(BaseModel):
     refresh_token: str
 
 
+class LogoutRequest(BaseModel):
+    """Logout request; the refresh token is revoked along with the access token."""
+    refresh_token: Optional[str] = None
+
+
 class ChangePasswordRequest(BaseModel):
     """Change password request."""
     current_password: str
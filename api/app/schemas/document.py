@@ -210,3 +210,10 @@ class DocumentUploadResponse(BaseModel):
     upload_url: str
     document_id: int
     expires_in: int  # Seconds
+
+
+class DocumentDownloadResponse(BaseModel):
+    """Response with presigned URL for download."""
+    download_url: str
+    document_id: int
+    expires_in: int  # Seconds
@@ -63,8 +63,9 @@ class EventResponse(EventBase):
 
 class EventListResponse(BaseModel):
     """Schema for event list response."""
-    total: int
+    total: Optional[int] = None  # None when requested with count=none
     items: List[EventResponse]
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= for the next page
 
 # For frontend compatibility - simplified response
 class EventSimpleResponse(BaseModel):
@@ -50,5 +50,6 @@ class TenantResponse(TenantBase):
 
 class TenantListResponse(BaseModel):
     """Schema for tenant list response."""
-    total: int
+    total: Optional[int] = None  # None when requested with count=none
     items: list[TenantResponse]
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= for the next page
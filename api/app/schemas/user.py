@@ -78,5 +78,6 @@ class UserResponse(UserBase):
 
 class UserListResponse(BaseModel):
     """Schema for user list response."""
-    total: int
+    total: Optional[int] = None  # None when requested with count=none
     items: list[UserResponse]
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= for the next page
@@ -197,8 +197,20 @@ class VolunteerResponse(BaseModel):
 
 class VolunteerListResponse(BaseModel):
     """Schema for volunteer list response."""
-    total: int
+    total: Optional[int] = None  # None when requested with count=none
     items: list[VolunteerResponse]
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= for the next page
+
+
+class VolunteerSearchResult(VolunteerResponse):
+    """Volunteer search hit; search_rank is null when no text query was given."""
+    search_rank: Optional[float] = None
+
+
+class VolunteerSearchResponse(BaseModel):
+    """Schema for ranked volunteer search results."""
+    total: Optional[int] = None  # None when requested with count=none
+    items: list[VolunteerSearchResult]
 
 
 class VolunteerStatsResponse(BaseModel):
@@ -1,12 +1,154 @@
 """
 Audit logging service for tracking user actions.
+Entries are queued and written in batches by a background AuditWriter; pass
+synchronous=True (or set AUDIT_WRITE_MODE=sync) where the row must be committed
+before the request returns.
 """
+import logging
+import queue
+import threading
+import time
 from typing import Optional
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from datetime import datetime
 
+from config import get_settings
+from core.request_context import current_request_context
+from core.spool import NdjsonSpool
+from database import engine
 from models.audit import AuditLog
 
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def _decode_spooled_row(row: dict) -> dict:
+    row["created_at"] = datetime.fromisoformat(row["created_at"])
+    return row
+
+
+class AuditWriter:
+    """
+    Background writer that batches audit rows into multi-row inserts.
+    Batches that cannot be written (database down, queue full, shutdown) are
+    appended to an NDJSON spool file and replayed on the next start.
+    """
+    
+    def __init__(self, batch_size: int, flush_interval: float, max_queue_size: int, spool_dir: str):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spool = NdjsonSpool(spool_dir, "audit", decode=_decode_spooled_row)
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.written = 0
+        self.batches = 0
+        self.spooled = 0
+        self.failures = 0
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self):
+        """Replay any spooled rows, then start the flush thread."""
+        if self.running:
+            return
+        self.replay_spool()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 10.0):
+        """Flush what is queued; anything left after timeout goes to the spool."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        leftover = self._drain(self._queue.qsize())
+        if leftover:
+            self._spool(leftover)
+    
+    def submit(self, row: dict):
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self._spool([row])
+    
+    def _drain(self, limit: int) -> list:
+        rows = []
+        while len(rows) < limit:
+            try:
+                rows.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return rows
+    
+    def _run(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while not (self._stop.is_set() and self._queue.empty()):
+            try:
+                batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                batch.extend(self._drain(self.batch_size - len(batch)))
+            except queue.Empty:
+                pass
+            if len(batch) >= self.batch_size or time.monotonic() >= deadline or self._stop.is_set():
+                if batch:
+                    self._flush(batch)
+                    batch = []
+                deadline = time.monotonic() + self.flush_interval
+        if batch:
+            self._flush(batch)
+    
+    def _flush(self, rows: list):
+        try:
+            with engine.begin() as conn:
+                conn.execute(insert(AuditLog.__table__), rows)
+            self.written += len(rows)
+            self.batches += 1
+        except Exception as e:
+            self.failures += 1
+            logger.error("Audit flush of %d rows failed, spooling: %s", len(rows), e)
+            self._spool(rows)
+    
+    def _spool(self, rows: list):
+        self.spool.append(rows)
+        self.spooled += len(rows)
+    
+    def replay_spool(self):
+        """Insert rows spooled by this or any previous worker that has since exited."""
+        def write(rows: list):
+            with engine.begin() as conn:
+                for start in range(0, len(rows), self.batch_size):
+                    conn.execute(insert(AuditLog.__table__), rows[start:start + self.batch_size])
+        
+        replayed = self.spool.replay(write)
+        if replayed:
+            self.written += replayed
+            logger.info("Replayed %d spooled audit rows", replayed)
+    
+    def as_dict(self) -> dict:
+        return {
+            "mode": settings.AUDIT_WRITE_MODE,
+            "running": self.running,
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "batches": self.batches,
+            "spooled": self.spooled,
+            "corrupt_spool_lines": self.spool.corrupt,
+            "failures": self.failures,
+        }
+
+
+audit_writer = AuditWriter(
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL_SECONDS,
+    max_queue_size=settings.AUDIT_QUEUE_MAX_SIZE,
+    spool_dir=settings.AUDIT_SPOOL_DIR
+)
+
 
 def log_action(
     db: Session,
@@ -20,7 +162,8 @@ def log_action(
     new_values: Optional[dict] = None,
     ip_address: Optional[str] = None,
     user_agent: Optional[str] = None,
-    status: str = "success"
+    status: str = "success",
+    synchronous: bool = False
 ):
     """
     Create an audit log entry.
@@ -35,10 +178,41 @@ def log_action(
         description: Human-readable description
         old_values: Previous state (for updates)
         new_values: New state
-        ip_address: Client IP address
-        user_agent: Client user agent
+        ip_address: Client IP address (defaults to the current request's)
+        user_agent: Client user agent (defaults to the current request's)
         status: Action status (success, failure, error)
+        synchronous: Commit the entry on db before returning (compliance-critical actions)
+    
+    Returns:
+        The committed AuditLog when written synchronously, None when queued.
     """
+    # Request details captured by RequestContextMiddleware
+    context = current_request_context()
+    endpoint = context.endpoint if context else None
+    http_method = context.http_method if context else None
+    if context:
+        ip_address = ip_address or context.ip_address
+        user_agent = user_agent or context.user_agent
+    
+    if not synchronous and settings.AUDIT_WRITE_MODE != "sync" and audit_writer.running:
+        audit_writer.submit({
+            "user_id": user_id,
+            "tenant_id": tenant_id,
+            "action": action,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "description": description,
+            "old_values": old_values,
+            "new_values": new_values,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            "endpoint": endpoint,
+            "http_method": http_method,
+            "status": status,
+            "created_at": datetime.utcnow(),
+        })
+        return None
+    
     audit_log = AuditLog(
         user_id=user_id,
         tenant_id=tenant_id,
@@ -50,6 +224,8 @@ def log_action(
         new_values=new_values,
         ip_address=ip_address,
         user_agent=user_agent,
+        endpoint=endpoint,
+        http_method=http_method,
         status=status,
         created_at=datetime.utcnow()
     )
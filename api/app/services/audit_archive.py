@@ -0,0 +1,237 @@
+"""
+Audit partition maintenance and archival.
+audit_logs and document_access_log are range-partitioned by month
+(db_init/09_partition_audit_logs.sql). This module creates upcoming monthly
+partitions, moves partitions older than the retention window into gzip
+NDJSON archives, and searches those archives on demand.
+
+Usage (e.g. from a monthly cron job):
+    python -m services.audit_archive ensure
+    python -m services.audit_archive archive --retention-months 24
+    python -m services.audit_archive search --table audit_logs \\
+        --start 2024-01-01 --end 2024-04-01 --filter tenant_id=3
+"""
+import argparse
+import gzip
+import json
+import logging
+import os
+import re
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Iterator, Optional
+
+from sqlalchemy import text
+
+from config import get_settings
+from core.structured_logging import configure_logging
+from database import engine
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Partitioned table -> partition key column
+PARTITIONED_TABLES = {
+    "audit_logs": "created_at",
+    "document_access_log": "accessed_at",
+}
+
+_PARTITION_SUFFIX = re.compile(r"_y(\d{4})m(\d{2})$")
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """Monthly partition name, e.g. audit_logs_y2024m03."""
+    return f"{table}_y{month:%Y}m{month:%m}"
+
+
+def archive_path(table: str, month: date, archive_dir: Optional[str] = None) -> str:
+    return os.path.join(archive_dir or settings.AUDIT_ARCHIVE_DIR, table, f"{month:%Y-%m}.ndjson.gz")
+
+
+def _is_partitioned(conn, table: str) -> bool:
+    relkind = conn.execute(
+        text("SELECT relkind FROM pg_class WHERE relname = :table AND relnamespace = 'public'::regnamespace"),
+        {"table": table}
+    ).scalar()
+    return relkind == "p"
+
+
+def list_partitions(conn, table: str) -> list:
+    """(partition name, month) for each attached monthly partition, oldest first."""
+    names = conn.execute(text("""
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        WHERE parent.relname = :table
+    """), {"table": table}).scalars()
+    
+    partitions = []
+    for name in names:
+        match = _PARTITION_SUFFIX.search(name)
+        if match:
+            partitions.append((name, date(int(match.group(1)), int(match.group(2)), 1)))
+    return sorted(partitions, key=lambda p: p[1])
+
+
+def ensure_partitions(months_ahead: Optional[int] = None):
+    """Create the current and upcoming monthly partitions plus the DEFAULT partition."""
+    months_ahead = settings.AUDIT_PARTITIONS_AHEAD if months_ahead is None else months_ahead
+    current = month_start(date.today())
+    
+    for table in PARTITIONED_TABLES:
+        with engine.begin() as conn:
+            if not _is_partitioned(conn, table):
+                continue
+            conn.execute(text(f'CREATE TABLE IF NOT EXISTS "{table}_default" PARTITION OF "{table}" DEFAULT'))
+            for offset in range(months_ahead + 1):
+                month = add_months(current, offset)
+                conn.execute(text(
+                    f'CREATE TABLE IF NOT EXISTS "{partition_name(table, month)}" PARTITION OF "{table}" '
+                    f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+                ))
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def archive_partition(table: str, month: date, archive_dir: Optional[str] = None) -> str:
+    """
+    Export one monthly partition to gzip NDJSON, then detach and drop it.
+    The archive is fully written and fsynced before the partition is dropped.
+    """
+    name = partition_name(table, month)
+    path = archive_path(table, month, archive_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    
+    exported = 0
+    partial = f"{path}.partial"
+    with engine.connect() as conn, gzip.open(partial, "wt", encoding="utf-8") as out:
+        result = conn.execution_options(stream_results=True, yield_per=1000).execute(
+            text(f'SELECT * FROM "{name}" ORDER BY id')
+        )
+        for row in result.mappings():
+            out.write(json.dumps(dict(row), default=_json_default) + "\n")
+            exported += 1
+    with open(partial, "rb") as f:
+        os.fsync(f.fileno())
+    os.replace(partial, path)
+    
+    with engine.begin() as conn:
+        # Block inserts until the partition is detached, so nothing lands after the count
+        conn.execute(text(f'LOCK TABLE "{name}" IN SHARE MODE'))
+        count = conn.execute(text(f'SELECT count(*) FROM "{name}"')).scalar()
+        if count != exported:
+            raise RuntimeError(f"{name} changed during export ({exported} exported, {count} now)")
+        conn.execute(text(f'ALTER TABLE "{table}" DETACH PARTITION "{name}"'))
+        conn.execute(text(f'DROP TABLE "{name}"'))
+    
+    logger.info("Archived %d rows from %s to %s", exported, name, path)
+    return path
+
+
+def archive_old_partitions(retention_months: Optional[int] = None, archive_dir: Optional[str] = None) -> list:
+    """Archive every monthly partition older than the retention window."""
+    retention_months = settings.AUDIT_PARTITION_RETENTION_MONTHS if retention_months is None else retention_months
+    cutoff = add_months(month_start(date.today()), -retention_months)
+    
+    archived = []
+    for table in PARTITIONED_TABLES:
+        with engine.connect() as conn:
+            if not _is_partitioned(conn, table):
+                continue
+            partitions = list_partitions(conn, table)
+        for name, month in partitions:
+            if month < cutoff:
+                archived.append(archive_partition(table, month, archive_dir))
+    return archived
+
+
+def search_archives(
+    table: str,
+    start: datetime,
+    end: datetime,
+    filters: Optional[dict] = None,
+    limit: Optional[int] = None,
+    archive_dir: Optional[str] = None
+) -> Iterator[dict]:
+    """
+    Yield archived rows of a table with start <= partition key < end whose
+    columns equal every value in filters. Only months in the range are read.
+    """
+    key = PARTITIONED_TABLES[table]
+    filters = filters or {}
+    found = 0
+    
+    month = month_start(start)
+    # Compare whole months: an end inside a month (even on its 1st) still needs that month
+    while month <= month_start(end):
+        path = archive_path(table, month, archive_dir)
+        month = add_months(month, 1)
+        if not os.path.exists(path):
+            continue
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                row = json.loads(line)
+                at = datetime.fromisoformat(row[key])
+                if not (start <= at < end):
+                    continue
+                if any(row.get(column) != value for column, value in filters.items()):
+                    continue
+                yield row
+                found += 1
+                if limit is not None and found >= limit:
+                    return
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    ensure = commands.add_parser("ensure", help="Create upcoming monthly partitions")
+    ensure.add_argument("--months-ahead", type=int, default=None)
+    
+    archive = commands.add_parser("archive", help="Archive partitions older than the retention window")
+    archive.add_argument("--retention-months", type=int, default=None)
+    archive.add_argument("--archive-dir", default=None)
+    
+    search = commands.add_parser("search", help="Search archived months, printing NDJSON")
+    search.add_argument("--table", choices=sorted(PARTITIONED_TABLES), default="audit_logs")
+    search.add_argument("--start", type=datetime.fromisoformat, required=True)
+    search.add_argument("--end", type=datetime.fromisoformat, required=True)
+    search.add_argument("--filter", action="append", default=[], help="column=value (integers compared as integers)")
+    search.add_argument("--limit", type=int, default=None)
+    search.add_argument("--archive-dir", default=None)
+    
+    args = parser.parse_args()
+    configure_logging(settings.LOG_LEVEL, settings.LOG_FORMAT)
+    if args.command == "ensure":
+        ensure_partitions(args.months_ahead)
+    elif args.command == "archive":
+        ensure_partitions()
+        archive_old_partitions(args.retention_months, args.archive_dir)
+    else:
+        filters = {}
+        for item in args.filter:
+            column, _, value = item.partition("=")
+            filters[column] = int(value) if value.lstrip("-").isdigit() else value
+        for row in search_archives(args.table, args.start, args.end, filters, args.limit, args.archive_dir):
+            print(json.dumps(row))
+
+
+if __name__ == "__main__":
+    main()
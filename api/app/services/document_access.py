@@ -0,0 +1,196 @@
+"""
+Coalesced document access logging.
+Views, downloads and signatures are buffered in memory and flushed
+periodically: all buffered rows go into document_access_log in one bulk
+insert, and each touched volunteer document gets a single UPDATE adding its
+coalesced download count and latest access time. Rows that cannot be buffered
+or written are spooled to disk like audit entries (see services.audit).
+"""
+import logging
+import threading
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import bindparam, func, insert, update
+
+from config import get_settings
+from core.request_context import current_request_context
+from core.spool import NdjsonSpool
+from database import engine
+from models.document import DocumentAccessLog, VolunteerDocument
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Actions that count towards VolunteerDocument.download_count
+COUNTED_ACTIONS = {"view", "download"}
+
+
+def _count(counters: dict, row: dict):
+    """Add one row to the per-document download counters."""
+    if row["document_type"] == "volunteer_document" and row["action"] in COUNTED_ACTIONS and row["document_id"]:
+        counter = counters.setdefault(row["document_id"], [0, row["accessed_at"]])
+        counter[0] += 1
+        counter[1] = max(counter[1], row["accessed_at"])
+
+
+def _decode_spooled_row(row: dict) -> dict:
+    row["accessed_at"] = datetime.fromisoformat(row["accessed_at"])
+    return row
+
+
+class DocumentAccessAggregator:
+    """
+    Buffers access rows and per-document counters between flushes.
+    Rows beyond max_pending and rows of failed flushes are appended to an
+    NDJSON spool and replayed (counters included) on the next start, so no
+    access row is ever dropped.
+    """
+    
+    def __init__(self, flush_interval: float, max_pending: int, spool_dir: str):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.spool = NdjsonSpool(spool_dir, "document-access", decode=_decode_spooled_row)
+        self._lock = threading.Lock()
+        self._rows: list = []
+        self._counters: dict = {}  # volunteer document id -> [count, last_accessed_at]
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.written = 0
+        self.flushes = 0
+        self.failures = 0
+        self.spooled = 0
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self):
+        """Replay any spooled rows, then start the flush thread."""
+        if self.running:
+            return
+        self.replay_spool()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="document-access-flush", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 10.0):
+        """Stop the flush thread after one final flush."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def record(self, row: dict):
+        with self._lock:
+            if len(self._rows) < self.max_pending:
+                self._rows.append(row)
+                _count(self._counters, row)
+                return
+        # Buffer full: the spooled row is counted when the spool is replayed
+        self._spool([row])
+    
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+        self.flush()
+    
+    def flush(self):
+        with self._lock:
+            rows, self._rows = self._rows, []
+            counters, self._counters = self._counters, {}
+        if not rows:
+            return
+        
+        try:
+            self._write(rows, counters)
+            self.flushes += 1
+        except Exception as e:
+            self.failures += 1
+            logger.error("Document access flush of %d rows failed, spooling: %s", len(rows), e)
+            # The counters were built from exactly these rows and are rebuilt on replay
+            self._spool(rows)
+    
+    def _write(self, rows: list, counters: dict):
+        """Insert rows and apply their counters in one transaction."""
+        with engine.begin() as conn:
+            conn.execute(insert(DocumentAccessLog.__table__), rows)
+            if counters:
+                conn.execute(
+                    update(VolunteerDocument.__table__)
+                    .where(VolunteerDocument.__table__.c.id == bindparam("document_id"))
+                    .values(
+                        download_count=func.coalesce(VolunteerDocument.__table__.c.download_count, 0) + bindparam("accesses"),
+                        last_accessed_at=func.greatest(VolunteerDocument.__table__.c.last_accessed_at, bindparam("accessed_at"))
+                    ),
+                    [
+                        {"document_id": document_id, "accesses": count, "accessed_at": accessed_at}
+                        for document_id, (count, accessed_at) in counters.items()
+                    ]
+                )
+        self.written += len(rows)
+    
+    def _spool(self, rows: list):
+        self.spool.append(rows)
+        self.spooled += len(rows)
+    
+    def replay_spool(self):
+        """Write rows spooled by this or any previous worker that has since exited."""
+        def write(rows: list):
+            counters: dict = {}
+            for row in rows:
+                _count(counters, row)
+            self._write(rows, counters)
+        
+        replayed = self.spool.replay(write)
+        if replayed:
+            logger.info("Replayed %d spooled document access rows", replayed)
+    
+    def as_dict(self) -> dict:
+        return {
+            "running": self.running,
+            "pending_rows": len(self._rows),
+            "pending_documents": len(self._counters),
+            "written": self.written,
+            "flushes": self.flushes,
+            "failures": self.failures,
+            "spooled": self.spooled,
+            "corrupt_spool_lines": self.spool.corrupt,
+        }
+
+
+document_access = DocumentAccessAggregator(
+    flush_interval=settings.DOCUMENT_ACCESS_FLUSH_SECONDS,
+    max_pending=settings.DOCUMENT_ACCESS_MAX_PENDING,
+    spool_dir=settings.AUDIT_SPOOL_DIR
+)
+
+
+def record_document_access(
+    document_id: int,
+    document_type: str,
+    action: str,
+    user_id: Optional[int] = None,
+    volunteer_id: Optional[int] = None,
+    meta_data: Optional[dict] = None
+) -> bool:
+    """
+    Buffer one access for the next flush. Returns False when the aggregator
+    is not running, in which case the caller should write the row itself.
+    """
+    if not document_access.running:
+        return False
+    
+    context = current_request_context()
+    document_access.record({
+        "document_id": document_id,
+        "document_type": document_type,
+        "user_id": user_id,
+        "volunteer_id": volunteer_id,
+        "action": action,
+        "ip_address": context.ip_address if context else None,
+        "user_agent": context.user_agent if context else None,
+        "accessed_at": datetime.utcnow(),
+        "metadata": meta_data,
+    })
+    return True
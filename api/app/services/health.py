@@ -0,0 +1,208 @@
+# api/app/services/health.py
+"""
+Readiness checks behind /health/ready.
+Unlike /health (liveness), readiness touches the worker's dependencies:
+
+  database    SELECT 1 round-trip through the async pool           (critical)
+  pools       checked-out share of pool_size + max_overflow         (critical)
+  event_loop  worst scheduling lag over the last few seconds        (critical)
+  s3          HeadBucket on the documents bucket                    (degraded)
+  queues      audit, document access and log queue depth            (degraded)
+
+A failing critical check makes the worker not ready (503) so the load balancer
+stops routing to it; the others only report "degraded". Results are cached per
+worker for HEALTH_CACHE_SECONDS and concurrent callers share one run, so a
+tight probe interval across many pollers costs one round of checks.
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Optional
+
+from sqlalchemy import text
+
+from config import get_settings
+from core.db_pool import pool_status
+from core.structured_logging import log_queue_depth
+from database import engine, async_engine, replica_health
+from services.audit import audit_writer
+from services.document_access import document_access
+from services.s3_storage import get_s3_storage
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """
+    Measures how late the event loop wakes a sleeping task. Sustained lag means
+    something is blocking the loop and every request on this worker is waiting.
+    """
+    
+    def __init__(self, interval_seconds: float = 0.25, window: int = 20):
+        self.interval_seconds = interval_seconds
+        self._samples: deque = deque(maxlen=window)
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            self._samples.append(max(loop.time() - expected, 0.0))
+    
+    def as_dict(self) -> dict:
+        return {
+            "running": self._task is not None,
+            "last_ms": round(self._samples[-1] * 1000, 2) if self._samples else None,
+            "max_ms": round(max(self._samples) * 1000, 2) if self._samples else None,
+            "window_seconds": round(self.interval_seconds * self._samples.maxlen, 2),
+        }
+
+
+loop_lag = LoopLagMonitor()
+
+
+async def check_database() -> dict:
+    async with async_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    return {"ok": True}
+
+
+async def check_pools() -> dict:
+    pools = {"primary": engine.pool, "primary_async": async_engine.pool}
+    status = {}
+    for name, pool in pools.items():
+        occupancy = pool_status(pool)
+        capacity = occupancy["size"] + max(occupancy["max_overflow"], 0)
+        saturation = occupancy["checked_out"] / capacity if capacity else 0.0
+        status[name] = {
+            "checked_out": occupancy["checked_out"],
+            "capacity": capacity,
+            "saturation": round(saturation, 3),
+        }
+    ok = all(pool["saturation"] < settings.HEALTH_MAX_POOL_SATURATION for pool in status.values())
+    if replica_health is not None:
+        # Reads fall back to the primary, so a lagging replica is informational
+        status["replica"] = replica_health.as_dict()
+    return {"ok": ok, **status}
+
+
+async def check_event_loop() -> dict:
+    lag = loop_lag.as_dict()
+    ok = lag["max_ms"] is None or lag["max_ms"] < settings.HEALTH_MAX_LOOP_LAG_MS
+    return {"ok": ok, **lag}
+
+
+_s3_ping: Optional[asyncio.Future] = None
+
+
+def _ping_s3() -> str:
+    # Runs in a worker thread: the first call also imports boto3 and builds the client
+    storage = get_s3_storage()
+    if storage is None:
+        raise RuntimeError("S3 client could not be created")
+    storage.ping()
+    return storage.bucket_name
+
+
+async def check_s3() -> dict:
+    global _s3_ping
+    # A hung HeadBucket keeps its thread; later probes wait on the same call
+    # instead of piling up more threads behind an unreachable endpoint
+    if _s3_ping is None or _s3_ping.done():
+        _s3_ping = asyncio.ensure_future(asyncio.to_thread(_ping_s3))
+        _s3_ping.add_done_callback(lambda ping: ping.cancelled() or ping.exception())
+    bucket = await asyncio.shield(_s3_ping)
+    return {"ok": True, "bucket": bucket}
+
+
+async def check_queues() -> dict:
+    audit_queued = audit_writer.as_dict()["queued"]
+    audit_limit = settings.AUDIT_QUEUE_MAX_SIZE
+    access = document_access.as_dict()
+    fill = settings.HEALTH_MAX_QUEUE_FILL
+    ok = (
+        (not audit_limit or audit_queued < audit_limit * fill)
+        and access["pending_rows"] < document_access.max_pending * fill
+    )
+    return {
+        "ok": ok,
+        "audit": {"queued": audit_queued, "limit": audit_limit, "running": audit_writer.running},
+        "document_access": {"pending_rows": access["pending_rows"], "limit": document_access.max_pending, "running": access["running"]},
+        "log": {"queued": log_queue_depth()},
+    }
+
+
+class ReadinessProbe:
+    """
+    Runs every check concurrently, each bounded by timeout_seconds, and reuses
+    the combined result for cache_seconds.
+    """
+    
+    def __init__(self, checks: dict, cache_seconds: float, timeout_seconds: float):
+        self.checks = checks  # name -> (async check, critical)
+        self.cache_seconds = cache_seconds
+        self.timeout_seconds = timeout_seconds
+        self._result: Optional[dict] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+    
+    def _fresh(self) -> bool:
+        return self._result is not None and time.monotonic() - self._checked_at < self.cache_seconds
+    
+    async def result(self) -> dict:
+        if not self._fresh():
+            async with self._lock:
+                if not self._fresh():
+                    self._result = await self._run()
+                    self._checked_at = time.monotonic()
+        return {**self._result, "age_ms": round((time.monotonic() - self._checked_at) * 1000, 1)}
+    
+    async def _check(self, name: str) -> dict:
+        check, critical = self.checks[name]
+        started = time.perf_counter()
+        try:
+            detail = await asyncio.wait_for(check(), self.timeout_seconds)
+        except asyncio.TimeoutError:
+            detail = {"ok": False, "error": f"timed out after {self.timeout_seconds:g}s"}
+        except Exception as e:
+            detail = {"ok": False, "error": f"{type(e).__name__}: {e}"[:300]}
+        if not detail["ok"]:
+            logger.warning("Readiness check failed", extra={"check": name, "detail": detail})
+        return {**detail, "critical": critical, "latency_ms": round((time.perf_counter() - started) * 1000, 2)}
+    
+    async def _run(self) -> dict:
+        names = list(self.checks)
+        results = dict(zip(names, await asyncio.gather(*(self._check(name) for name in names))))
+        if any(not result["ok"] and result["critical"] for result in results.values()):
+            status = "not_ready"
+        elif any(not result["ok"] for result in results.values()):
+            status = "degraded"
+        else:
+            status = "ready"
+        return {"status": status, "pid": os.getpid(), "checks": results}
+
+
+readiness = ReadinessProbe(
+    {
+        "database": (check_database, True),
+        "pools": (check_pools, True),
+        "event_loop": (check_event_loop, True),
+        "s3": (check_s3, False),
+        "queues": (check_queues, False),
+    },
+    cache_seconds=settings.HEALTH_CACHE_SECONDS,
+    timeout_seconds=settings.HEALTH_PROBE_TIMEOUT_SECONDS
+)
@@ -2,14 +2,15 @@
 """
 S3 document storage service with presigned URLs.
 """
-import boto3
 import hashlib
+import logging
 import mimetypes
+import threading
 from typing import Optional, Tuple
-from botocore.exceptions import ClientError
 from config import get_settings
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 
 class S3StorageService:
@@ -18,14 +19,21 @@ class S3StorageService:
     """
     
     def __init__(self):
+        import boto3  # Heavy; only imported by workers that touch S3
+        
         self.s3_client = boto3.client(
             's3',
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_REGION
+            region_name=settings.AWS_REGION,
+            endpoint_url=settings.S3_ENDPOINT_URL
         )
         self.bucket_name = settings.S3_BUCKET_NAME
     
+    def ping(self):
+        """HeadBucket on the documents bucket; raises if S3 is unreachable or denies access."""
+        self.s3_client.head_bucket(Bucket=self.bucket_name)
+    
     def generate_upload_url(
         self,
         file_name: str,
@@ -65,7 +73,7 @@ class S3StorageService:
             
             return presigned_url, s3_key
             
-        except ClientError as e:
+        except self.s3_client.exceptions.ClientError as e:
             raise Exception(f"Failed to generate presigned URL: {str(e)}")
     
     def generate_download_url(
@@ -87,7 +95,7 @@ class S3StorageService:
             )
             return presigned_url
             
-        except ClientError as e:
+        except self.s3_client.exceptions.ClientError as e:
             raise Exception(f"Failed to generate download URL: {str(e)}")
     
     def delete_document(self, s3_key: str) -> bool:
@@ -100,8 +108,8 @@ class S3StorageService:
                 Key=s3_key
             )
             return True
-        except ClientError as e:
-            print(f"Error deleting document: {e}")
+        except self.s3_client.exceptions.ClientError as e:
+            logger.error("Error deleting document %s: %s", s3_key, e)
             return False
     
     def get_file_hash(self, s3_key: str) -> Optional[str]:
@@ -120,8 +128,8 @@ class S3StorageService:
             
             return hash_sha256.hexdigest()
             
-        except ClientError as e:
-            print(f"Error calculating hash: {e}")
+        except self.s3_client.exceptions.ClientError as e:
+            logger.error("Error calculating hash of %s: %s", s3_key, e)
             return None
     
     def _generate_s3_key(self, tenant_id: int, document_type: str, file_name: str) -> str:
@@ -139,9 +147,22 @@ class S3StorageService:
         return f"documents/{tenant_id}/{document_type}/{timestamp}_{unique_id}_{safe_filename}"
 
 
-# Singleton instance
-try:
-    s3_storage = S3StorageService()
-except Exception as e:
-    print(f"[WARN] S3StorageService initialization failed: {e}")
-    s3_storage = None
+# Singleton instance, created on first use
+_s3_storage: Optional[S3StorageService] = None
+_s3_storage_lock = threading.Lock()
+
+
+def get_s3_storage() -> Optional[S3StorageService]:
+    """
+    Shared S3StorageService, built on first call so boto3 stays out of worker
+    startup. Returns None (and retries next call) if initialization fails.
+    """
+    global _s3_storage
+    if _s3_storage is None:
+        with _s3_storage_lock:
+            if _s3_storage is None:
+                try:
+                    _s3_storage = S3StorageService()
+                except Exception as e:
+                    logger.warning("S3StorageService initialization failed: %s", e)
+    return _s3_storage
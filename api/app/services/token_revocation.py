@@ -0,0 +1,114 @@
+"""
+JWT revocation list.
+Revoked token ids (jti) are stored in revoked_tokens and mirrored in an
+in-memory map per worker, so get_current_user can reject revoked tokens with
+a dict lookup instead of a query. Each worker loads the live set at startup
+and then polls for rows revoked by other workers.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import get_settings
+from database import AsyncSessionLocal
+from models.revoked_token import RevokedToken
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Rows committed slightly out of revoked_at order (or stamped by a worker with
+# a skewed clock) are still picked up as long as they land within this window
+REFRESH_OVERLAP = timedelta(seconds=60)
+
+# jti -> expires_at (naive UTC) for every revoked, not yet expired token
+_revoked: dict[str, datetime] = {}
+_last_refresh: Optional[datetime] = None
+
+
+def is_token_revoked(jti: Optional[str]) -> bool:
+    """O(1) check; tokens issued without a jti cannot be revoked."""
+    return jti is not None and jti in _revoked
+
+
+def _remember(jti: str, expires_at: datetime):
+    if expires_at > datetime.utcnow():
+        _revoked[jti] = expires_at
+
+
+def _prune_expired():
+    now = datetime.utcnow()
+    for jti in [jti for jti, expires_at in _revoked.items() if expires_at <= now]:
+        _revoked.pop(jti, None)
+
+
+async def revoke_token(db: AsyncSession, payload: dict, reason: str = "logout") -> bool:
+    """
+    Revoke a decoded token. The caller commits the session.
+    Returns False for legacy tokens without a jti.
+    """
+    jti = payload.get("jti")
+    if not jti:
+        return False
+    
+    expires_at = datetime.utcfromtimestamp(payload["exp"])
+    await db.execute(
+        insert(RevokedToken)
+        .values(
+            jti=jti,
+            user_id=payload.get("sub") if isinstance(payload.get("sub"), int) else None,
+            token_type=payload.get("type"),
+            reason=reason,
+            expires_at=expires_at,
+            revoked_at=datetime.utcnow()
+        )
+        .on_conflict_do_nothing(index_elements=["jti"])
+    )
+    _remember(jti, expires_at)
+    return True
+
+
+async def refresh_revoked_tokens():
+    """Pull revocations made since the last refresh (full load on first call)."""
+    global _last_refresh
+    started = datetime.utcnow()
+    
+    query = select(RevokedToken.jti, RevokedToken.expires_at).where(RevokedToken.expires_at > started)
+    if _last_refresh is not None:
+        query = query.where(RevokedToken.revoked_at >= _last_refresh - REFRESH_OVERLAP)
+    
+    async with AsyncSessionLocal() as db:
+        for jti, expires_at in (await db.execute(query)).all():
+            _remember(jti, expires_at)
+    
+    _prune_expired()
+    _last_refresh = started
+
+
+async def purge_expired_revocations():
+    """Delete rows for tokens that have expired anyway."""
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(RevokedToken).where(RevokedToken.expires_at <= datetime.utcnow()))
+        await db.commit()
+
+
+async def revocation_refresh_loop():
+    """Background task: keep this worker's revocation map in sync."""
+    while True:
+        await asyncio.sleep(settings.TOKEN_REVOCATION_REFRESH_SECONDS)
+        try:
+            await refresh_revoked_tokens()
+        except Exception as e:
+            logger.warning("Token revocation refresh failed: %s", e)
+
+
+def revocation_stats() -> dict:
+    return {
+        "size": len(_revoked),
+        "last_refresh": _last_refresh.isoformat() if _last_refresh else None,
+        "refresh_seconds": settings.TOKEN_REVOCATION_REFRESH_SECONDS,
+    }
@@ -0,0 +1,50 @@
+"""
+Shared pytest setup. Run from api/app: python -m pytest tests
+"""
+import os
+import sys
+from contextlib import contextmanager
+
+import pytest
+
+# Modules import each other as top-level packages (config, core, services, ...)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeConnection:
+    """Records (statement, parameters) pairs instead of talking to Postgres."""
+    
+    def __init__(self, engine):
+        self.engine = engine
+    
+    def execute(self, statement, parameters=None):
+        if self.engine.fail:
+            raise RuntimeError("database unavailable")
+        self.engine.executed.append((statement, parameters))
+
+
+class FakeEngine:
+    """Stand-in for database.engine; set fail to make every statement raise."""
+    
+    def __init__(self):
+        self.executed = []
+        self.fail = False
+    
+    @contextmanager
+    def begin(self):
+        yield FakeConnection(self)
+    
+    def rows(self, table: str = None) -> list:
+        """Parameter rows of every executemany, optionally only those against table."""
+        rows = []
+        for statement, parameters in self.executed:
+            if table is not None and getattr(statement, "table", None) is not None and statement.table.name != table:
+                continue
+            if isinstance(parameters, list):
+                rows.extend(parameters)
+        return rows
+
+
+@pytest.fixture
+def fake_engine():
+    return FakeEngine()
@@ -0,0 +1,115 @@
+import gzip
+import json
+import os
+from contextlib import contextmanager
+from datetime import date, datetime
+
+import pytest
+
+import services.audit_archive as audit_archive
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+    
+    def mappings(self):
+        return iter(self.rows)
+    
+    def scalar(self):
+        return self.rows
+
+
+class _ArchiveConnection:
+    def __init__(self, engine):
+        self.engine = engine
+    
+    def execution_options(self, **options):
+        return self
+    
+    def execute(self, statement):
+        sql = str(statement)
+        self.engine.statements.append(sql)
+        if sql.startswith("SELECT *"):
+            return _Result(list(self.engine.rows))
+        if sql.startswith("SELECT count"):
+            return _Result(len(self.engine.rows))
+        return _Result(None)
+
+
+class _ArchiveEngine:
+    """One partition's rows; after_export runs between the export and the detach transaction."""
+    
+    def __init__(self, rows, after_export=None):
+        self.rows = rows
+        self.after_export = after_export
+        self.statements = []
+    
+    @contextmanager
+    def connect(self):
+        yield _ArchiveConnection(self)
+    
+    @contextmanager
+    def begin(self):
+        if self.after_export:
+            self.after_export(self)
+        yield _ArchiveConnection(self)
+
+
+def _row(row_id: int, created_at: str) -> dict:
+    return {"id": row_id, "tenant_id": 3, "action": "volunteer.created", "created_at": created_at}
+
+
+def test_archive_locks_partition_before_counting(tmp_path, monkeypatch):
+    engine = _ArchiveEngine([_row(1, "2024-03-02T10:00:00")])
+    monkeypatch.setattr(audit_archive, "engine", engine)
+    
+    path = audit_archive.archive_partition("audit_logs", date(2024, 3, 1), str(tmp_path))
+    
+    statements = [sql.split(" ")[0] for sql in engine.statements[1:]]
+    assert statements == ["LOCK", "SELECT", "ALTER", "DROP"]
+    assert 'LOCK TABLE "audit_logs_y2024m03" IN SHARE MODE' == engine.statements[1]
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        assert [json.loads(line)["id"] for line in f] == [1]
+
+
+def test_archive_aborts_when_rows_arrive_during_export(tmp_path, monkeypatch):
+    engine = _ArchiveEngine(
+        [_row(1, "2024-03-02T10:00:00")],
+        after_export=lambda engine: engine.rows.append(_row(2, "2024-03-31T23:59:59"))
+    )
+    monkeypatch.setattr(audit_archive, "engine", engine)
+    
+    with pytest.raises(RuntimeError, match="changed during export"):
+        audit_archive.archive_partition("audit_logs", date(2024, 3, 1), str(tmp_path))
+    
+    assert not any(sql.startswith(("ALTER", "DROP")) for sql in engine.statements)
+
+
+def _write_archive(archive_dir, month: date, rows: list):
+    path = audit_archive.archive_path("audit_logs", month, str(archive_dir))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row) + "\n")
+
+
+def test_search_includes_month_of_end_on_its_first_day(tmp_path):
+    _write_archive(tmp_path, date(2026, 2, 1), [_row(1, "2026-02-20T09:00:00")])
+    _write_archive(tmp_path, date(2026, 3, 1), [_row(2, "2026-03-01T06:00:00"), _row(3, "2026-03-01T18:00:00")])
+    
+    rows = audit_archive.search_archives(
+        "audit_logs", datetime(2026, 2, 15), datetime(2026, 3, 1, 12, 0), archive_dir=str(tmp_path)
+    )
+    
+    assert [row["id"] for row in rows] == [1, 2]
+
+
+def test_search_applies_filters(tmp_path):
+    _write_archive(tmp_path, date(2026, 3, 1), [_row(1, "2026-03-05T06:00:00"), {**_row(2, "2026-03-06T06:00:00"), "tenant_id": 4}])
+    
+    rows = audit_archive.search_archives(
+        "audit_logs", datetime(2026, 3, 1), datetime(2026, 4, 1), filters={"tenant_id": 4}, archive_dir=str(tmp_path)
+    )
+    
+    assert [row["id"] for row in rows] == [2]
@@ -0,0 +1,87 @@
+import json
+import os
+from datetime import datetime
+
+import services.audit as audit
+from core.spool import NdjsonSpool
+
+
+def _row(action: str) -> dict:
+    return {"user_id": 1, "tenant_id": 1, "action": action, "resource_type": "bh_patient", "created_at": datetime(2026, 3, 1, 12, 0)}
+
+
+def _writer(spool_dir) -> audit.AuditWriter:
+    return audit.AuditWriter(batch_size=2, flush_interval=0.1, max_queue_size=10, spool_dir=str(spool_dir))
+
+
+def test_replay_quarantines_truncated_line(tmp_path, fake_engine, monkeypatch):
+    monkeypatch.setattr(audit, "engine", fake_engine)
+    writer = _writer(tmp_path)
+    writer._spool([_row("bh_patient.created"), _row("bh_patient.updated")])
+    # A crash mid-append leaves half a line at the end of the file
+    with open(writer.spool.path, "a", encoding="utf-8") as f:
+        f.write('{"user_id": 1, "action": "bh_refer')
+    
+    writer.replay_spool()
+    
+    assert [row["action"] for row in fake_engine.rows()] == ["bh_patient.created", "bh_patient.updated"]
+    assert fake_engine.rows()[0]["created_at"] == datetime(2026, 3, 1, 12, 0)
+    assert writer.written == 2
+    assert writer.spool.corrupt == 1
+    assert sorted(os.listdir(tmp_path)) == [f"audit-{os.getpid()}.ndjson.corrupt"]
+    with open(tmp_path / f"audit-{os.getpid()}.ndjson.corrupt", encoding="utf-8") as f:
+        assert f.read().startswith('{"user_id": 1, "action": "bh_refer')
+
+
+def test_replay_quarantines_undecodable_timestamp(tmp_path, fake_engine, monkeypatch):
+    monkeypatch.setattr(audit, "engine", fake_engine)
+    writer = _writer(tmp_path)
+    with open(writer.spool.path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"action": "ok", "created_at": "2026-03-01T12:00:00"}) + "\n")
+        f.write(json.dumps({"action": "bad", "created_at": "not a date"}) + "\n")
+    
+    writer.replay_spool()
+    
+    assert [row["action"] for row in fake_engine.rows()] == ["ok"]
+    assert writer.spool.corrupt == 1
+
+
+def test_failed_replay_keeps_file_for_next_start(tmp_path, fake_engine, monkeypatch):
+    monkeypatch.setattr(audit, "engine", fake_engine)
+    writer = _writer(tmp_path)
+    writer._spool([_row("bh_referral.created")])
+    fake_engine.fail = True
+    
+    writer.replay_spool()
+    
+    assert os.listdir(tmp_path) == [f"audit-{os.getpid()}.ndjson"]
+    fake_engine.fail = False
+    writer.replay_spool()
+    assert [row["action"] for row in fake_engine.rows()] == ["bh_referral.created"]
+    assert os.listdir(tmp_path) == []
+
+
+def test_replay_skips_files_of_live_processes(tmp_path):
+    # pid 1 is always running; its spool may still be appended to
+    live = tmp_path / "audit-1.ndjson"
+    live.write_text(json.dumps({"action": "live"}) + "\n", encoding="utf-8")
+    stale = tmp_path / "audit-1.ndjson.replaying-1"
+    stale.write_text(json.dumps({"action": "live"}) + "\n", encoding="utf-8")
+    replayed = []
+    
+    assert NdjsonSpool(str(tmp_path), "audit").replay(replayed.extend) == 0
+    
+    assert replayed == []
+    assert live.exists() and stale.exists()
+
+
+def test_replay_reclaims_interrupted_replay_of_dead_process(tmp_path):
+    spool = NdjsonSpool(str(tmp_path), "audit")
+    orphan = tmp_path / f"audit-123.ndjson.replaying-{os.getpid()}"
+    orphan.write_text(json.dumps({"action": "orphan"}) + "\n", encoding="utf-8")
+    replayed = []
+    
+    assert spool.replay(replayed.extend) == 1
+    
+    assert replayed == [{"action": "orphan"}]
+    assert os.listdir(tmp_path) == []
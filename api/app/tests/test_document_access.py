@@ -0,0 +1,99 @@
+import os
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+
+import services.document_access as document_access
+from api.v1 import documents
+
+
+def _row(document_id: int, action: str = "download", accessed_at: datetime = datetime(2026, 3, 1, 12, 0)) -> dict:
+    return {
+        "document_id": document_id, "document_type": "volunteer_document", "user_id": 1, "volunteer_id": 2,
+        "action": action, "ip_address": None, "user_agent": None, "accessed_at": accessed_at, "metadata": None,
+    }
+
+
+def _aggregator(spool_dir, max_pending: int = 10) -> document_access.DocumentAccessAggregator:
+    return document_access.DocumentAccessAggregator(flush_interval=60, max_pending=max_pending, spool_dir=str(spool_dir))
+
+
+def _counter_updates(engine) -> dict:
+    return {params["document_id"]: (params["accesses"], params["accessed_at"]) for params in engine.rows("volunteer_documents")}
+
+
+def test_flush_coalesces_counters(tmp_path, fake_engine, monkeypatch):
+    monkeypatch.setattr(document_access, "engine", fake_engine)
+    aggregator = _aggregator(tmp_path)
+    aggregator.record(_row(7, "view"))
+    aggregator.record(_row(7, "download", datetime(2026, 3, 1, 13, 0)))
+    aggregator.record(_row(8, "sign"))
+    
+    aggregator.flush()
+    
+    assert len(fake_engine.rows("document_access_log")) == 3
+    assert _counter_updates(fake_engine) == {7: (2, datetime(2026, 3, 1, 13, 0))}
+    assert aggregator.as_dict()["pending_rows"] == 0
+
+
+def test_overflow_is_spooled_and_counted_on_replay(tmp_path, fake_engine, monkeypatch):
+    monkeypatch.setattr(document_access, "engine", fake_engine)
+    aggregator = _aggregator(tmp_path, max_pending=2)
+    for _ in range(5):
+        aggregator.record(_row(7))
+    
+    assert aggregator.as_dict()["pending_rows"] == 2
+    assert aggregator.spooled == 3
+    
+    aggregator.flush()
+    aggregator.replay_spool()
+    
+    assert len(fake_engine.rows("document_access_log")) == 5
+    assert sum(params["accesses"] for params in fake_engine.rows("volunteer_documents")) == 5
+    assert os.listdir(tmp_path) == []
+
+
+def test_failed_flush_spools_rows_instead_of_dropping(tmp_path, fake_engine, monkeypatch):
+    monkeypatch.setattr(document_access, "engine", fake_engine)
+    aggregator = _aggregator(tmp_path)
+    aggregator.record(_row(7))
+    fake_engine.fail = True
+    
+    aggregator.flush()
+    
+    assert aggregator.failures == 1
+    assert aggregator.spooled == 1
+    fake_engine.fail = False
+    aggregator.replay_spool()
+    assert [row["document_id"] for row in fake_engine.rows("document_access_log")] == [7]
+    assert _counter_updates(fake_engine) == {7: (1, datetime(2026, 3, 1, 12, 0))}
+
+
+class _FakeQuery:
+    def __init__(self, result):
+        self.result = result
+    
+    def filter(self, *criteria):
+        return self
+    
+    def first(self):
+        return self.result
+
+
+def test_download_endpoint_advances_counter_after_flush(tmp_path, fake_engine, monkeypatch):
+    monkeypatch.setattr(document_access, "engine", fake_engine)
+    aggregator = _aggregator(tmp_path)
+    aggregator._thread = threading.current_thread()  # Report running without a flush thread
+    monkeypatch.setattr(document_access, "document_access", aggregator)
+    storage = SimpleNamespace(generate_download_url=lambda key, expires_in: f"https://s3.example/{key}")
+    monkeypatch.setattr(documents, "get_s3_storage", lambda: storage)
+    document = SimpleNamespace(id=7, volunteer_id=2, file_url="s3://vvhs-documents/documents/1/license/a.pdf")
+    db = SimpleNamespace(query=lambda *entities: _FakeQuery(document))
+    user = SimpleNamespace(id=1, tenant_id=1, role="coordinator", email="c@example.org")
+    
+    response = documents.request_document_download(7, db=db, current_user=user)
+    
+    assert response.download_url == "https://s3.example/documents/1/license/a.pdf"
+    aggregator.flush()
+    assert [row["action"] for row in fake_engine.rows("document_access_log")] == ["download"]
+    assert list(_counter_updates(fake_engine)) == [7]
@@ -0,0 +1,69 @@
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import Column, MetaData, Table, create_engine, insert
+from sqlalchemy.orm import Session
+
+import models  # noqa: F401  Registers every mapper the event models relate to
+from api.v1 import events
+from models.event import Event, EventAssignment, Shift
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    # Same columns without foreign keys, whose targets are not all mapped
+    metadata = MetaData()
+    tables = {
+        table.name: Table(table.name, metadata, *[Column(column.name, column.type, primary_key=column.primary_key) for column in table.columns])
+        for table in (Event.__table__, Shift.__table__, EventAssignment.__table__)
+    }
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(tables["events"]), [
+            {
+                "id": event_id, "tenant_id": 1, "name": f"Clinic {event_id}", "start_date": datetime(2026, 3, event_id, 9, 0),
+                "activity_type": "non_emergency", "status": "published", "created_at": datetime(2026, 1, 1),
+                "visible_to_volunteers": True, "allow_self_signup": False
+            }
+            for event_id in (1, 2, 3)
+        ])
+        conn.execute(insert(tables["shifts"]), [{
+            "id": 1, "event_id": 1, "name": "Morning", "start_time": datetime(2026, 3, 1, 9), "end_time": datetime(2026, 3, 1, 12), "max_volunteers": 8
+        }])
+        conn.execute(insert(tables["event_assignments"]), [{"id": 1, "event_id": 1, "volunteer_id": 5, "status": "confirmed"}])
+    with Session(engine) as session:
+        yield session
+
+
+def _detailed(db, fields=None, limit=2):
+    response = events.list_events_detailed(
+        skip=0, limit=limit, cursor=None, count="exact", fields=fields, db=db,
+        current_user=SimpleNamespace(tenant_id=1)
+    )
+    return json.loads(response.body)
+
+
+def test_fields_without_computed_fields(db):
+    page = _detailed(db, fields="id,name")
+    
+    assert page["items"] == [{"id": 1, "name": "Clinic 1"}, {"id": 2, "name": "Clinic 2"}]
+    assert page["total"] == 3
+    assert page["next_cursor"]
+
+
+def test_fields_with_computed_fields(db):
+    page = _detailed(db, fields="registered_volunteers,max_volunteers")
+    
+    assert page["items"][0] == {"id": 1, "registered_volunteers": 1, "max_volunteers": 8}
+    assert page["items"][1] == {"id": 2, "registered_volunteers": 0, "max_volunteers": 50}
+
+
+def test_full_representation(db):
+    page = _detailed(db, limit=10)
+    
+    assert [item["title"] for item in page["items"]] == ["Clinic 1", "Clinic 2", "Clinic 3"]
+    assert page["items"][0]["registered_volunteers"] == 1
+    assert page["next_cursor"] is None
@@ -0,0 +1,140 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+import main
+import services.health as health
+
+
+class StubStorage:
+    """Local stand-in for S3StorageService: reachable, raising or hanging."""
+    
+    bucket_name = "vvhs-documents"
+    
+    def __init__(self, error: Exception = None, hang: threading.Event = None):
+        self.error = error
+        self.hang = hang
+        self.pings = 0
+    
+    def ping(self):
+        self.pings += 1
+        if self.hang is not None:
+            self.hang.wait(5)
+        if self.error is not None:
+            raise self.error
+
+
+def _ok(calls: list = None):
+    async def check():
+        if calls is not None:
+            calls.append(1)
+        return {"ok": True}
+    return check
+
+
+async def _failing():
+    raise ConnectionRefusedError("connection refused")
+
+
+def _probe(database=None, calls=None, cache_seconds=0.0, timeout_seconds=1.0) -> health.ReadinessProbe:
+    return health.ReadinessProbe(
+        {
+            "database": (database or _ok(calls), True),
+            "pools": (_ok(), True),
+            "event_loop": (_ok(), True),
+            "s3": (health.check_s3, False),
+        },
+        cache_seconds=cache_seconds,
+        timeout_seconds=timeout_seconds
+    )
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    monkeypatch.setattr(health, "_s3_ping", None)
+    stub = StubStorage()
+    monkeypatch.setattr(health, "get_s3_storage", lambda: stub)
+    return stub
+
+
+def _ready(probe, monkeypatch):
+    """Status code and body of /health/ready served by probe."""
+    monkeypatch.setattr(main, "readiness", probe)
+    response = asyncio.run(main.readiness_check())
+    return response.status_code, json.loads(response.body)
+
+
+def test_all_checks_pass(storage, monkeypatch):
+    status_code, body = _ready(_probe(), monkeypatch)
+    
+    assert status_code == 200
+    assert body["status"] == "ready"
+    assert body["checks"]["s3"] == {**body["checks"]["s3"], "ok": True, "bucket": "vvhs-documents", "critical": False}
+
+
+def test_s3_error_degrades_without_503(storage, monkeypatch):
+    storage.error = RuntimeError("AccessDenied")
+    
+    status_code, body = _ready(_probe(), monkeypatch)
+    
+    assert status_code == 200
+    assert body["status"] == "degraded"
+    assert body["checks"]["s3"]["ok"] is False
+    assert "AccessDenied" in body["checks"]["s3"]["error"]
+
+
+def test_missing_s3_client_degrades(monkeypatch):
+    monkeypatch.setattr(health, "_s3_ping", None)
+    monkeypatch.setattr(health, "get_s3_storage", lambda: None)
+    
+    status_code, body = _ready(_probe(), monkeypatch)
+    
+    assert (status_code, body["status"]) == (200, "degraded")
+
+
+def test_critical_failure_is_503(storage, monkeypatch):
+    status_code, body = _ready(_probe(database=_failing), monkeypatch)
+    
+    assert status_code == 503
+    assert body["status"] == "not_ready"
+    assert body["checks"]["database"]["critical"] is True
+    assert body["checks"]["database"]["error"].startswith("ConnectionRefusedError")
+
+
+def test_hung_s3_times_out_and_later_probes_share_the_ping(storage):
+    storage.hang = threading.Event()
+    probe = _probe(timeout_seconds=0.1)
+    
+    async def scenario():
+        try:
+            first = await probe.result()
+            second = await probe.result()  # cache_seconds=0: a fresh run
+            return first, second
+        finally:
+            storage.hang.set()
+    
+    first, second = asyncio.run(scenario())
+    
+    for result in (first, second):
+        assert result["status"] == "degraded"
+        assert result["checks"]["s3"]["error"] == "timed out after 0.1s"
+    assert storage.pings == 1  # The hung HeadBucket was not started again
+
+
+def test_result_is_cached_and_shared(storage):
+    calls = []
+    probe = _probe(calls=calls, cache_seconds=60)
+    
+    async def scenario():
+        concurrent = await asyncio.gather(probe.result(), probe.result())
+        cached = await probe.result()
+        return concurrent, cached
+    
+    concurrent, cached = asyncio.run(scenario())
+    
+    assert len(calls) == 1
+    assert storage.pings == 1
+    assert concurrent[0]["checks"] == concurrent[1]["checks"] == cached["checks"]
+    assert cached["age_ms"] >= 0
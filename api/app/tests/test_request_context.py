@@ -0,0 +1,43 @@
+import ipaddress
+
+from starlette.datastructures import Headers
+
+from core.request_context import _client_ip
+
+CADDY = ("172.16.0.0/12",)
+TRUSTED = tuple(ipaddress.ip_network(proxy) for proxy in CADDY)
+
+
+def _scope(peer: str, forwarded: str = None) -> dict:
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return {"type": "http", "client": (peer, 52000), "headers": headers}
+
+
+def _ip(peer: str, forwarded: str = None, trusted: tuple = TRUSTED):
+    scope = _scope(peer, forwarded)
+    return _client_ip(scope, Headers(scope=scope), trusted)
+
+
+def test_multi_hop_takes_rightmost_untrusted_hop():
+    # The client forged 6.6.6.6; Caddy appended the address it actually saw
+    assert _ip("172.18.0.2", "6.6.6.6, 203.0.113.9") == "203.0.113.9"
+
+
+def test_trusted_hops_are_skipped_from_the_right():
+    assert _ip("172.18.0.2", "6.6.6.6, 203.0.113.9, 172.18.0.5") == "203.0.113.9"
+
+
+def test_header_ignored_from_untrusted_peer():
+    assert _ip("198.51.100.7", "6.6.6.6") == "198.51.100.7"
+
+
+def test_header_ignored_without_trusted_proxies():
+    assert _ip("172.18.0.2", "6.6.6.6", trusted=()) == "172.18.0.2"
+
+
+def test_no_header_uses_peer():
+    assert _ip("172.18.0.2") == "172.18.0.2"
+
+
+def test_garbage_hop_is_not_trusted():
+    assert _ip("172.18.0.2", "6.6.6.6, not-an-ip") == "not-an-ip"
@@ -0,0 +1,20 @@
+-- api/db_init/08_revoked_tokens.sql
+-- JWT revocation list (logout / forced sign-out)
+-- Loaded into memory by each API worker at startup and refreshed incrementally
+
+CREATE TABLE revoked_tokens (
+    id SERIAL PRIMARY KEY,
+    jti VARCHAR(64) NOT NULL UNIQUE,
+    user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
+    token_type VARCHAR(20), -- access, refresh
+    reason VARCHAR(100), -- logout, admin, password_change
+    
+    expires_at TIMESTAMP NOT NULL,
+    revoked_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_revoked_tokens_user ON revoked_tokens(user_id);
+CREATE INDEX idx_revoked_tokens_expires ON revoked_tokens(expires_at);
+CREATE INDEX idx_revoked_tokens_revoked_at ON revoked_tokens(revoked_at);
+
+COMMENT ON TABLE revoked_tokens IS 'JWT ids (jti) revoked before expiry';
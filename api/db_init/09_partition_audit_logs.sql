@@ -0,0 +1,116 @@
+-- api/db_init/09_partition_audit_logs.sql
+-- Monthly range partitioning for audit_logs and document_access_log
+-- Also safe to run by hand on an existing database: rows are copied into the
+-- new partitioned tables in one transaction.
+-- Partitions are named <table>_yYYYYmMM. Future months are created by the
+-- deploy-time migrate step and by the retention job (services/audit_archive.py); the DEFAULT
+-- partition only catches rows outside every monthly range.
+
+BEGIN;
+
+-- ---------- audit_logs ----------
+ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned;
+ALTER TABLE audit_logs_unpartitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_unpartitioned_pkey;
+ALTER SEQUENCE audit_logs_id_seq OWNED BY NONE;
+
+CREATE TABLE audit_logs (
+    id INTEGER NOT NULL DEFAULT nextval('audit_logs_id_seq'),
+    user_id INTEGER NOT NULL REFERENCES users(id),
+    tenant_id INTEGER NOT NULL,
+    action VARCHAR(100) NOT NULL,
+    resource_type VARCHAR(50) NOT NULL,
+    resource_id INTEGER,
+    ip_address VARCHAR(45),
+    user_agent VARCHAR(255),
+    endpoint VARCHAR(255),
+    http_method VARCHAR(10),
+    old_values JSON,
+    new_values JSON,
+    description TEXT,
+    status VARCHAR(20),
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id;
+
+-- ---------- document_access_log ----------
+ALTER TABLE document_access_log RENAME TO document_access_log_unpartitioned;
+ALTER TABLE document_access_log_unpartitioned RENAME CONSTRAINT document_access_log_pkey TO document_access_log_unpartitioned_pkey;
+ALTER SEQUENCE document_access_log_id_seq OWNED BY NONE;
+
+CREATE TABLE document_access_log (
+    id BIGINT NOT NULL DEFAULT nextval('document_access_log_id_seq'),
+    
+    -- What was accessed
+    document_id INTEGER,
+    document_type VARCHAR(100), -- policy_document, volunteer_document
+    
+    -- Who accessed
+    user_id INTEGER REFERENCES users(id),
+    volunteer_id INTEGER REFERENCES volunteers(id),
+    
+    -- How accessed
+    action VARCHAR(50) NOT NULL, -- view, download, upload, delete, sign
+    ip_address VARCHAR(45),
+    user_agent TEXT,
+    
+    -- When (partition key)
+    accessed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    
+    -- Context
+    metadata JSONB,
+    
+    PRIMARY KEY (id, accessed_at)
+) PARTITION BY RANGE (accessed_at);
+
+ALTER SEQUENCE document_access_log_id_seq OWNED BY document_access_log.id;
+
+-- ---------- Partitions: every month with data, through three months ahead ----------
+DO $$
+DECLARE
+    parent TEXT;
+    key_column TEXT;
+    first_month DATE;
+    month DATE;
+BEGIN
+    FOR parent, key_column IN VALUES ('audit_logs', 'created_at'), ('document_access_log', 'accessed_at') LOOP
+        EXECUTE format('SELECT date_trunc(''month'', COALESCE(min(%I), now()))::date FROM %I', key_column, parent || '_unpartitioned')
+            INTO first_month;
+        FOR month IN SELECT generate_series(first_month, date_trunc('month', now())::date + 3 * interval '1 month', interval '1 month')::date LOOP
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                parent || '_' || to_char(month, '"y"YYYY"m"MM'), parent, month, (month + interval '1 month')::date
+            );
+        END LOOP;
+        EXECUTE format('CREATE TABLE IF NOT EXISTS %I PARTITION OF %I DEFAULT', parent || '_default', parent);
+    END LOOP;
+END $$;
+
+-- ---------- Copy existing rows ----------
+INSERT INTO audit_logs
+SELECT id, user_id, tenant_id, action, resource_type, resource_id, ip_address, user_agent,
+       endpoint, http_method, old_values, new_values, description, status, created_at
+FROM audit_logs_unpartitioned;
+
+INSERT INTO document_access_log
+SELECT id, document_id, document_type, user_id, volunteer_id, action, ip_address, user_agent,
+       COALESCE(accessed_at, CURRENT_TIMESTAMP), metadata
+FROM document_access_log_unpartitioned;
+
+DROP TABLE audit_logs_unpartitioned;
+DROP TABLE document_access_log_unpartitioned;
+
+-- ---------- Indexes (created on the parent, inherited by every partition) ----------
+CREATE INDEX idx_audit_logs_user_id ON audit_logs(user_id);
+CREATE INDEX idx_audit_logs_tenant_id ON audit_logs(tenant_id);
+CREATE INDEX idx_audit_logs_created_at ON audit_logs(created_at);
+CREATE INDEX idx_doc_access_log ON document_access_log(document_type, document_id, accessed_at);
+
+GRANT ALL PRIVILEGES ON audit_logs TO vvhs;
+GRANT ALL PRIVILEGES ON document_access_log TO vvhs;
+
+COMMIT;
+
+COMMENT ON TABLE audit_logs IS 'Audit trail, range-partitioned by month on created_at';
+COMMENT ON TABLE document_access_log IS 'Document access audit trail, range-partitioned by month on accessed_at';
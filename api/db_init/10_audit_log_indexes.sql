@@ -0,0 +1,15 @@
+-- api/db_init/10_audit_log_indexes.sql
+-- Composite indexes for the audit search API (/api/v1/audit)
+-- Each matches a filter plus the (created_at DESC, id DESC) keyset order, so a
+-- page is an index range scan no matter how deep the cursor is.
+-- Created on the partitioned parent, so every monthly partition inherits them.
+
+CREATE INDEX IF NOT EXISTS idx_audit_logs_tenant_created ON audit_logs(tenant_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_audit_logs_tenant_user_created ON audit_logs(tenant_id, user_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_audit_logs_tenant_action_created ON audit_logs(tenant_id, action, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_audit_logs_tenant_resource_created ON audit_logs(tenant_id, resource_type, resource_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_audit_logs_created ON audit_logs(created_at DESC, id DESC);
+
+-- Superseded by the composite indexes above
+DROP INDEX IF EXISTS idx_audit_logs_tenant_id;
+DROP INDEX IF EXISTS idx_audit_logs_created_at;
@@ -0,0 +1,9 @@
+-- api/db_init/11_list_pagination_indexes.sql
+-- Composite indexes for keyset-paginated list endpoints (core/pagination.py)
+-- Each matches the tenant filter plus the list's sort key, so a page after a
+-- cursor is an index range scan instead of an OFFSET walk over earlier rows.
+
+CREATE INDEX IF NOT EXISTS idx_volunteers_tenant_id_id ON volunteers(tenant_id, id);
+CREATE INDEX IF NOT EXISTS idx_users_tenant_id_id ON users(tenant_id, id);
+CREATE INDEX IF NOT EXISTS idx_events_tenant_id_id ON events(tenant_id, id);
+CREATE INDEX IF NOT EXISTS idx_time_entries_tenant_checkin ON time_entries(tenant_id, check_in_time DESC, id DESC);
@@ -0,0 +1,18 @@
+-- api/db_init/12_volunteer_search.sql
+-- Full-text and fuzzy name search for /api/v1/volunteers/search
+-- (mirrors Alembic revision 0002_volunteer_search).
+-- search_vector is a stored generated tsvector over name, occupation, license
+-- type, languages, skills and city; pg_trgm backs fuzzy "first last" matching.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE volunteers ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(first_name, '') || ' ' || coalesce(last_name, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(occupation, '') || ' ' || coalesce(license_type, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(languages, '') || ' ' || coalesce(skills, '') || ' ' || coalesce(professional_skills, '')), 'C') ||
+        setweight(to_tsvector('english', coalesce(city, '')), 'D')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_volunteers_search_vector ON volunteers USING gin (search_vector);
+CREATE INDEX IF NOT EXISTS idx_volunteers_search_name_trgm ON volunteers USING gin ((first_name || ' ' || last_name) gin_trgm_ops);